@@ -0,0 +1,201 @@
+import io
+import os
+import sys
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import uvicorn
+from fastapi import FastAPI, File, HTTPException, Request, UploadFile
+from fastapi.responses import RedirectResponse, Response
+from pydantic import create_model
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+from networksecurity.constants.constant import (
+    SCHEMA_FILE_PATH,
+    TARGET_COLUMN,
+    FINAL_MODEL_DIR,
+    MODEL_FILE_NAME,
+    COMPILED_MODEL_FILE_NAME,
+    SERVING_USE_COMPILED_MODEL,
+    PREPROCESSING_OBJECT_FILE_NAME,
+    PREDICTION_COLUMN_NAME,
+    SERVING_HOST,
+    SERVING_PORT,
+    SERVING_MAX_BATCH_SIZE,
+    SERVING_MAX_WAIT_MS,
+    SERVING_CACHE_SIZE,
+    SERVING_CACHE_POLICY,
+)
+from networksecurity.utils.common import read_yaml_file, get_schema_dtypes
+from networksecurity.utils.model.estimator import load_network_model, get_model_version
+from networksecurity.utils.model.micro_batcher import MicroBatcher
+from networksecurity.utils.model.prediction_cache import PredictionCache, CachedNetworkModel
+from networksecurity.utils.ternary import unpack_rows
+
+FEATURE_COLUMNS = [
+    column for column in get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH)) if column != TARGET_COLUMN
+]
+
+# Request body of /predict: one optional int per feature, missing features are imputed
+NetworkFeatures = create_model(
+    "NetworkFeatures", **{column: (Optional[int], None) for column in FEATURE_COLUMNS}
+)
+
+
+def to_feature_rows(records: list) -> np.ndarray:
+    # The explicit shape keeps an empty request (n_rows, n_features) instead of (0,)
+    return np.array(
+        [[np.nan if record.get(column) is None else record[column] for column in FEATURE_COLUMNS] for record in records],
+        dtype=np.float64,
+    ).reshape(len(records), len(FEATURE_COLUMNS))
+
+
+def from_packed_body(body: bytes) -> np.ndarray:
+    """Feature rows from a /predict/packed body: one little-endian uint64 per row."""
+    if len(body) % 8:
+        raise ValueError(f"Packed body length {len(body)} is not a multiple of 8 bytes")
+    return unpack_rows(np.frombuffer(body, dtype="<u8"), len(FEATURE_COLUMNS))
+
+
+def create_app(
+    model_dir: str = FINAL_MODEL_DIR,
+    max_batch_size: int = SERVING_MAX_BATCH_SIZE,
+    max_wait_ms: float = SERVING_MAX_WAIT_MS,
+    use_compiled_model: bool = SERVING_USE_COMPILED_MODEL,
+    cache_size: int = SERVING_CACHE_SIZE,
+    cache_policy: str = SERVING_CACHE_POLICY,
+) -> FastAPI:
+    model_paths = (
+        os.path.join(model_dir, PREPROCESSING_OBJECT_FILE_NAME),
+        os.path.join(model_dir, MODEL_FILE_NAME),
+        os.path.join(model_dir, COMPILED_MODEL_FILE_NAME) if use_compiled_model else None,
+    )
+
+    def load_model():
+        network_model = load_network_model(*model_paths)
+        if cache_size <= 0:
+            return network_model
+        return CachedNetworkModel(
+            network_model, PredictionCache(cache_size, cache_policy), get_model_version(*model_paths)
+        )
+
+    def reload_model() -> str:
+        model_version = get_model_version(*model_paths)
+        if cache_size <= 0:
+            app.state.network_model = load_network_model(*model_paths)
+        elif model_version != app.state.network_model.cache.model_version:
+            app.state.network_model.set_model(load_network_model(*model_paths), model_version)
+        return model_version
+
+    def predict_rows(features: np.ndarray) -> np.ndarray:
+        # Estimators reject zero rows and the prediction cache does not, so an empty
+        # request gets its empty answer here, the same with and without the cache
+        if len(features) == 0:
+            return np.empty(0, dtype=np.int8)
+        return app.state.network_model.predict(features)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Load the artifacts once per server process, not per request
+        app.state.network_model = load_model()
+        app.state.batcher = MicroBatcher(predict_rows, max_batch_size, max_wait_ms / 1000)
+        await app.state.batcher.start()
+        logging.info(
+            f"Prediction service ready (max_batch_size={max_batch_size}, max_wait_ms={max_wait_ms}, "
+            f"cache_size={cache_size})"
+        )
+        yield
+        await app.state.batcher.stop()
+
+    app = FastAPI(title="Network Security Prediction Service", lifespan=lifespan)
+
+    @app.get("/", include_in_schema=False)
+    async def index():
+        return RedirectResponse(url="/docs")
+
+    @app.post("/predict")
+    async def predict(features: NetworkFeatures):
+        """Single row; concurrent requests are micro-batched into one model call."""
+        try:
+            prediction = await app.state.batcher.submit(to_feature_rows([features.model_dump()]))
+            return {PREDICTION_COLUMN_NAME: prediction.item()}
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    @app.post("/predict/batch")
+    async def predict_batch(rows: List[NetworkFeatures]):
+        """Many rows in one request, scored in a single vectorized call."""
+        try:
+            features = to_feature_rows([row.model_dump() for row in rows])
+            predictions = await app.state.batcher.predict_many(features)
+            return {PREDICTION_COLUMN_NAME: predictions.tolist()}
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    @app.post("/predict/file")
+    async def predict_file(file: UploadFile = File(...)):
+        """CSV upload; returns the rows with the prediction column added."""
+        try:
+            # ParserError, EmptyDataError and UnicodeDecodeError are all ValueErrors
+            dataframe = pd.read_csv(io.BytesIO(await file.read()))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Upload is not a readable CSV file: {e}")
+        try:
+            features = dataframe.reindex(columns=FEATURE_COLUMNS).to_numpy(dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise HTTPException(status_code=422, detail=f"Feature columns must be numeric: {e}")
+        try:
+            dataframe[PREDICTION_COLUMN_NAME] = await app.state.batcher.predict_many(features)
+            # Empty cells go out as null; NaN is not valid JSON
+            return dataframe.astype(object).where(dataframe.notna(), None).to_dict(orient="records")
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    @app.post("/predict/packed")
+    async def predict_packed(request: Request):
+        """
+        Binary batch: the body holds one little-endian uint64 per row, 2 bits per
+        feature in FEATURE_COLUMNS order (value + 1, 3 = missing). Returns one
+        int8 prediction per row.
+        """
+        try:
+            features = from_packed_body(await request.body())
+        except ValueError as e:
+            # A malformed body is the client's error, not a server failure
+            raise HTTPException(status_code=400, detail=str(e))
+        try:
+            predictions = await app.state.batcher.predict_many(features)
+            return Response(
+                content=np.asarray(predictions, dtype=np.int8).tobytes(), media_type="application/octet-stream"
+            )
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    @app.post("/model/reload")
+    async def model_reload():
+        """Reloads model_dir; cached predictions are dropped if the model files changed."""
+        try:
+            # On the predict thread, so no batch sees a half-swapped model
+            model_version = await app.state.batcher.run_exclusive(reload_model)
+            return {"model_version": model_version}
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    @app.get("/cache/stats")
+    async def cache_stats():
+        """Prediction cache counters (size, hits, misses, hit rate, evictions)."""
+        if cache_size <= 0:
+            return {"enabled": False}
+        return {"enabled": True, **app.state.network_model.cache.stats()}
+
+    return app
+
+
+app = create_app()
+
+
+if __name__ == "__main__":
+    uvicorn.run(app, host=SERVING_HOST, port=SERVING_PORT)
@@ -0,0 +1,68 @@
+"""
+Benchmark of the tabular artifact formats (CSV vs parquet vs packed npz) used by the pipeline stages.
+
+Usage:
+    python benchmarks/bench_artifact_format.py --rows 1000000
+"""
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+from networksecurity.constants.constant import SCHEMA_FILE_PATH
+from networksecurity.utils.common import (
+    read_yaml_file,
+    get_schema_dtypes,
+)
+from networksecurity.utils.columnar import save_dataframe, load_dataframe
+
+
+def build_dataframe(source_file: str, rows: int) -> pd.DataFrame:
+    """Resamples the source file up (or down) to the requested number of rows."""
+    dtypes = get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH))
+    source = pd.read_csv(source_file).astype(dtypes)
+    index = np.random.default_rng(42).integers(0, len(source), size=rows)
+    return source.iloc[index].reset_index(drop=True)
+
+
+def bench_format(dataframe: pd.DataFrame, file_format: str, work_dir: str, dtypes: dict) -> dict:
+    file_path = os.path.join(work_dir, f"bench.{file_format}")
+
+    start_time = time.perf_counter()
+    save_dataframe(file_path, dataframe)
+    write_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    loaded = load_dataframe(file_path, dtypes)
+    read_seconds = time.perf_counter() - start_time
+
+    return {
+        "format": file_format,
+        "write_s": round(write_seconds, 4),
+        "read_s": round(read_seconds, 4),
+        "size_mb": round(os.path.getsize(file_path) / 2**20, 3),
+        "in_memory_mb": round(loaded.memory_usage(deep=True).sum() / 2**20, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=os.path.join("data", "phisingData.csv"))
+    parser.add_argument("--rows", type=int, default=None, help="defaults to the source size")
+    args = parser.parse_args()
+
+    dtypes = get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH))
+    rows = args.rows or len(pd.read_csv(args.source))
+    dataframe = build_dataframe(args.source, rows)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        results = [bench_format(dataframe, file_format, work_dir, dtypes) for file_format in ("csv", "parquet", "npz")]
+
+    print(f"rows={rows}")
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark of the compiled array-backed models (utils/model/compiled.py) vs the pickled
+sklearn estimators they were compiled from. Every model zoo family compile_model supports is
+fitted on the source data, compiled, checked for identical predictions and timed at several
+batch sizes (median latency per predict call and the resulting rows/sec).
+
+Usage:
+    python benchmarks/bench_compiled_model.py --batch-sizes 1 16 256 4096 65536
+"""
+import os
+import time
+import pickle
+import argparse
+import numpy as np
+import pandas as pd
+
+from networksecurity.constants.constant import TARGET_COLUMN
+from networksecurity.components.model_trainer import ModelTrainer
+from networksecurity.utils.model.compiled import compile_model
+
+
+def median_seconds(func, X, min_seconds: float = 0.2, max_calls: int = 200) -> float:
+    timings = []
+    start_time = time.perf_counter()
+    while len(timings) < max_calls and (len(timings) < 3 or time.perf_counter() - start_time < min_seconds):
+        call_start = time.perf_counter()
+        func(X)
+        timings.append(time.perf_counter() - call_start)
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=os.path.join("data", "phisingData.csv"))
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 256, 4096, 65536])
+    parser.add_argument("--models", nargs="+", default=None, help="model zoo names (default: all)")
+    args = parser.parse_args()
+
+    data = pd.read_csv(args.source)
+    X = data.drop(columns=[TARGET_COLUMN]).to_numpy(dtype=np.float64)
+    y = data[TARGET_COLUMN].replace(-1, 0).to_numpy()
+    rng = np.random.default_rng(42)
+    X_bench = X[rng.integers(0, len(X), size=max(args.batch_sizes))]
+
+    models, _ = ModelTrainer.get_model_zoo()
+    results = []
+    for name in args.models or models:
+        model = models[name].fit(X, y)
+        try:
+            compiled = compile_model(model)
+        except ValueError as e:
+            if args.models:
+                raise
+            print(f"{name}: skipped, {e}")
+            continue
+        exact = bool(np.array_equal(model.predict(X_bench), compiled.predict(X_bench)))
+
+        for batch_size in args.batch_sizes:
+            batch = X_bench[:batch_size]
+            sklearn_seconds = median_seconds(model.predict, batch)
+            compiled_seconds = median_seconds(compiled.predict, batch)
+            results.append(
+                {
+                    "model": name,
+                    "batch_size": batch_size,
+                    "sklearn_ms": round(sklearn_seconds * 1000, 3),
+                    "compiled_ms": round(compiled_seconds * 1000, 3),
+                    "sklearn_rows_per_sec": round(batch_size / sklearn_seconds),
+                    "compiled_rows_per_sec": round(batch_size / compiled_seconds),
+                    "speedup": round(sklearn_seconds / compiled_seconds, 1),
+                    "exact": exact,
+                }
+            )
+
+        print(
+            f"{name}: pickle {len(pickle.dumps(model)) / 1024:.1f} KB, "
+            f"compiled {sum(array.nbytes for array in compiled.arrays.values()) / 1024:.1f} KB, exact={exact}"
+        )
+
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
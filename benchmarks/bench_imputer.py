@@ -0,0 +1,80 @@
+"""
+Benchmark of the preprocessing imputers: sklearn KNNImputer vs the TernaryImputer strategies.
+Reports fit time, transform latency (clean batch, batch with missing cells, single row),
+pickled artifact size and the share of masked cells imputed back to their true value.
+
+Usage:
+    python benchmarks/bench_imputer.py --rows 100000 --missing-rate 0.05
+"""
+import os
+import time
+import pickle
+import argparse
+import numpy as np
+import pandas as pd
+from sklearn.impute import KNNImputer
+
+from networksecurity.constants.constant import TARGET_COLUMN
+from networksecurity.utils.model.imputer import TernaryImputer, IMPUTER_STRATEGIES
+
+
+def build_arrays(source_file: str, rows: int, missing_rate: float):
+    """Resamples the source features to `rows` training rows plus a masked test batch."""
+    features = pd.read_csv(source_file).drop(columns=[TARGET_COLUMN]).to_numpy(dtype=np.float64)
+    rng = np.random.default_rng(42)
+    X_train = features[rng.integers(0, len(features), size=rows)]
+    X_test = features[rng.integers(0, len(features), size=max(rows // 10, 1))]
+    mask = rng.random(X_test.shape) < missing_rate
+    return X_train, X_test, np.where(mask, np.nan, X_test), mask
+
+
+def timed(func, *args):
+    start_time = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start_time
+
+
+def bench_imputer(name, imputer, X_train, X_test, X_missing, mask) -> dict:
+    _, fit_seconds = timed(imputer.fit, X_train)
+    imputed, missing_seconds = timed(imputer.transform, X_missing)
+    _, clean_seconds = timed(imputer.transform, X_test)
+    row = np.flatnonzero(mask.any(axis=1))[:1]
+    _, single_row_seconds = timed(imputer.transform, X_missing[row])
+
+    return {
+        "imputer": name,
+        "fit_s": round(fit_seconds, 4),
+        "transform_missing_s": round(missing_seconds, 4),
+        "transform_clean_s": round(clean_seconds, 5),
+        "single_row_ms": round(single_row_seconds * 1000, 3),
+        "size_kb": round(len(pickle.dumps(imputer)) / 1024, 1),
+        "accuracy": round(float(np.mean(np.round(imputed[mask]) == X_test[mask])), 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=os.path.join("data", "phisingData.csv"))
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--missing-rate", type=float, default=0.05)
+    parser.add_argument("--n-neighbors", type=int, default=3)
+    parser.add_argument("--skip-sklearn", action="store_true", help="KNNImputer is quadratic in --rows")
+    args = parser.parse_args()
+
+    X_train, X_test, X_missing, mask = build_arrays(args.source, args.rows, args.missing_rate)
+
+    imputers = {} if args.skip_sklearn else {"sklearn_knn": KNNImputer(n_neighbors=args.n_neighbors)}
+    for strategy in IMPUTER_STRATEGIES:
+        imputers[strategy] = TernaryImputer(strategy=strategy, n_neighbors=args.n_neighbors)
+
+    results = [
+        bench_imputer(name, imputer, X_train, X_test, X_missing, mask)
+        for name, imputer in imputers.items()
+    ]
+
+    print(f"train_rows={len(X_train)} test_rows={len(X_test)} missing_cells={int(mask.sum())}")
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark of model artifact loading: plain pickle vs the model bundle format
+(utils/bundle.py) that save_object/load_object use. Each variant is loaded in a fresh
+interpreter, as a server or batch worker would at startup, and reports the load time
+(after imports) and the process memory: RssAnon is private to the process, RssFile
+is memory-mapped file pages shared by every process that maps the same file.
+
+Usage:
+    python benchmarks/bench_model_loading.py --model-dir final_model --repeat 5
+"""
+import os
+import sys
+import json
+import pickle
+import argparse
+import tempfile
+import subprocess
+import pandas as pd
+
+from networksecurity.constants.constant import (
+    FINAL_MODEL_DIR,
+    MODEL_FILE_NAME,
+    COMPILED_MODEL_FILE_NAME,
+    PREPROCESSING_OBJECT_FILE_NAME,
+)
+from networksecurity.utils.common import load_object, save_object
+from networksecurity.utils.model.compiled import load_compiled_model
+
+# Runs in the child interpreter: imports first, then times the load alone
+CHILD_SCRIPT = """
+import sys, json, time, pickle
+import numpy as np, sklearn.ensemble, sklearn.pipeline
+from networksecurity.utils.common import load_object
+import networksecurity.utils.model.imputer
+
+def memory_kb():
+    with open("/proc/self/status") as status:
+        fields = dict(line.split(":", 1) for line in status)
+    return {name: int(fields[name].split()[0]) for name in ("RssAnon", "RssFile")}
+
+file_format, paths = sys.argv[1], sys.argv[2:]
+before = memory_kb()
+start_time = time.perf_counter()
+if file_format == "pickle":
+    objects = [pickle.load(open(path, "rb")) for path in paths]
+else:
+    objects = [load_object(path) for path in paths]
+seconds = time.perf_counter() - start_time
+after = memory_kb()
+print(json.dumps({"load_ms": seconds * 1000, **{name: after[name] - before[name] for name in after}}))
+"""
+
+
+def run_child(file_format: str, paths: list) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, file_format, *paths],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-dir", default=FINAL_MODEL_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    objects = {
+        "preprocessor": load_object(os.path.join(args.model_dir, PREPROCESSING_OBJECT_FILE_NAME)),
+        "model": load_object(os.path.join(args.model_dir, MODEL_FILE_NAME)),
+    }
+    compiled_model_file_path = os.path.join(args.model_dir, COMPILED_MODEL_FILE_NAME)
+    if os.path.exists(compiled_model_file_path):
+        objects["compiled"] = load_compiled_model(compiled_model_file_path)
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        paths = {}
+        for name, obj in objects.items():
+            paths[name, "pickle"] = os.path.join(work_dir, f"{name}.pkl")
+            with open(paths[name, "pickle"], "wb") as file_obj:
+                pickle.dump(obj, file_obj, protocol=pickle.HIGHEST_PROTOCOL)
+            paths[name, "bundle"] = os.path.join(work_dir, f"{name}.bundle")
+            save_object(paths[name, "bundle"], obj)
+
+        for name in objects:
+            for file_format in ("pickle", "bundle"):
+                runs = pd.DataFrame([run_child(file_format, [paths[name, file_format]]) for _ in range(args.repeat)])
+                results.append(
+                    {
+                        "object": name,
+                        "format": file_format,
+                        "size_kb": round(os.path.getsize(paths[name, file_format]) / 1024),
+                        "load_ms": round(runs["load_ms"].median(), 2),
+                        "rss_anon_kb": int(runs["RssAnon"].median()),
+                        "rss_file_kb": int(runs["RssFile"].median()),
+                    }
+                )
+
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Time-to-best-model of the hyperparameter search strategies used by ModelTrainer.
+
+Runs the trainer's model zoo through evaluate_models with each strategy on
+data/phisingData.csv and on a larger synthetic resample of it.
+
+Usage:
+    python benchmarks/bench_model_search.py --synthetic-rows 200000 --budget 600
+"""
+import os
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from networksecurity.constants.constant import TARGET_COLUMN, MODEL_TRAINER_RANDOM_STATE
+from networksecurity.components.model_trainer import ModelTrainer
+from networksecurity.utils.common import evaluate_models
+
+STRATEGIES = [
+    ("grid", {}),
+    ("random", {"n_iter": 10}),
+    ("halving", {"resource": "n_samples"}),
+    ("halving", {"resource": "n_estimators"}),
+]
+
+
+def load_arrays(source_file: str, rows: int = None, flip_rate: float = 0.02):
+    """Returns X, y; with rows set, resamples the source and flips a few feature values."""
+    dataframe = pd.read_csv(source_file)
+    X = dataframe.drop(columns=[TARGET_COLUMN]).to_numpy(dtype=np.float64)
+    y = (dataframe[TARGET_COLUMN].to_numpy() == 1).astype(np.float64)
+
+    if rows is not None:
+        rng = np.random.default_rng(MODEL_TRAINER_RANDOM_STATE)
+        index = rng.integers(0, len(y), size=rows)
+        X, y = X[index], y[index]
+        flip = rng.random(X.shape) < flip_rate
+        X[flip] = rng.choice([-1.0, 0.0, 1.0], size=int(flip.sum()))
+
+    return X, y
+
+
+def bench(X, y, budget_seconds: float) -> list:
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=MODEL_TRAINER_RANDOM_STATE
+    )
+    models, params = ModelTrainer.get_model_zoo()
+
+    results = []
+    for strategy, kwargs in STRATEGIES:
+        candidate_models = {name: model for name, model in models.items()}
+        start_time = time.perf_counter()
+        report, timing_report = evaluate_models(
+            X_train, y_train, X_test, y_test, candidate_models, params,
+            search_strategy=strategy, budget_seconds=budget_seconds,
+            random_state=MODEL_TRAINER_RANDOM_STATE, **kwargs,
+        )
+        elapsed = time.perf_counter() - start_time
+        best_name = max(report, key=report.get)
+        results.append({
+            "strategy": strategy + (f"[{kwargs['resource']}]" if "resource" in kwargs else ""),
+            "seconds": round(elapsed, 2),
+            "fits": sum(timing["fits"] for timing in timing_report.values()),
+            "best_model": best_name,
+            "test_r2": round(report[best_name], 4),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=os.path.join("data", "phisingData.csv"))
+    parser.add_argument("--synthetic-rows", type=int, default=100000)
+    parser.add_argument("--budget", type=float, default=None, help="search budget in seconds")
+    args = parser.parse_args()
+
+    for label, rows in (("source", None), ("synthetic", args.synthetic_rows)):
+        X, y = load_arrays(args.source, rows)
+        print(f"\n{label}: {len(y)} rows")
+        print(pd.DataFrame(bench(X, y, args.budget)).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
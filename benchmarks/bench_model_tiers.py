@@ -0,0 +1,111 @@
+"""
+Accuracy and time of the fast model tier (histogram gradient boosting with early
+stopping and categorical ternary features, plus the cheap families) vs the full
+model zoo. Each family is searched on its own through evaluate_models, so the
+seconds are per family; the tier rows run the whole tier in one search, as
+ModelTrainer does, under the tier's budget.
+
+The synthetic rows come from a SyntheticDataModel fitted on the source file.
+
+Usage:
+    python benchmarks/bench_model_tiers.py --synthetic-rows 200000 --strategy halving
+"""
+import os
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from networksecurity.constants.constant import (
+    SCHEMA_FILE_PATH,
+    TARGET_COLUMN,
+    MODEL_TRAINER_RANDOM_STATE,
+    MODEL_TRAINER_FAST_TIER_MODELS,
+    MODEL_TRAINER_FAST_TIER_BUDGET_SECONDS,
+)
+from networksecurity.components.model_trainer import ModelTrainer
+from networksecurity.utils.common import evaluate_models, read_yaml_file, get_schema_dtypes
+from networksecurity.utils.columnar import load_dataframe
+from networksecurity.utils.synthetic import SyntheticDataModel
+
+
+def load_arrays(source_file: str, rows: int = None):
+    """X, y of the source file, or of rows synthetic rows fitted on it. Labels are 0/1."""
+    dtypes = get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH))
+    dataframe = load_dataframe(source_file, dtypes)
+    if rows is not None:
+        model = SyntheticDataModel(dtypes, TARGET_COLUMN).fit(dataframe)
+        dataframe = model.sample(rows, random_state=MODEL_TRAINER_RANDOM_STATE)
+    X = dataframe.drop(columns=[TARGET_COLUMN]).to_numpy(dtype=np.float64)
+    y = (dataframe[TARGET_COLUMN].to_numpy() == 1).astype(np.float64)
+    return X, y
+
+
+def run_search(models: dict, params: dict, arrays, strategy: str, budget_seconds: float) -> list:
+    X_train, X_test, y_train, y_test = arrays
+    start_time = time.perf_counter()
+    report, timing_report = evaluate_models(
+        X_train, y_train, X_test, y_test, models, params,
+        search_strategy=strategy, budget_seconds=budget_seconds, random_state=MODEL_TRAINER_RANDOM_STATE,
+    )
+    elapsed = time.perf_counter() - start_time
+
+    results = []
+    for name, test_r2 in report.items():
+        predict_start = time.perf_counter()
+        accuracy = float((models[name].predict(X_test) == y_test).mean())
+        predict_seconds = time.perf_counter() - predict_start
+        timing = timing_report[name]
+        results.append({
+            "model": name,
+            "seconds": round(elapsed, 2),
+            "search_wall_seconds": timing["search_wall_seconds"],
+            "search_fit_seconds": timing["search_fit_seconds"],
+            "refit_seconds": timing["refit_seconds"],
+            "fits": timing["fits"],
+            "test_accuracy": round(accuracy, 4),
+            "test_r2": round(test_r2, 4),
+            "predict_rows_per_sec": round(len(X_test) / max(predict_seconds, 1e-9)),
+        })
+    return results
+
+
+def bench(X, y, strategy: str, budget_seconds: float) -> pd.DataFrame:
+    arrays = train_test_split(X, y, test_size=0.2, random_state=MODEL_TRAINER_RANDOM_STATE)
+    models, params = ModelTrainer.get_model_zoo()
+
+    rows = []
+    for name in models:
+        for result in run_search({name: models[name]}, {name: params[name]}, arrays, strategy, budget_seconds):
+            rows.append({"tier": "fast" if name in MODEL_TRAINER_FAST_TIER_MODELS else "full", **result})
+
+    # Whole tiers, best family only; "seconds" is the time to a trained model
+    for tier, tier_budget in (("fast", MODEL_TRAINER_FAST_TIER_BUDGET_SECONDS), ("full", budget_seconds)):
+        tier_models, tier_params = ModelTrainer.get_model_zoo(tier=tier)
+        results = run_search(tier_models, tier_params, arrays, strategy, tier_budget)
+        if not results:
+            rows.append({"tier": tier, "model": "[tier] none finished", "seconds": tier_budget})
+            continue
+        best = max(results, key=lambda result: result["test_r2"])
+        rows.append({"tier": tier, **best, "model": f"[tier] {best['model']}"})
+
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=os.path.join("data", "phisingData.csv"))
+    parser.add_argument("--synthetic-rows", type=int, default=100000)
+    parser.add_argument("--strategy", default="grid", choices=["grid", "random", "halving"])
+    parser.add_argument("--budget", type=float, default=None, help="search budget in seconds of the full tier")
+    args = parser.parse_args()
+
+    for label, rows in (("source", None), ("synthetic", args.synthetic_rows)):
+        X, y = load_arrays(args.source, rows)
+        print(f"\n{label}: {len(y)} rows, strategy={args.strategy}")
+        print(bench(X, y, args.strategy, args.budget).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
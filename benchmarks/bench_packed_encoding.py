@@ -0,0 +1,105 @@
+"""
+Benchmark of the bit-packed ternary encoding (utils/ternary.py): 2 bits per feature in
+one uint64 per row plus an int8 label. Compares memory, disk and wire sizes against the
+float64 arrays, the CSV source and JSON request bodies, and times pack/unpack.
+
+Usage:
+    python benchmarks/bench_packed_encoding.py --rows 1000000
+"""
+import os
+import json
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+from networksecurity.constants.constant import TARGET_COLUMN
+from networksecurity.utils.common import save_numpy_array_data, load_numpy_array_data
+from networksecurity.utils.ternary import pack_rows, unpack_rows
+
+
+def save_packed_array(file_path: str, array: np.ndarray) -> None:
+    """Stores a (features..., label) array as uint64 feature rows and int8 labels."""
+    keys, packable = pack_rows(array[:, :-1])
+    assert packable.all(), "the benchmark rows must be ternary"
+    np.savez(file_path, features=keys, labels=array[:, -1].astype(np.int8), n_features=array.shape[1] - 1)
+
+
+def load_packed_array(file_path: str) -> np.ndarray:
+    """Inverse of save_packed_array: the float64 (features..., label) array."""
+    with np.load(file_path, allow_pickle=False) as packed:
+        n_features = int(packed["n_features"])
+        array = np.empty((len(packed["labels"]), n_features + 1))
+        array[:, :-1] = unpack_rows(packed["features"], n_features)
+        array[:, -1] = packed["labels"]
+    return array
+
+
+def best_seconds(func, *args, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+def size_row(what: str, baseline: str, baseline_bytes: int, packed_bytes: int) -> dict:
+    return {
+        "what": what,
+        "baseline": baseline,
+        "baseline_kb": round(baseline_bytes / 1024, 1),
+        "packed_kb": round(packed_bytes / 1024, 1),
+        "ratio": round(baseline_bytes / packed_bytes, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=os.path.join("data", "phisingData.csv"))
+    parser.add_argument("--rows", type=int, default=None, help="defaults to the source size")
+    parser.add_argument("--request-rows", type=int, default=64, help="rows per API request body")
+    args = parser.parse_args()
+
+    source = pd.read_csv(args.source)
+    rows = args.rows or len(source)
+    source = source.iloc[np.random.default_rng(42).integers(0, len(source), size=rows)].reset_index(drop=True)
+    array = np.c_[source.drop(columns=[TARGET_COLUMN]).to_numpy(dtype=np.float64), source[TARGET_COLUMN].to_numpy()]
+    features = array[:, :-1]
+
+    keys, _ = pack_rows(features)
+    labels = array[:, -1].astype(np.int8)
+    results = [size_row("memory", "float64 array", array.nbytes, keys.nbytes + labels.nbytes)]
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        csv_path = os.path.join(work_dir, "source.csv")
+        source.to_csv(csv_path, index=False)
+        npy_path, npz_path = os.path.join(work_dir, "train.npy"), os.path.join(work_dir, "train.npz")
+        save_numpy_array_data(npy_path, array)
+        save_packed_array(npz_path, array)
+        assert np.array_equal(load_packed_array(npz_path), array)
+
+        results.append(size_row("disk", "csv", os.path.getsize(csv_path), os.path.getsize(npz_path)))
+        results.append(size_row("disk", "npy", os.path.getsize(npy_path), os.path.getsize(npz_path)))
+        npz_load_seconds = best_seconds(load_packed_array, npz_path)
+        npy_load_seconds = best_seconds(load_numpy_array_data, npy_path)
+
+    request = source.drop(columns=[TARGET_COLUMN]).iloc[: args.request_rows]
+    json_body = json.dumps(request.to_dict(orient="records")).encode()
+    packed_body = pack_rows(request.to_numpy())[0].astype("<u8").tobytes()
+    results.append(size_row("wire", "json batch", len(json_body), len(packed_body)))
+
+    print(f"rows={rows} features={features.shape[1]} request_rows={len(request)}")
+    print(pd.DataFrame(results).to_string(index=False))
+
+    pack_seconds = best_seconds(pack_rows, features)
+    unpack_seconds = best_seconds(unpack_rows, keys, features.shape[1])
+    print(
+        f"pack {rows / pack_seconds:,.0f} rows/s, unpack {rows / unpack_seconds:,.0f} rows/s, "
+        f"load npz {npz_load_seconds * 1000:.1f} ms vs npy {npy_load_seconds * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
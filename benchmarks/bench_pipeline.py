@@ -0,0 +1,383 @@
+"""
+End-to-end benchmark of the training and inference path at several dataset scales:
+DataIngestion (from a local MongoDB stand-in), DataValidation, DataTransformation,
+the model search (evaluate_models) and NetworkModel.predict. Every stage (and the
+component sub-stages) is timed with the pipeline's RunProfiler, so each record has
+wall / CPU seconds, rows/sec and peak RSS. Results go to a JSON file; --compare
+diffs two such files and exits with status 1 when a stage got slower or bigger
+than --threshold allows.
+
+The datasets are drawn from the synthetic data model (utils/synthetic.py) fitted
+on the source data. Two MongoDB stand-ins are available: "generated" (default) serves the rows from
+an int8 array and builds each document batch on demand, so 10M rows fit in memory
+and the numbers reflect the client side (cursor batches, columnar decoding) without
+a server; "mongomock" stores real documents and is only practical up to ~1M rows.
+The model search runs on at most --search-max-rows training rows, since the full
+zoo grid at 10M rows would take days on one machine.
+
+Everything runs in a scratch working directory, so artifacts/ and final_model/ of
+the checkout are not touched.
+
+Usage:
+    python benchmarks/bench_pipeline.py --scales 10000 1000000 10000000 --output results.json
+    python benchmarks/bench_pipeline.py --compare baseline.json results.json --threshold 0.1
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import struct
+import argparse
+import platform
+import tempfile
+import numpy as np
+import pandas as pd
+from bson import ObjectId
+
+from networksecurity.constants.constant import (
+    TARGET_COLUMN,
+    SCHEMA_FILE_PATH,
+    MODEL_TRAINER_RANDOM_STATE,
+    DATA_INGESTION_COLLECTION_NAME,
+    DATA_INGESTION_DATABASE_NAME,
+)
+from networksecurity.entity.config_entity import (
+    TrainingPipelineConfig,
+    DataIngestionConfig,
+    DataValidationConfig,
+    DataTransformationConfig,
+)
+from networksecurity.configuration.mongo_db_connection import MongoDBClient
+from networksecurity.components.data_ingestion import DataIngestion
+from networksecurity.components.data_validation import DataValidation
+from networksecurity.components.data_transformation import DataTransformation
+from networksecurity.components.model_trainer import ModelTrainer
+from networksecurity.utils.common import (
+    read_yaml_file,
+    get_schema_dtypes,
+    load_object,
+    load_numpy_array_data,
+    evaluate_models,
+)
+from networksecurity.utils.columnar import load_dataframe
+from networksecurity.utils.synthetic import SyntheticDataModel
+from networksecurity.utils.model.estimator import NetworkModel
+from networksecurity.utils.profiling import RunProfiler, profile_stage
+
+STAND_INS = ("generated", "mongomock")
+
+# A stage is only flagged when it also grew by more than this, so timer noise
+# on millisecond stages does not count as a regression
+MIN_REGRESSION = {"wall_seconds": 0.05, "peak_rss_mb": 8.0}
+
+
+def make_dataset(source_file: str, rows: int) -> pd.DataFrame:
+    """rows synthetic rows drawn from a SyntheticDataModel fitted on the source file."""
+    dtypes = get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH))
+    model = SyntheticDataModel(dtypes, TARGET_COLUMN).fit(load_dataframe(source_file, dtypes))
+    chunk_size = 1_000_000
+    return pd.concat(
+        [
+            model.sample(min(chunk_size, rows - start), random_state=(MODEL_TRAINER_RANDOM_STATE, index))
+            for index, start in enumerate(range(0, rows, chunk_size))
+        ],
+        ignore_index=True,
+    )
+
+
+class GeneratedCursor:
+    def __init__(self, collection, lower: int, upper: int, projection: dict = None):
+        self.collection = collection
+        self.lower, self.upper = lower, upper
+        self.projection = projection or {}
+        self.descending = False
+        self._documents = None
+
+    def sort(self, key, direction=1):
+        if key != "_id":
+            raise NotImplementedError(f"sort on {key}")
+        self.descending = direction < 0
+        return self
+
+    def skip(self, count: int):
+        if self.descending:
+            self.upper = max(self.lower, self.upper - count)
+        else:
+            self.lower = min(self.upper, self.lower + count)
+        return self
+
+    def limit(self, count: int):
+        if count:
+            if self.descending:
+                self.lower = max(self.lower, self.upper - count)
+            else:
+                self.upper = min(self.upper, self.lower + count)
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> dict:
+        # Like a pymongo cursor, sort/skip/limit only apply until the first document is read
+        if self._documents is None:
+            self._documents = self._generate()
+        return next(self._documents)
+
+    def _generate(self):
+        include_id = self.projection.get("_id", 1) != 0
+        included = {key for key, value in self.projection.items() if value and key != "_id"}
+        if included:
+            columns = [column for column in self.collection.columns if column in included]
+        else:
+            # {"_id": 1} returns the ids alone, no projection returns everything
+            columns = [] if self.projection.get("_id") else list(self.collection.columns)
+        index = [self.collection.columns.index(column) for column in columns]
+
+        batch = self.collection.batch_size
+        starts = range(self.lower, self.upper, batch)
+        for start in reversed(starts) if self.descending else starts:
+            stop = min(start + batch, self.upper)
+            rows = self.collection.values[start:stop][:, index].tolist()
+            positions = range(start, stop)
+            if self.descending:
+                rows, positions = rows[::-1], positions[::-1]
+            for position, row in zip(positions, rows):
+                document = dict(zip(columns, row))
+                if include_id:
+                    document["_id"] = self.collection.object_id(position)
+                yield document
+
+
+class GeneratedCollection:
+    """
+    Read-only stand-in for the pymongo collection calls NetworkData makes: find()
+    with _id range filters, projection, sort/skip/limit and batch_size, the document
+    counts and the $match/$sample/$project aggregate. Row i has the ObjectId whose
+    counter bytes are i, so an _id filter maps straight to a row range.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame, batch_size: int = 10000):
+        self.values = dataframe.to_numpy()
+        self.columns = list(dataframe.columns)
+        self.batch_size = batch_size
+        self._id_prefix = struct.pack(">I", int(time.time()))
+
+    def object_id(self, position: int) -> ObjectId:
+        return ObjectId(self._id_prefix + struct.pack(">Q", position))
+
+    def _range(self, query: dict) -> tuple:
+        lower, upper = 0, len(self.values)
+        for key, condition in (query or {}).items():
+            if key != "_id":
+                raise NotImplementedError(f"filter on {key}")
+            for operator, object_id in condition.items():
+                position = int.from_bytes(object_id.binary[4:], "big")
+                if operator == "$gt":
+                    lower = max(lower, position + 1)
+                elif operator == "$gte":
+                    lower = max(lower, position)
+                elif operator == "$lt":
+                    upper = min(upper, position)
+                elif operator == "$lte":
+                    upper = min(upper, position + 1)
+                else:
+                    raise NotImplementedError(operator)
+        return lower, max(lower, upper)
+
+    def find(self, query: dict = None, projection: dict = None, batch_size: int = None):
+        return GeneratedCursor(self, *self._range(query), projection)
+
+    def count_documents(self, query: dict) -> int:
+        lower, upper = self._range(query)
+        return upper - lower
+
+    def estimated_document_count(self) -> int:
+        return len(self.values)
+
+    def aggregate(self, pipeline: list):
+        stages = {name: value for stage in pipeline for name, value in stage.items()}
+        lower, upper = self._range(stages.get("$match"))
+        size = min(stages["$sample"]["size"], upper - lower)
+        positions = np.random.default_rng().choice(np.arange(lower, upper), size=size, replace=False)
+        return iter([{"_id": self.object_id(int(position))} for position in positions])
+
+
+def make_mongo_client(stand_in: str, dataframe: pd.DataFrame, batch_size: int) -> MongoDBClient:
+    if stand_in == "generated":
+        collection = GeneratedCollection(dataframe, batch_size)
+        databases = {DATA_INGESTION_DATABASE_NAME: {DATA_INGESTION_COLLECTION_NAME: collection}}
+        return MongoDBClient(client=databases)
+
+    import mongomock
+
+    client = mongomock.MongoClient()
+    collection = client[DATA_INGESTION_DATABASE_NAME][DATA_INGESTION_COLLECTION_NAME]
+    for start in range(0, len(dataframe), batch_size):
+        collection.insert_many(dataframe.iloc[start : start + batch_size].to_dict("records"))
+    return MongoDBClient(client=client)
+
+
+def run_scale(rows: int, args, source_file: str, schema_dir: str) -> tuple:
+    """Runs every stage on a dataset of rows rows; returns (stage records, best model family)."""
+    dataframe = make_dataset(source_file, rows)
+    mongo_client = make_mongo_client(args.stand_in, dataframe, args.batch_size)
+    features = dataframe.drop(columns=[TARGET_COLUMN]).astype(np.float64)
+    del dataframe
+
+    work_dir = tempfile.mkdtemp(prefix=f"bench_pipeline_{rows}_")
+    previous_dir = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        os.symlink(schema_dir, os.path.dirname(SCHEMA_FILE_PATH))
+        pipeline_config = TrainingPipelineConfig()
+        profiler = RunProfiler(os.path.join(work_dir, "run_report.yaml"))
+        with profiler:
+            with profile_stage("data_ingestion"):
+                ingestion_artifact = DataIngestion(
+                    DataIngestionConfig(pipeline_config), mongo_client=mongo_client
+                ).initiate_data_ingestion()
+
+            with profile_stage("data_validation"):
+                validation_artifact = DataValidation(
+                    ingestion_artifact, DataValidationConfig(pipeline_config)
+                ).initiate_data_validation()
+
+            with profile_stage("data_transformation"):
+                transformation_artifact = DataTransformation(
+                    validation_artifact, DataTransformationConfig(pipeline_config)
+                ).initiate_data_transformation()
+
+            arrays = {}
+            rng = np.random.default_rng(MODEL_TRAINER_RANDOM_STATE)
+            for split in ("train", "test"):
+                X = load_numpy_array_data(
+                    getattr(transformation_artifact, f"transformed_{split}_features_file_path"), mmap_mode="r"
+                )
+                y = load_numpy_array_data(
+                    getattr(transformation_artifact, f"transformed_{split}_labels_file_path"), mmap_mode="r"
+                )
+                if len(y) > args.search_max_rows:
+                    index = np.sort(rng.choice(len(y), args.search_max_rows, replace=False))
+                    X, y = X[index], y[index]
+                arrays[split] = X, y
+
+            models, params = ModelTrainer.get_model_zoo()
+            with profile_stage("model_search", rows=len(arrays["train"][1])):
+                report, _ = evaluate_models(
+                    X_train=arrays["train"][0],
+                    y_train=arrays["train"][1],
+                    X_test=arrays["test"][0],
+                    y_test=arrays["test"][1],
+                    models=models,
+                    params=params,
+                    search_strategy=args.search_strategy,
+                    budget_seconds=args.search_budget,
+                    random_state=MODEL_TRAINER_RANDOM_STATE,
+                )
+            best_name = max(report, key=report.get)
+            network_model = NetworkModel(
+                preprocessor=load_object(transformation_artifact.transformed_object_file_path),
+                model=models[best_name],
+            )
+
+            with profile_stage("predict", rows=len(features)):
+                for start in range(0, len(features), args.predict_batch_size):
+                    network_model.predict(features.iloc[start : start + args.predict_batch_size])
+    finally:
+        os.chdir(previous_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    records = []
+    for record in sorted(profiler.stages, key=lambda record: (record["started_at"], record["stage"].count("/"))):
+        records.append(
+            {
+                "scale": rows,
+                "stage": record["stage"],
+                "rows": record.get("rows"),
+                "wall_seconds": record.get("wall_seconds"),
+                "cpu_seconds": record.get("cpu_seconds"),
+                "rows_per_sec": record.get("rows_per_sec"),
+                "peak_rss_mb": record.get("peak_rss_mb"),
+            }
+        )
+    return records, best_name
+
+
+def compare(base_file: str, new_file: str, threshold: float) -> int:
+    """Prints base vs new per (scale, stage); returns the number of regressions."""
+    with open(base_file) as base, open(new_file) as new:
+        base_records = {(record["scale"], record["stage"]): record for record in json.load(base)["stages"]}
+        new_records = json.load(new)["stages"]
+
+    rows, regressions = [], 0
+    for record in new_records:
+        base_record = base_records.get((record["scale"], record["stage"]))
+        if base_record is None:
+            continue
+        row = {"scale": record["scale"], "stage": record["stage"]}
+        flags = []
+        for metric, min_change in MIN_REGRESSION.items():
+            old, current = base_record.get(metric), record.get(metric)
+            if old is None or current is None:
+                continue
+            row[f"{metric}_base"], row[metric] = old, current
+            row[f"{metric}_change"] = f"{(current - old) / old:+.1%}" if old else "n/a"
+            if current > old * (1 + threshold) and current - old > min_change:
+                flags.append(metric)
+        row["regression"] = ",".join(flags)
+        regressions += bool(flags)
+        rows.append(row)
+
+    print(pd.DataFrame(rows).fillna("").to_string(index=False))
+    print(f"\n{regressions} regressions (threshold {threshold:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=os.path.join("data", "phisingData.csv"))
+    parser.add_argument("--scales", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--stand-in", choices=STAND_INS, default="generated", help="local MongoDB stand-in")
+    parser.add_argument("--batch-size", type=int, default=10000, help="cursor batch of the stand-in")
+    parser.add_argument("--search-strategy", default="halving")
+    parser.add_argument("--search-budget", type=float, default=None, help="search budget in seconds")
+    parser.add_argument("--search-max-rows", type=int, default=100_000)
+    parser.add_argument("--predict-batch-size", type=int, default=100_000)
+    parser.add_argument("--output", default="bench_pipeline_results.json")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="compare two results files")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed relative growth")
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+
+    source_file = os.path.abspath(args.source)
+    schema_dir = os.path.abspath(os.path.dirname(SCHEMA_FILE_PATH))
+    stages, best_models = [], {}
+    for rows in args.scales:
+        print(f"scale {rows}...", flush=True)
+        records, best_models[rows] = run_scale(rows, args, source_file, schema_dir)
+        stages.extend(records)
+
+    results = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "stand_in": args.stand_in,
+        "search_strategy": args.search_strategy,
+        "search_max_rows": args.search_max_rows,
+        "best_models": best_models,
+        "stages": stages,
+    }
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2)
+
+    table = pd.DataFrame(stages)
+    top_level = table[~table["stage"].str.contains("/")]
+    print(top_level.to_string(index=False))
+    print(f"\n{len(stages)} stage records written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
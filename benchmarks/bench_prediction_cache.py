@@ -0,0 +1,103 @@
+"""
+Benchmark of the prediction cache (utils/model/prediction_cache.py) in front of the
+final_model/ NetworkModel. Replays a request stream drawn from the distinct feature rows
+of the source data with Zipf-distributed popularity, in batches of --batch-size rows,
+with no cache and with LRU / LFU caches of several sizes. Reports hit rate, rows the
+model actually scored and rows/sec.
+
+Usage:
+    python benchmarks/bench_prediction_cache.py --rows 200000 --batch-size 64 --zipf 1.2
+"""
+import os
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+from networksecurity.constants.constant import (
+    TARGET_COLUMN,
+    FINAL_MODEL_DIR,
+    MODEL_FILE_NAME,
+    COMPILED_MODEL_FILE_NAME,
+    PREPROCESSING_OBJECT_FILE_NAME,
+)
+from networksecurity.utils.model.estimator import load_network_model
+from networksecurity.utils.model.prediction_cache import PredictionCache, CachedNetworkModel, CACHE_POLICIES
+
+
+class CountingModel:
+    def __init__(self, network_model):
+        self.network_model = network_model
+        self.rows = 0
+
+    def predict(self, x):
+        self.rows += len(x)
+        return self.network_model.predict(x)
+
+
+def replay(model, stream: np.ndarray, batch_size: int) -> float:
+    start_time = time.perf_counter()
+    for start in range(0, len(stream), batch_size):
+        model.predict(stream[start : start + batch_size])
+    return time.perf_counter() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=os.path.join("data", "phisingData.csv"))
+    parser.add_argument("--model-dir", default=FINAL_MODEL_DIR)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--zipf", type=float, default=1.2, help="popularity skew of the distinct rows")
+    parser.add_argument("--cache-sizes", type=int, nargs="+", default=[256, 2048, 100000])
+    args = parser.parse_args()
+
+    distinct = pd.read_csv(args.source).drop(columns=[TARGET_COLUMN]).drop_duplicates().to_numpy(dtype=np.float64)
+    rng = np.random.default_rng(42)
+    popularity = rng.permutation(len(distinct))
+    stream = distinct[popularity[(rng.zipf(args.zipf, size=args.rows) - 1) % len(distinct)]]
+
+    network_model = load_network_model(
+        os.path.join(args.model_dir, PREPROCESSING_OBJECT_FILE_NAME),
+        os.path.join(args.model_dir, MODEL_FILE_NAME),
+        os.path.join(args.model_dir, COMPILED_MODEL_FILE_NAME),
+    )
+
+    counting_model = CountingModel(network_model)
+    baseline_seconds = replay(counting_model, stream, args.batch_size)
+    results = [
+        {
+            "cache": "none",
+            "size": 0,
+            "hit_rate": 0.0,
+            "model_rows": counting_model.rows,
+            "rows_per_sec": round(args.rows / baseline_seconds),
+            "speedup": 1.0,
+        }
+    ]
+
+    for policy in CACHE_POLICIES:
+        for cache_size in args.cache_sizes:
+            counting_model = CountingModel(network_model)
+            cached_model = CachedNetworkModel(counting_model, PredictionCache(cache_size, policy), "bench")
+            seconds = replay(cached_model, stream, args.batch_size)
+            results.append(
+                {
+                    "cache": policy,
+                    "size": cache_size,
+                    "hit_rate": round(cached_model.cache.hit_rate, 4),
+                    "model_rows": counting_model.rows,
+                    "rows_per_sec": round(args.rows / seconds),
+                    "speedup": round(baseline_seconds / seconds, 1),
+                }
+            )
+
+    print(
+        f"rows={args.rows} distinct={len(distinct)} batch_size={args.batch_size} zipf={args.zipf} "
+        f"model={type(network_model.model).__name__}"
+    )
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
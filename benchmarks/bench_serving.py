@@ -0,0 +1,77 @@
+"""
+Benchmark of the prediction service (app.py) under concurrent single-row requests:
+max_batch_size=1 (one model call per request) vs micro-batching. Requests go through
+the full FastAPI stack in process (httpx ASGI transport), so no server is started.
+
+Usage:
+    python benchmarks/bench_serving.py --requests 2000 --concurrency 64
+"""
+import os
+import time
+import asyncio
+import argparse
+import httpx
+import pandas as pd
+
+from networksecurity.constants.constant import TARGET_COLUMN, FINAL_MODEL_DIR
+from app import create_app
+
+
+async def run_load(app, payloads: list, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def call(payload):
+                async with semaphore:
+                    response = await client.post("/predict", json=payload)
+                    response.raise_for_status()
+
+            start_time = time.perf_counter()
+            await asyncio.gather(*(call(payload) for payload in payloads))
+            elapsed = time.perf_counter() - start_time
+            batches = app.state.batcher.batches
+
+    return elapsed, batches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=os.path.join("data", "phisingData.csv"))
+    parser.add_argument("--model-dir", default=FINAL_MODEL_DIR)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--max-batch-sizes", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--cache-size", type=int, default=0, help="prediction cache size, 0 measures batching alone")
+    args = parser.parse_args()
+
+    rows = pd.read_csv(args.source).drop(columns=[TARGET_COLUMN])
+    payloads = rows.sample(n=args.requests, replace=True, random_state=42).to_dict(orient="records")
+
+    results = []
+    for max_batch_size in args.max_batch_sizes:
+        app = create_app(
+            args.model_dir, max_batch_size=max_batch_size, max_wait_ms=args.max_wait_ms, cache_size=args.cache_size
+        )
+        elapsed, batches = asyncio.run(run_load(app, payloads, args.concurrency))
+        results.append(
+            {
+                "max_batch_size": max_batch_size,
+                "requests_per_sec": round(args.requests / elapsed, 1),
+                "mean_latency_ms": round(1000 * elapsed * args.concurrency / args.requests, 2),
+                "model_calls": batches,
+            }
+        )
+
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} max_wait_ms={args.max_wait_ms} "
+        f"cache_size={args.cache_size}"
+    )
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
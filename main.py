@@ -1,13 +1,25 @@
 from networksecurity.pipeline.training_pipeline import TrainingPipeline
 from networksecurity.logger.logging import logging
 from networksecurity.exception.exception import NetworkSecurityException
+import argparse
 import sys
 
 if __name__ == "__main__":
     try:
+        parser = argparse.ArgumentParser(description="Run the network security training pipeline")
+        parser.add_argument("--no-cache", action="store_true", help="recompute every stage")
+        parser.add_argument(
+            "--force",
+            nargs="*",
+            default=[],
+            help="stages to recompute even on a cache hit "
+            "(data_validation, data_transformation, model_trainer)",
+        )
+        args = parser.parse_args()
+
         logging.info("Training Pipeline started...")
 
-        pipeline = TrainingPipeline()
+        pipeline = TrainingPipeline(use_cache=not args.no_cache, force_stages=args.force)
         pipeline.run_pipeline()
 
         logging.info("Training Pipeline completed successfully.")
@@ -1,47 +1,63 @@
 import os
 import sys
-import pymongo
+import time
+import shutil
 import numpy as np
 import pandas as pd
-from dotenv import load_dotenv
+from bson import ObjectId
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logger.logging import logging
 
 from networksecurity.entity.config_entity import DataIngestionConfig
 from networksecurity.entity.artifact_entity import DataIngestionArtifact
+from networksecurity.constants.constant import SCHEMA_FILE_PATH, ARTIFACT_FILE_FORMAT
+from networksecurity.utils.profiling import profile_stage, record_rows
+from networksecurity.utils.common import (
+    read_yaml_file,
+    write_yaml_file,
+    get_schema_dtypes,
+)
+from networksecurity.utils.columnar import save_dataframe, load_dataframe
+from networksecurity.configuration.mongo_db_connection import MongoDBClient
+from networksecurity.data_access.network_data import NetworkData
 from sklearn.model_selection import train_test_split
 
-# load the environment variable
-load_dotenv()
-MONGO_DB_URL = os.getenv("MONGODB_URL")
-
 
 class DataIngestion:
 
-    def __init__(self, data_ingestion_config: DataIngestionConfig):
+    def __init__(self, data_ingestion_config: DataIngestionConfig, mongo_client: MongoDBClient = None):
         try:
             self.data_ingestion_config = data_ingestion_config
+            self.network_data = NetworkData(mongo_client=mongo_client)
             logging.info("DataIngestionConfig initialized successfully.")
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
 
-    def export_collection_as_dataframe(self):
+    def export_collection_as_dataframe(self, query: dict = None):
         try:
             database_name = self.data_ingestion_config.database_name
             collection_name = self.data_ingestion_config.collection_name
 
-            logging.info(f"Connecting to MongoDB at: {MONGO_DB_URL}")
-            self.mongo_client = pymongo.MongoClient(MONGO_DB_URL)
-
-            collection = self.mongo_client[database_name][collection_name]
+            dtypes = get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH))
 
             logging.info(f"Reading data from MongoDB Collection: {collection_name}")
-            df = pd.DataFrame(list(collection.find()))
-
-            if "_id" in df.columns:
-                df = df.drop(columns=["_id"], axis=1)
+            start_time = time.perf_counter()
+
+            df = self.network_data.export_collection_as_dataframe(
+                database_name=database_name,
+                collection_name=collection_name,
+                dtypes=dtypes,
+                batch_size=self.data_ingestion_config.batch_size,
+                num_partitions=self.data_ingestion_config.num_partitions,
+                strategy=self.data_ingestion_config.partition_strategy,
+                query=query,
+            )
 
-            df.replace({"na": np.nan}, inplace=True)
+            elapsed = time.perf_counter() - start_time
+            rows_per_sec = len(df) / elapsed if elapsed > 0 else float("inf")
+            logging.info(
+                f"Exported {len(df)} rows in {elapsed:.2f}s ({rows_per_sec:,.0f} rows/sec)"
+            )
 
             logging.info(f"Shape of dataframe: {df.shape}")
             return df
@@ -56,12 +72,8 @@ class DataIngestion:
             feature_store_file_path = self.data_ingestion_config.feature_store_file_path
             logging.info(f"Feature store file path: {feature_store_file_path}")
 
-            dir_path = os.path.dirname(feature_store_file_path)
-            logging.info(f"Checking or creating directory: {dir_path}")
-            os.makedirs(dir_path, exist_ok=True)
-
-            logging.info("Saving dataframe to feature store as CSV...")
-            dataframe.to_csv(feature_store_file_path, index=False, header=True)
+            logging.info(f"Saving dataframe to feature store as {ARTIFACT_FILE_FORMAT}...")
+            save_dataframe(feature_store_file_path, dataframe)
 
             logging.info(
                 f"Data successfully exported to feature store at: {feature_store_file_path}"
@@ -73,23 +85,126 @@ class DataIngestion:
             logging.error("Error occurred while exporting data into feature store.")
             raise NetworkSecurityException(e, sys.exc_info())
 
+    def read_watermark(self):
+        """
+        Returns the last ingestion watermark, or None if the shared feature store
+        has never been built (or was removed).
+        """
+        try:
+            watermark_file_path = self.data_ingestion_config.watermark_file_path
+            parts_dir = self.data_ingestion_config.shared_feature_store_parts_dir
+
+            if not (os.path.exists(watermark_file_path) and os.path.isdir(parts_dir)):
+                return None
+
+            return read_yaml_file(watermark_file_path)
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def write_watermark(self, last_id, rows: int, parts: list, next_part: int) -> None:
+        try:
+            watermark = {
+                "last_id": str(last_id),
+                "last_id_generation_time": last_id.generation_time.isoformat(),
+                "rows": int(rows),
+                "parts": list(parts),
+                "next_part": int(next_part),
+            }
+            write_yaml_file(self.data_ingestion_config.watermark_file_path, watermark, replace=True)
+            logging.info(f"Watermark updated: last_id={last_id}, rows={rows}, parts={len(parts)}")
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def remove_uncommitted_parts(self, committed_parts: list) -> None:
+        """
+        Deletes part files not listed in the watermark, i.e. appends left behind by
+        a run that crashed before the watermark was written.
+        """
+        parts_dir = self.data_ingestion_config.shared_feature_store_parts_dir
+        for part in os.listdir(parts_dir):
+            if part not in committed_parts:
+                logging.warning(f"Removing uncommitted feature store part: {part}")
+                os.remove(os.path.join(parts_dir, part))
+
+    def read_feature_store_parts(self, parts: list) -> pd.DataFrame:
+        parts_dir = self.data_ingestion_config.shared_feature_store_parts_dir
+        dtypes = get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH))
+        frames = [load_dataframe(os.path.join(parts_dir, part), dtypes) for part in parts]
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    def ingest_incremental(self) -> pd.DataFrame:
+        """
+        Pulls only documents whose _id is above the stored watermark and appends them
+        to the shared feature store as a new part file. The delta is bounded above by
+        the max _id seen at the start of the run, so documents inserted meanwhile are
+        picked up next time. ObjectIds are only second-resolution across writers, so
+        the watermark assumes documents are inserted through a single loader (push_data).
+        """
+        try:
+            database_name = self.data_ingestion_config.database_name
+            collection_name = self.data_ingestion_config.collection_name
+            parts_dir = self.data_ingestion_config.shared_feature_store_parts_dir
+
+            upper_id = self.network_data.get_max_id(database_name, collection_name)
+            if upper_id is None:
+                raise Exception(f"Collection {database_name}.{collection_name} is empty")
+
+            watermark = self.read_watermark()
+
+            if watermark is None:
+                logging.info("No watermark found, building the shared feature store from scratch")
+                shutil.rmtree(parts_dir, ignore_errors=True)
+                os.makedirs(parts_dir, exist_ok=True)
+                query = {"_id": {"$lte": upper_id}}
+                rows, parts, next_part = 0, [], 0
+                last_id = None
+            else:
+                last_id = ObjectId(watermark["last_id"])
+                query = {"_id": {"$gt": last_id, "$lte": upper_id}}
+                rows, parts, next_part = watermark["rows"], watermark["parts"], watermark["next_part"]
+                self.remove_uncommitted_parts(parts)
+
+            if upper_id == last_id:
+                logging.info("No new documents since the last watermark")
+                return self.read_feature_store_parts(parts)
+
+            delta = self.export_collection_as_dataframe(query=query)
+
+            part = f"part-{next_part:05d}.{ARTIFACT_FILE_FORMAT}"
+            logging.info(f"Appending {len(delta)} new rows to the feature store as {part}")
+            save_dataframe(os.path.join(parts_dir, part), delta)
+
+            parts, next_part, rows = parts + [part], next_part + 1, rows + len(delta)
+            self.write_watermark(upper_id, rows, parts, next_part)
+
+            dataframe = self.read_feature_store_parts(parts)
+
+            # Compact many small appends into a single part
+            if len(parts) > self.data_ingestion_config.max_feature_store_parts:
+                part = f"part-{next_part:05d}.{ARTIFACT_FILE_FORMAT}"
+                logging.info(f"Compacting {len(parts)} feature store parts into {part}")
+                save_dataframe(os.path.join(parts_dir, part), dataframe)
+                self.write_watermark(upper_id, rows, [part], next_part + 1)
+                self.remove_uncommitted_parts([part])
+
+            return dataframe
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
     def split_data_as_train_test(self, dataframe: pd.DataFrame):
         try:
             train_set, test_set = train_test_split(
-                dataframe, 
-                test_size=self.data_ingestion_config.train_test_split_ratio
+                dataframe,
+                test_size=self.data_ingestion_config.train_test_split_ratio,
+                random_state=self.data_ingestion_config.random_state,
             )
             logging.info("Performed train-test split successfully")
 
-            dir_path = os.path.dirname(self.data_ingestion_config.training_file_path)
-            os.makedirs(dir_path, exist_ok=True)
-
-            train_set.to_csv(
-                self.data_ingestion_config.training_file_path, index=False, header=True
-            )
-            test_set.to_csv(
-                self.data_ingestion_config.testing_file_path, index=False, header=True
-            )
+            save_dataframe(self.data_ingestion_config.training_file_path, train_set)
+            save_dataframe(self.data_ingestion_config.testing_file_path, test_set)
             logging.info("Exported train and test files successfully")
 
         except Exception as e:
@@ -98,10 +213,18 @@ class DataIngestion:
     def initiate_data_ingestion(self):
         try:
             logging.info("Reading the data from mongoDB")
-            dataframe = self.export_collection_as_dataframe()
 
-            dataframe = self.export_data_into_feature_store(dataframe=dataframe)
-            self.split_data_as_train_test(dataframe=dataframe)
+            with profile_stage("export") as stage:
+                if self.data_ingestion_config.ingestion_mode == "incremental":
+                    dataframe = self.ingest_incremental()
+                else:
+                    dataframe = self.export_collection_as_dataframe()
+                    dataframe = self.export_data_into_feature_store(dataframe=dataframe)
+                stage["rows"] = len(dataframe)
+
+            with profile_stage("split", rows=len(dataframe)):
+                self.split_data_as_train_test(dataframe=dataframe)
+            record_rows(len(dataframe))
 
             data_ingestion_artifact = DataIngestionArtifact(
                 trained_file_path=self.data_ingestion_config.training_file_path,
@@ -2,7 +2,6 @@ import os
 import sys
 import numpy as np
 import pandas as pd
-from sklearn.impute import KNNImputer
 from sklearn.pipeline import Pipeline
 
 from networksecurity.constants.constant import *
@@ -17,7 +16,11 @@ from networksecurity.entity.artifact_entity import (
 )
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logger.logging import logging
-from networksecurity.utils.common import save_numpy_array_data, save_object
+from networksecurity.utils.common import save_object
+from networksecurity.utils.columnar import load_dataframe
+from networksecurity.utils.arrays import CompactArrayWriter
+from networksecurity.utils.model.imputer import TernaryImputer
+from networksecurity.utils.profiling import profile_stage, record_rows
 
 
 class DataTransformation:
@@ -35,7 +38,7 @@ class DataTransformation:
     @staticmethod
     def read_data(file_path) -> pd.DataFrame:
         try:
-            return pd.read_csv(file_path)
+            return load_dataframe(file_path)
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
 
@@ -43,8 +46,8 @@ class DataTransformation:
         try:
             logging.info("Entered get_data_transformed_object method")
 
-            imputer = KNNImputer(**DATA_TRANSFORMATION_IMPUTER_PARAMS)
-            logging.info(f"Initialize KNNImputer with {DATA_TRANSFORMATION_IMPUTER_PARAMS}")
+            imputer = TernaryImputer(**DATA_TRANSFORMATION_IMPUTER_PARAMS)
+            logging.info(f"Initialize TernaryImputer with {DATA_TRANSFORMATION_IMPUTER_PARAMS}")
 
             preprocessor = Pipeline([("imputer", imputer)])
             return preprocessor
@@ -52,57 +55,79 @@ class DataTransformation:
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
 
+    def save_transformed_arrays(
+        self, preprocessor, dataframe: pd.DataFrame, features_file_path: str, labels_file_path: str
+    ) -> np.dtype:
+        """
+        Transforms the features chunk by chunk into a compact .npy (see CompactArrayWriter)
+        and writes the 0/1 labels as a separate int8 .npy, so no float64 copy of the whole
+        matrix is made. Returns the features dtype.
+        """
+        try:
+            chunk_size = self.data_transformation_config.chunk_size
+            feature_columns = [column for column in dataframe.columns if column != TARGET_COLUMN]
+
+            with CompactArrayWriter(features_file_path, len(dataframe), len(feature_columns)) as writer:
+                for start in range(0, len(dataframe), chunk_size):
+                    writer.write(preprocessor.transform(dataframe.iloc[start : start + chunk_size][feature_columns]))
+                features_dtype = writer.close()
+
+            labels = dataframe[TARGET_COLUMN].to_numpy()
+            np.save(labels_file_path, (labels == 1).astype(np.int8))
+            return features_dtype
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
     def initiate_data_transformation(self) -> DataTransformationArtifact:
         logging.info("Entered initiate_data_transformation method")
         try:
             logging.info("Reading train and test files")
 
-            train_df = self.read_data(self.data_validation_artifact.valid_train_file_path)
-            test_df = self.read_data(self.data_validation_artifact.valid_test_file_path)
+            with profile_stage("read") as stage:
+                train_df = self.read_data(self.data_validation_artifact.valid_train_file_path)
+                test_df = self.read_data(self.data_validation_artifact.valid_test_file_path)
+                stage["rows"] = len(train_df) + len(test_df)
+            record_rows(len(train_df) + len(test_df))
 
             logging.info("Data read successfully")
 
-            # Split input/output features
-            input_feature_train_df = train_df.drop(columns=[TARGET_COLUMN], axis=1)
-            target_feature_train_df = train_df[TARGET_COLUMN].replace(-1, 0)
-
-            input_feature_test_df = test_df.drop(columns=[TARGET_COLUMN], axis=1)
-            target_feature_test_df = test_df[TARGET_COLUMN].replace(-1, 0)
-
             # Preprocessing
             preprocessor = self.get_data_transformed_object()
-            preprocessor_object = preprocessor.fit(input_feature_train_df)
-
-            transformed_input_train = preprocessor_object.transform(input_feature_train_df)
-            transformed_input_test = preprocessor_object.transform(input_feature_test_df)
-
-            # Combine input + output
-            train_arr = np.c_[transformed_input_train, target_feature_train_df]
-            test_arr = np.c_[transformed_input_test, target_feature_test_df]
-
-            # Save train/test arrays
-            save_numpy_array_data(
-                self.data_transformation_config.transformed_train_file_path,
-                array=train_arr,
-            )
-
-            save_numpy_array_data(
-                self.data_transformation_config.transformed_test_file_path,
-                array=test_arr,
-            )
+            with profile_stage("fit", rows=len(train_df)):
+                preprocessor_object = preprocessor.fit(train_df.drop(columns=[TARGET_COLUMN], axis=1))
+
+            # Transformed features and labels go to separate compact arrays, chunk by chunk
+            config = self.data_transformation_config
+            with profile_stage("transform", rows=len(train_df) + len(test_df)):
+                features_dtype = self.save_transformed_arrays(
+                    preprocessor_object,
+                    train_df,
+                    config.transformed_train_features_file_path,
+                    config.transformed_train_labels_file_path,
+                )
+                self.save_transformed_arrays(
+                    preprocessor_object,
+                    test_df,
+                    config.transformed_test_features_file_path,
+                    config.transformed_test_labels_file_path,
+                )
+            logging.info(f"Transformed training features stored as {features_dtype}")
 
             # Save preprocessor object
             save_object(
-                self.data_transformation_config.transformed_object_file_path,
+                config.transformed_object_file_path,
                 preprocessor_object,
             )
             save_object("final_model/preprocessing.pkl",preprocessor)
 
             # Prepare artifact
             artifact = DataTransformationArtifact(
-                transformed_object_file_path=self.data_transformation_config.transformed_object_file_path,
-                transformed_train_file_path=self.data_transformation_config.transformed_train_file_path,
-                transformed_test_file_path=self.data_transformation_config.transformed_test_file_path,
+                transformed_object_file_path=config.transformed_object_file_path,
+                transformed_train_features_file_path=config.transformed_train_features_file_path,
+                transformed_train_labels_file_path=config.transformed_train_labels_file_path,
+                transformed_test_features_file_path=config.transformed_test_features_file_path,
+                transformed_test_labels_file_path=config.transformed_test_labels_file_path,
             )
 
             logging.info("Data Transformation Completed Successfully.")
@@ -12,9 +12,21 @@ import os
 import sys
 import pandas as pd
 import numpy as np
-from scipy.stats import ks_2samp
 from networksecurity.constants.constant import *
-from networksecurity.utils.common import read_yaml_file, write_yaml_file
+from networksecurity.utils.common import (
+    read_yaml_file,
+    write_yaml_file,
+)
+from networksecurity.utils.columnar import load_dataframe
+from networksecurity.utils.schema_validator import SchemaValidator
+from networksecurity.utils.profiling import profile_stage, record_rows
+from networksecurity.utils.drift import (
+    DRIFT_STATISTICS,
+    value_histograms,
+    save_histograms,
+    load_histograms,
+    drift_statistics,
+)
 
 
 class DataValidation:
@@ -27,53 +39,91 @@ class DataValidation:
             self.data_ingestion_artifact = data_ingestion_artifact
             self.data_validation_config = data_validation_config
             self._schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+            self.schema_validator = SchemaValidator(
+                self._schema_config, data_validation_config.chunk_size, target_column=TARGET_COLUMN
+            )
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
 
     @staticmethod
     def read_data(file_path) -> pd.DataFrame:
         try:
-            return pd.read_csv(file_path)
+            return load_dataframe(file_path)
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
 
-    def validate_number_of_columns(self, dataframe: pd.DataFrame) -> bool:
+    def detect_dataset_drift(self, base_df, current_df, threshold=None) -> bool:
+        """
+        Builds the baseline value histograms from base_df, stores them as
+        drift_baseline_file_path and compares current_df against them.
+        """
         try:
-            number_of_columns = len(self._schema_config["columns"])
-            logging.info(f"Required columns: {number_of_columns}")
-            logging.info(f"Dataset columns: {len(dataframe.columns)}")
-
-            return len(dataframe.columns) == number_of_columns
+            values, base_counts = value_histograms(base_df)
+            save_histograms(
+                self.data_validation_config.drift_baseline_file_path,
+                list(base_df.columns),
+                values,
+                base_counts,
+            )
+            return self.compare_with_baseline(current_df, list(base_df.columns), values, base_counts, threshold)
 
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
 
-    def detect_dataset_drift(self, base_df, current_df, threshold=0.05) -> bool:
+    def detect_drift_from_baseline(self, current_df, baseline_file_path, threshold=None) -> bool:
+        """
+        Compares current_df against stored baseline histograms without reading the reference data.
+        """
         try:
-            drift_status = True
-            report = {}
+            columns, values, base_counts = load_histograms(baseline_file_path)
+            return self.compare_with_baseline(current_df, columns, values, base_counts, threshold)
 
-            for column in base_df.columns:
-                d1 = base_df[column]
-                d2 = current_df[column]
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
 
-                test_result = ks_2samp(d1, d2)
-                p_value = float(test_result.pvalue)
+    def compare_with_baseline(self, current_df, columns, values, base_counts, threshold=None) -> bool:
+        try:
+            _, current_counts = value_histograms(current_df[columns], values)
+            return self.compare_histograms(columns, base_counts, current_counts, threshold)
 
-                drift_detected = p_value < threshold
-                if drift_detected:
-                    drift_status = False
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
 
-                report[column] = {
-                    "p_value": p_value,
-                    "drift_detected": drift_detected,
+    def compare_histograms(self, columns, base_counts, current_counts, threshold=None) -> bool:
+        """
+        Writes the per-column drift report and returns True when no column drifted.
+        """
+        try:
+            statistic = self.data_validation_config.drift_statistic
+            if statistic not in DRIFT_STATISTICS:
+                raise ValueError(f"Unknown drift statistic: {statistic}, expected one of {DRIFT_STATISTICS}")
+            if threshold is None:
+                threshold = self.data_validation_config.drift_threshold
+
+            statistics = drift_statistics(base_counts, current_counts)
+
+            if statistic == "chi2":
+                drifted = statistics["p_value"] < threshold
+            else:
+                drifted = statistics[statistic] > threshold
+
+            report = {
+                column: {
+                    "p_value": float(statistics["p_value"][index]),
+                    "chi2": float(statistics["chi2"][index]),
+                    "psi": float(statistics["psi"][index]),
+                    "js": float(statistics["js"][index]),
+                    "drift_detected": bool(drifted[index]),
                 }
+                for index, column in enumerate(columns)
+            }
+            logging.info(f"Drift detected in {int(drifted.sum())} of {len(columns)} columns ({statistic})")
 
             drift_report_file_path = self.data_validation_config.drift_report_file_path
             os.makedirs(os.path.dirname(drift_report_file_path), exist_ok=True)
             write_yaml_file(drift_report_file_path, report, replace=True)
 
-            return drift_status
+            return not drifted.any()
 
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
@@ -83,33 +133,48 @@ class DataValidation:
             train_path = self.data_ingestion_artifact.trained_file_path
             test_path = self.data_ingestion_artifact.tested_file_path
 
-            train_df = self.read_data(train_path)
-            test_df = self.read_data(test_path)
-
-            # Column validation
-            if not self.validate_number_of_columns(train_df):
-                raise NetworkSecurityException("Train dataset column mismatch", sys.exc_info())
-
-            if not self.validate_number_of_columns(test_df):
-                raise NetworkSecurityException("Test dataset column mismatch", sys.exc_info())
-
-            # Detect drift
-            drift_status = self.detect_dataset_drift(train_df, test_df)
+            # Schema checks, invalid-row routing and histograms in one chunked scan per file
+            with profile_stage("schema_scan") as stage:
+                train_report, train_counts = self.schema_validator.validate_file(
+                    train_path,
+                    self.data_validation_config.valid_train_file_path,
+                    self.data_validation_config.invalid_train_file_path,
+                )
+                test_report, test_counts = self.schema_validator.validate_file(
+                    test_path,
+                    self.data_validation_config.valid_test_file_path,
+                    self.data_validation_config.invalid_test_file_path,
+                )
+                stage["rows"] = train_report["rows"] + test_report["rows"]
+            record_rows(train_report["rows"] + test_report["rows"])
+            write_yaml_file(
+                self.data_validation_config.schema_report_file_path,
+                {"train": train_report, "test": test_report},
+                replace=True,
+            )
 
-            # Save validated files
-            os.makedirs(os.path.dirname(self.data_validation_config.valid_train_file_path), exist_ok=True)
+            # Detect drift on the valid rows, train histograms are the baseline
+            columns = self.schema_validator.columns
+            with profile_stage("drift"):
+                save_histograms(
+                    self.data_validation_config.drift_baseline_file_path,
+                    columns,
+                    self.schema_validator.values,
+                    train_counts,
+                )
+                drift_status = self.compare_histograms(columns, train_counts, test_counts)
 
-            train_df.to_csv(self.data_validation_config.valid_train_file_path, index=False)
-            test_df.to_csv(self.data_validation_config.valid_test_file_path, index=False)
+            validation_status = train_report["status"] and test_report["status"] and drift_status
 
             # Create artifact object
             data_validation_artifact = DataValidationArtifact(
-                validation_status=drift_status,
+                validation_status=validation_status,
                 valid_train_file_path=self.data_validation_config.valid_train_file_path,
                 valid_test_file_path=self.data_validation_config.valid_test_file_path,
-                invalid_train_file_path=None,
-                invalid_test_file_path=None,
+                invalid_train_file_path=train_report["invalid_file_path"],
+                invalid_test_file_path=test_report["invalid_file_path"],
                 drift_report_file_path=self.data_validation_config.drift_report_file_path,
+                drift_baseline_file_path=self.data_validation_config.drift_baseline_file_path,
             )
 
             return data_validation_artifact
@@ -1,5 +1,6 @@
 import os, sys
-import mlflow
+import time
+import numpy as np
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logger.logging import logging
 from networksecurity.entity.artifact_entity import (
@@ -7,16 +8,36 @@ from networksecurity.entity.artifact_entity import (
     ModelTrainerArtifact,
 )
 from networksecurity.entity.config_entity import ModelTrainerConfig
+from networksecurity.constants.constant import (
+    MODEL_TRAINER_RANDOM_STATE,
+    MODEL_TRAINER_EARLY_STOPPING_ROUNDS,
+    MODEL_TRAINER_FAST_TIER_MODELS,
+    MODEL_TRAINER_HIST_BOOSTING_MAX_ITER,
+)
 from networksecurity.utils.model.estimator import NetworkModel
+from networksecurity.utils.model.compiled import compile_model, save_compiled_model
+from networksecurity.utils.model.boosting import TernaryHistGradientBoostingClassifier
 from networksecurity.utils.common import (
     save_object,
     load_object,
     load_numpy_array_data,
     evaluate_models,
 )
-from networksecurity.utils.metric.classification_metric import get_classification_score
+from networksecurity.utils.arrays import NumpyArrayReader
+from networksecurity.utils.model.out_of_core import (
+    StreamingHistGradientBoostingClassifier,
+    fit_incremental,
+    stream_confusion_counts,
+    r2_from_counts,
+)
+from networksecurity.utils.metric.classification_metric import (
+    get_classification_score,
+    get_classification_score_from_counts,
+)
+from networksecurity.utils.tracking import TrackingSink, get_tracking_sink
+from networksecurity.utils.profiling import profile_stage, record_rows
 
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.ensemble import (
     AdaBoostClassifier,
@@ -25,61 +46,114 @@ from sklearn.ensemble import (
 )
 
 
-import dagshub
-dagshub.init(repo_owner='mohammadshuaib07866', repo_name='Machine-Learning-End-To-End-Project', mlflow=True)
-
-
-
 class ModelTrainer:
     def __init__(
         self,
         data_transformation_artifact: DataTransformationArtifact,
         model_trainer_config: ModelTrainerConfig,
+        tracking_sink: TrackingSink = None,
     ):
         try:
             self.data_transformation_artifact = data_transformation_artifact
             self.model_trainer_config = model_trainer_config
+            # Nothing connects here: the sink imports and connects MLflow on its first write
+            self.tracking_sink = tracking_sink or get_tracking_sink(
+                model_trainer_config.tracking_backend,
+                tracking_uri=model_trainer_config.tracking_uri,
+                experiment_name=model_trainer_config.experiment_name,
+                dagshub_repo=model_trainer_config.dagshub_repo,
+                exit_timeout=model_trainer_config.tracking_exit_timeout,
+            )
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
     
 
     # ----------------------- MLflow Tracking -----------------------
-    def track_mflow(self, best_model, classification_metric, best_model_name):
+    def track_mflow(self, best_model, classification_metric, best_model_name, split: str = None):
+        """Queues the metrics of the selected model; written in the background."""
         try:
-            tracking_url_type_store = mlflow.get_tracking_uri().split(":")[0]
-
-            with mlflow.start_run():     # FIXED
-                f1_score = classification_metric.f1_score
-                precision_score = classification_metric.precision_score
-                recall_score = classification_metric.recall_score
-
-                mlflow.log_metric("f1_score", f1_score)
-                mlflow.log_metric("precision_score", precision_score)
-                mlflow.log_metric("recall", recall_score)
-
-                # mlflow.sklearn.log_model(best_model, "model")  # FIXED
-
-                # # Model Registry works only when backend is NOT file-store
-                # if tracking_url_type_store != "file":
-                #     mlflow.sklearn.log_model(
-                #         best_model,
-                #         "model",
-                #         registered_model_name=best_model_name,
-                #     )
+            self.tracking_sink.log_run(
+                run_name=f"{best_model_name}-{split}" if split else best_model_name,
+                metrics={
+                    "f1_score": classification_metric.f1_score,
+                    "precision_score": classification_metric.precision_score,
+                    "recall": classification_metric.recall_score,
+                },
+                params=best_model.get_params(deep=False),
+                tags={"model": best_model_name, "split": split, "role": "best"},
+            )
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
 
+    def track_candidates(self, model_report: dict, model_timing_report: dict) -> None:
+        """Queues one run per searched model family: test score, CV score and search cost."""
+        try:
+            for name, test_score in model_report.items():
+                timing = model_timing_report.get(name, {})
+                metrics = {"test_score": test_score}
+                for key in ("cv_score", "fits", "model_fits", "search_wall_seconds", "search_fit_seconds", "refit_seconds"):
+                    metrics[key] = timing.get(key)
+                self.tracking_sink.log_run(
+                    run_name=name,
+                    metrics=metrics,
+                    params=timing.get("best_params"),
+                    tags={"model": name, "strategy": timing.get("strategy"), "role": "candidate"},
+                )
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
 
 
-    # ----------------------- Train Model -----------------------
-    def train_model(self, X_train, y_train, X_test, y_test):
+    # ----------------------- Compiled Export -----------------------
+    def export_compiled_model(self, best_model, X_test) -> None:
+        """
+        Writes the flat-array form of best_model next to final_model/model.pkl after
+        checking it predicts exactly like the estimator. Unsupported estimators are
+        served from the pickle instead.
+        """
+        compiled_model_file_path = self.model_trainer_config.compiled_model_file_path
+        try:
+            compiled_model = compile_model(best_model)
+        except ValueError as e:
+            logging.warning(f"Model not compiled, predictions will use the pickled estimator: {e}")
+            if os.path.exists(compiled_model_file_path):
+                os.remove(compiled_model_file_path)
+            return
+
+        if not (compiled_model.predict(X_test) == best_model.predict(X_test)).all():
+            raise Exception("Compiled model predictions differ from the trained estimator")
+
+        save_compiled_model(compiled_model_file_path, compiled_model)
+        logging.info(f"Compiled {compiled_model.kind} model saved to {compiled_model_file_path}")
+
+    # ----------------------- Model Zoo -----------------------
+    @staticmethod
+    def get_model_zoo(
+        early_stopping_rounds: int = MODEL_TRAINER_EARLY_STOPPING_ROUNDS,
+        tier: str = "full",
+        fast_tier_models: tuple = MODEL_TRAINER_FAST_TIER_MODELS,
+        hist_boosting_max_iter: int = MODEL_TRAINER_HIST_BOOSTING_MAX_ITER,
+    ):
+        """
+        Returns (models, params): candidate estimators and their search grids.
+        tier "fast" keeps only the fast_tier_models families.
+        """
+        if tier not in ("full", "fast"):
+            raise ValueError(f"Unknown model tier: {tier}, expected 'full' or 'fast'")
 
         models = {
-            "Random Forest": RandomForestClassifier(verbose=1),
-            "Decision Tree": DecisionTreeClassifier(),
-            "Gradient Boosting": GradientBoostingClassifier(verbose=1),
-            "Logistic Regression": LogisticRegression(verbose=1),
-            "AdaBoost": AdaBoostClassifier(),
+            "Random Forest": RandomForestClassifier(random_state=MODEL_TRAINER_RANDOM_STATE),
+            "Decision Tree": DecisionTreeClassifier(random_state=MODEL_TRAINER_RANDOM_STATE),
+            "Gradient Boosting": GradientBoostingClassifier(
+                random_state=MODEL_TRAINER_RANDOM_STATE,
+                n_iter_no_change=early_stopping_rounds,
+            ),
+            "Hist Gradient Boosting": TernaryHistGradientBoostingClassifier(
+                max_iter=hist_boosting_max_iter,
+                n_iter_no_change=early_stopping_rounds,
+                random_state=MODEL_TRAINER_RANDOM_STATE,
+            ),
+            "Logistic Regression": LogisticRegression(random_state=MODEL_TRAINER_RANDOM_STATE),
+            "AdaBoost": AdaBoostClassifier(random_state=MODEL_TRAINER_RANDOM_STATE),
         }
 
         params = {
@@ -90,22 +164,62 @@ class ModelTrainer:
                 "subsample": [0.6, 0.7, 0.75, 0.85, 0.9],
                 "n_estimators": [8, 16, 32, 64, 128, 256],
             },
-            "Logistic Regression": {},
+            # No max_iter grid: early stopping picks the number of iterations
+            "Hist Gradient Boosting": {
+                "learning_rate": [0.05, 0.1, 0.2],
+                "max_leaf_nodes": [15, 31, 63],
+            },
+            "Logistic Regression": {"C": [0.01, 0.1, 1.0, 10.0]},
             "AdaBoost": {
                 "learning_rate": [0.1, 0.01, 0.001],
                 "n_estimators": [8, 16, 32, 64, 128, 256],
             },
         }
 
-        model_report = evaluate_models(
+        if tier == "fast":
+            models = {name: model for name, model in models.items() if name in fast_tier_models}
+            params = {name: grid for name, grid in params.items() if name in fast_tier_models}
+
+        return models, params
+
+    # ----------------------- Train Model -----------------------
+    def train_model(self, X_train, y_train, X_test, y_test):
+
+        config = self.model_trainer_config
+        models, params = self.get_model_zoo(
+            early_stopping_rounds=config.early_stopping_rounds,
+            tier=config.model_tier,
+            fast_tier_models=config.fast_tier_models,
+            hist_boosting_max_iter=config.hist_boosting_max_iter,
+        )
+
+        budget_seconds = config.search_budget_seconds
+        if config.model_tier == "fast" and config.fast_tier_budget_seconds is not None:
+            # The fast tier runs under its own latency budget, or the configured one if tighter
+            budget_seconds = min(budget_seconds or float("inf"), config.fast_tier_budget_seconds)
+
+        model_report, model_timing_report = evaluate_models(
             X_train=X_train,
             y_train=y_train,
             X_test=X_test,
             y_test=y_test,
             models=models,
             params=params,
+            search_strategy=config.search_strategy,
+            budget_seconds=budget_seconds,
+            n_iter=config.random_search_iterations,
+            factor=config.halving_factor,
+            resource=config.halving_resource,
+            min_samples=config.halving_min_samples,
+            warm_start=config.warm_start_search,
+            random_state=MODEL_TRAINER_RANDOM_STATE,
         )
 
+        if not model_report:
+            raise Exception("No model finished training within the search budget")
+
+        self.track_candidates(model_report, model_timing_report)
+
         # Best score
         best_model_score = max(model_report.values())
 
@@ -117,24 +231,34 @@ class ModelTrainer:
         best_model = models[best_model_name]
 
         # Train metrics
-        y_train_pred = best_model.predict(X_train)
+        with profile_stage(f"predict_train/{best_model_name}", rows=len(X_train)):
+            y_train_pred = best_model.predict(X_train)
         classification_train_metric = get_classification_score(
             y_true=y_train, y_pred=y_train_pred
         )
 
         # Track train run
-        self.track_mflow(best_model, classification_train_metric, best_model_name)
+        self.track_mflow(best_model, classification_train_metric, best_model_name, split="train")
 
         # Test metrics
-        y_test_pred = best_model.predict(X_test)
+        with profile_stage(f"predict_test/{best_model_name}", rows=len(X_test)):
+            y_test_pred = best_model.predict(X_test)
 
         classification_test_metric = get_classification_score(
             y_true=y_test, y_pred=y_test_pred
         )
 
         # Track test run
-        self.track_mflow(best_model, classification_test_metric, best_model_name)
+        self.track_mflow(best_model, classification_test_metric, best_model_name, split="test")
+
+        return self.save_trained_model(
+            best_model, classification_train_metric, classification_test_metric, model_timing_report, X_test
+        )
 
+    def save_trained_model(
+        self, best_model, classification_train_metric, classification_test_metric, model_timing_report, X_test
+    ) -> ModelTrainerArtifact:
+        """Saves best_model with the preprocessor (plus the compiled export) and returns the artifact."""
         # Save Final Model with Preprocessor
         preprocessor = load_object(
             self.data_transformation_artifact.transformed_object_file_path
@@ -146,31 +270,129 @@ class ModelTrainer:
         os.makedirs(model_dir_path, exist_ok=True)
 
         network_model = NetworkModel(preprocessor=preprocessor, model=best_model)
-        save_object(self.model_trainer_config.trained_model_file_path, network_model)
-        save_object("final_model/model.pkl",best_model)
+        with profile_stage("save"):
+            save_object(self.model_trainer_config.trained_model_file_path, network_model)
+            save_object("final_model/model.pkl",best_model)
+        with profile_stage("export_compiled", rows=len(X_test)):
+            self.export_compiled_model(best_model, X_test)
 
         model_trainer_artifact = ModelTrainerArtifact(
             trained_model_file_path=self.model_trainer_config.trained_model_file_path,
             train_metric_artifact=classification_train_metric,
             test_metric_artifact=classification_test_metric,
+            model_timing_report=model_timing_report,
         )
 
         logging.info(f"Model trainer artifact: {model_trainer_artifact}")
 
         return model_trainer_artifact
 
+    # ----------------------- Out-of-core Training -----------------------
+    def get_out_of_core_model_zoo(self):
+        """
+        Returns the incremental learners trained in out-of-core mode.
+        """
+        config = self.model_trainer_config
+        return {
+            "SGD Logistic Regression": SGDClassifier(loss="log_loss", random_state=MODEL_TRAINER_RANDOM_STATE),
+            "Streaming Hist Gradient Boosting": StreamingHistGradientBoostingClassifier(
+                n_estimators=config.out_of_core_boosting_rounds,
+                learning_rate=config.out_of_core_boosting_learning_rate,
+                max_depth=config.out_of_core_boosting_max_depth,
+                batch_size=config.out_of_core_batch_size,
+                work_dir=config.out_of_core_work_dir,
+            ),
+        }
+
+    def fit_out_of_core(self, model, train_reader: NumpyArrayReader):
+        config = self.model_trainer_config
+        if isinstance(model, StreamingHistGradientBoostingClassifier):
+            os.makedirs(config.out_of_core_work_dir, exist_ok=True)
+            return model.fit_batches(train_reader.iter_chunks(config.out_of_core_batch_size))
+        # The transformed labels are 0/1
+        return fit_incremental(
+            model,
+            train_reader,
+            classes=np.array([0, 1]),
+            batch_size=config.out_of_core_batch_size,
+            epochs=config.out_of_core_epochs,
+            random_state=MODEL_TRAINER_RANDOM_STATE,
+        )
+
+    def train_model_out_of_core(self, train_reader: NumpyArrayReader, test_reader: NumpyArrayReader):
+        """
+        Trains every incremental learner on batches streamed from the memory-mapped
+        training array and scores it on the test array chunk by chunk, so no stage
+        holds more than a batch of rows in memory.
+        """
+        batch_size = self.model_trainer_config.out_of_core_batch_size
+        models = self.get_out_of_core_model_zoo()
+        model_report, model_timing_report, test_counts = {}, {}, {}
+
+        for name, model in models.items():
+            start_time = time.perf_counter()
+            with profile_stage(f"fit/{name}", rows=len(train_reader)):
+                self.fit_out_of_core(model, train_reader)
+            fit_seconds = time.perf_counter() - start_time
+
+            with profile_stage(f"predict/{name}", rows=len(test_reader)):
+                test_counts[name] = stream_confusion_counts(model, test_reader, batch_size)
+            model_report[name] = r2_from_counts(test_counts[name])
+            model_timing_report[name] = {
+                "strategy": "out_of_core",
+                "fits": 1,
+                "model_fits": 1,
+                "search_wall_seconds": round(fit_seconds, 3),
+                "search_fit_seconds": round(fit_seconds, 3),
+                "refit_seconds": 0.0,
+                "best_params": model.get_params(),
+            }
+            logging.info(f"{name}: test score {model_report[name]:.4f}, {model_timing_report[name]}")
+
+        self.track_candidates(model_report, model_timing_report)
+
+        best_model_name = max(model_report, key=model_report.get)
+        best_model = models[best_model_name]
+
+        with profile_stage(f"predict_train/{best_model_name}", rows=len(train_reader)):
+            train_counts = stream_confusion_counts(best_model, train_reader, batch_size)
+        classification_train_metric = get_classification_score_from_counts(**train_counts)
+        self.track_mflow(best_model, classification_train_metric, best_model_name, split="train")
+
+        classification_test_metric = get_classification_score_from_counts(**test_counts[best_model_name])
+        self.track_mflow(best_model, classification_test_metric, best_model_name, split="test")
+
+        # The compiled export is checked against the first test batch only
+        X_check, _ = next(test_reader.iter_chunks(batch_size))
+        return self.save_trained_model(
+            best_model, classification_train_metric, classification_test_metric, model_timing_report, X_check
+        )
+
     # ----------------------- Initiate Training -----------------------
     def initiate_model_trainer(self) -> ModelTrainerArtifact:
         try:
-            train_arr = load_numpy_array_data(
-                self.data_transformation_artifact.transformed_train_file_path
-            )
-            test_arr = load_numpy_array_data(
-                self.data_transformation_artifact.transformed_test_file_path
-            )
-
-            X_train, y_train = train_arr[:, :-1], train_arr[:, -1]
-            X_test, y_test = test_arr[:, :-1], test_arr[:, -1]
+            artifact = self.data_transformation_artifact
+            if self.model_trainer_config.out_of_core:
+                with profile_stage("read") as stage:
+                    train_reader = NumpyArrayReader(
+                        artifact.transformed_train_features_file_path, artifact.transformed_train_labels_file_path
+                    )
+                    test_reader = NumpyArrayReader(
+                        artifact.transformed_test_features_file_path, artifact.transformed_test_labels_file_path
+                    )
+                    stage["rows"] = len(train_reader) + len(test_reader)
+                record_rows(len(train_reader) + len(test_reader))
+                return self.train_model_out_of_core(train_reader, test_reader)
+
+            # Memory-mapped in their stored dtypes (int8 / float32 features, int8 labels);
+            # estimators convert the rows they fit on, nothing copies the whole matrix up front
+            with profile_stage("read") as stage:
+                X_train = load_numpy_array_data(artifact.transformed_train_features_file_path, mmap_mode="r")
+                y_train = load_numpy_array_data(artifact.transformed_train_labels_file_path, mmap_mode="r")
+                X_test = load_numpy_array_data(artifact.transformed_test_features_file_path, mmap_mode="r")
+                y_test = load_numpy_array_data(artifact.transformed_test_labels_file_path, mmap_mode="r")
+                stage["rows"] = len(y_train) + len(y_test)
+            record_rows(len(y_train) + len(y_test))
 
             return self.train_model(X_train, y_train, X_test, y_test)
 
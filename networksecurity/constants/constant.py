@@ -11,15 +11,77 @@ Defining common constant variable for training pipeline
 TARGET_COLUMN = "Result"
 PIPELINE_NAME: str = "networksecuritypipeline"
 ARTIFACT_DIR: str = "artifacts"
-FILE_NAME: str = "phisingdata.csv"
 
-TRAIN_FILE_NAME: str = "train.csv"
-TEST_FILE_NAME: str = "test.csv"
+# Format of every tabular stage artifact: "parquet" (int8 columns, compressed), "csv"
+# or "npz" (one uint64 per row, 2 bits per column, see networksecurity/utils/ternary.py)
+ARTIFACT_FILE_FORMAT: str = "parquet"
+ARTIFACT_PARQUET_COMPRESSION: str = "zstd"
+
+# Invalid rows and prediction outputs may hold values that do not pack, so they
+# fall back to parquet when the artifacts are packed
+UNPACKED_FILE_FORMAT: str = "parquet" if ARTIFACT_FILE_FORMAT == "npz" else ARTIFACT_FILE_FORMAT
+
+FILE_NAME: str = f"phisingdata.{ARTIFACT_FILE_FORMAT}"
+
+TRAIN_FILE_NAME: str = f"train.{ARTIFACT_FILE_FORMAT}"
+TEST_FILE_NAME: str = f"test.{ARTIFACT_FILE_FORMAT}"
 
 SCHEMA_FILE_PATH = os.path.join("data_schema", "schema.yaml")
 
 SAVED_MODEL_DIR = os.path.join("saved_models")
+FINAL_MODEL_DIR: str = "final_model"
+
+# Content-addressed reuse of stage artifacts across runs (see pipeline/stage_cache.py)
+STAGE_CACHE_ENABLED: bool = True
+STAGE_CACHE_DIR_NAME: str = "stage_cache"
+
+# Per-stage run report (utils/profiling.py): wall/CPU time, peak RSS, I/O bytes, rows
+PIPELINE_PROFILE_ENABLED: bool = True
+PIPELINE_PROFILE_DIR_NAME: str = "profile"
+PIPELINE_RUN_REPORT_FILE_NAME: str = "run_report.yaml"
+# Stage names (e.g. "model_trainer" or "model_trainer/search") to also run under cProfile
+PIPELINE_CPROFILE_STAGES: tuple = ()
+
 MODEL_FILE_NAME = "model.pkl"
+# Flat-array export of the trained estimator (utils/model/compiled.py)
+COMPILED_MODEL_FILE_NAME: str = "compiled_model.bundle"
+
+"""
+MongoDB connection related constant start with MONGO VAR NAME
+"""
+
+MONGODB_URL_KEY: str = "MONGODB_URL"
+MONGO_MAX_POOL_SIZE: int = 50
+MONGO_MIN_POOL_SIZE: int = 0
+MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 30000
+MONGO_RETRY_ATTEMPTS: int = 3
+MONGO_RETRY_BACKOFF_SECONDS: float = 0.5
+
+"""
+Data push (CSV -> MongoDB bulk load) related constant start with DATA_PUSH VAR NAME
+"""
+
+DATA_PUSH_CSV_CHUNK_SIZE: int = 50000
+DATA_PUSH_INSERT_BATCH_SIZE: int = 5000
+DATA_PUSH_MAX_WORKERS: int = 4
+DATA_PUSH_MAX_IN_FLIGHT_BATCHES: int = 8
+DATA_PUSH_ROW_HASH_FIELD: str = "row_hash"
+DUPLICATE_KEY_ERROR_CODE: int = 11000
+
+"""
+Synthetic data (load and scale testing) related constant start with SYNTHETIC_DATA VAR NAME
+"""
+
+SYNTHETIC_DATA_SOURCE_FILE_PATH: str = os.path.join("data", "phisingData.csv")
+SYNTHETIC_DATA_DIR_NAME: str = "synthetic_data"
+SYNTHETIC_DATA_FILE_NAME: str = f"synthetic.{ARTIFACT_FILE_FORMAT}"
+SYNTHETIC_DATA_COLLECTION_NAME: str = "synthetic"
+SYNTHETIC_DATA_CHUNK_SIZE: int = 100000
+SYNTHETIC_DATA_NUM_WORKERS: int = 4  # 0 generates in the calling process
+SYNTHETIC_DATA_MAX_IN_FLIGHT_CHUNKS: int = 8  # bounds memory: chunks generated ahead of the writer
+# Pseudo-rows pulling each P(feature | label, parent) towards P(feature | label)
+SYNTHETIC_DATA_SMOOTHING: float = 1.0
+SYNTHETIC_DATA_RANDOM_STATE: int = 42
 
 """
 Data Ingestion related constant start with data_ingestion VAR NAME
@@ -31,6 +93,14 @@ DATA_INTESTION_DIR_NAME: str = "data_ingestion"
 DATA_INGESTION_FEATURE_STORE_DIR: str = "feature_store"
 DATA_INGESTED_DIR: str = "ingested"
 DATA_INGESTION_TRAIN_TEST_SPLIT_RATION: float = 0.2
+DATA_INGESTION_RANDOM_STATE: int = 42
+DATA_INGESTION_BATCH_SIZE: int = 10000
+DATA_INGESTION_NUM_PARTITIONS: int = 4
+DATA_INGESTION_PARTITION_STRATEGY: str = "range"  # "range" or "sample"
+DATA_INGESTION_MODE: str = "incremental"  # "incremental" or "full"
+DATA_INGESTION_WATERMARK_FILE_NAME: str = "watermark.yaml"
+DATA_INGESTION_SHARED_FEATURE_STORE_NAME: str = "phisingdata"
+DATA_INGESTION_MAX_FEATURE_STORE_PARTS: int = 32
 
 """
 Data Validation related constant start with DATA_VALIDATION VAR NAME
@@ -39,8 +109,20 @@ Data Validation related constant start with DATA_VALIDATION VAR NAME
 DATA_VALIDATION_DIR_NAME: str = "data_validation"
 DATA_VALIDATION_VALID_DIR: str = "validated"
 DATA_VALIDATION_INVALID_DIR: str = "invalid"
+DATA_VALIDATION_INVALID_TRAIN_FILE_NAME: str = f"train.{UNPACKED_FILE_FORMAT}"
+DATA_VALIDATION_INVALID_TEST_FILE_NAME: str = f"test.{UNPACKED_FILE_FORMAT}"
 DATA_VALIDATION_DRIFT_REPORT_DIR: str = "drift_report"
 DATA_VALIDATION_REPORT_FILE_NAME: str = "report.yaml"
+DATA_VALIDATION_BASELINE_FILE_NAME: str = "baseline_histograms.npz"
+DATA_VALIDATION_SCHEMA_REPORT_FILE_NAME: str = "schema_report.yaml"
+
+# Rows per chunk of the streaming schema validator (bounds validation memory)
+DATA_VALIDATION_CHUNK_SIZE: int = 100000
+
+# Drift statistic that decides drift_detected: "chi2" (p-value below threshold),
+# "psi" or "js" (statistic above threshold); the report always holds all three
+DATA_VALIDATION_DRIFT_STATISTIC: str = "psi"
+DATA_VALIDATION_DRIFT_THRESHOLDS: dict = {"chi2": 0.05, "psi": 0.2, "js": 0.1}
 
 # Fixed missing "="
 PREPROCESSING_OBJECT_FILE_NAME = "preprocessing.pkl"
@@ -55,16 +137,22 @@ DATA_TRANSFORMATION_DIR_NAME: str = "data_transformation"
 DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR: str = "transformed"
 DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR: str = "transformed_object"
 
-# Imputer parameters for KNNImputer
+# Imputer parameters for TernaryImputer (networksecurity/utils/model/imputer.py)
+# strategy: "knn" (bucketed nearest patterns), "mode" or "conditional_mode"
 DATA_TRANSFORMATION_IMPUTER_PARAMS: dict = {
+    "strategy": "knn",
     "missing_values": np.nan,
-    "n_neighbors": 3,  # Correct spelling
-    "weights": "uniform",
+    "n_neighbors": 3,
 }
 
-# File names for transformed arrays
-DATA_TRANSFORMATION_TRAIN_FILE_PATH: str = "train.npy"
-DATA_TRANSFORMATION_TEST_FILE_PATH: str = "test.npy"
+# Transformed arrays: features and labels are separate .npy files that the trainer
+# memory-maps. Features are int8 while every value is in {-1, 0, 1} and float32 once an
+# imputed value is fractional (knn); labels are int8
+DATA_TRANSFORMATION_TRAIN_FEATURES_FILE_NAME: str = "train_X.npy"
+DATA_TRANSFORMATION_TRAIN_LABELS_FILE_NAME: str = "train_y.npy"
+DATA_TRANSFORMATION_TEST_FEATURES_FILE_NAME: str = "test_X.npy"
+DATA_TRANSFORMATION_TEST_LABELS_FILE_NAME: str = "test_y.npy"
+DATA_TRANSFORMATION_CHUNK_SIZE: int = 100000  # rows imputed and written at a time
 
 """
 Model Trainer related constant start with MODAL TRAINER VAR NAME
@@ -75,5 +163,78 @@ MODEL_TRAINER_TRAINED_MODEL_DIR: str = "trained_model"
 MODEL_TRAINER_TRAINED_MODEL_NAME: str = ("model.pkl",)
 MODEL_TRAINER_EXPRECTED_SCORE: float = 0.6
 MODEL_TRAINER_OVER_FITTING_UNDER_FITTING_THRESHOLD: float = 0.05
+MODEL_TRAINER_CV_FOLDS: int = 3
+MODEL_TRAINER_N_JOBS: int = -1  # one worker process per CPU
+MODEL_TRAINER_RANDOM_STATE: int = 42
+
+# Hyperparameter search: "grid", "random" or "halving" (successive halving)
+MODEL_TRAINER_SEARCH_STRATEGY: str = "grid"
+MODEL_TRAINER_SEARCH_BUDGET_SECONDS: float = None  # None = no time limit
+MODEL_TRAINER_RANDOM_SEARCH_ITERATIONS: int = 10
+MODEL_TRAINER_HALVING_FACTOR: int = 3
+MODEL_TRAINER_HALVING_RESOURCE: str = "n_samples"  # "n_samples" or "n_estimators"
+MODEL_TRAINER_HALVING_MIN_SAMPLES: int = 500
+MODEL_TRAINER_EARLY_STOPPING_ROUNDS: int = 10  # boosting stops after this many non-improving stages
+# Score n_estimators sweeps from one fit of the largest ensemble, warm-start C sweeps
+MODEL_TRAINER_WARM_START_SEARCH: bool = True
+
+# Model zoo tier: "full" searches every family, "fast" only the fast families below,
+# with the search capped at MODEL_TRAINER_FAST_TIER_BUDGET_SECONDS
+MODEL_TRAINER_MODEL_TIER: str = "full"
+MODEL_TRAINER_FAST_TIER_MODELS: tuple = ("Hist Gradient Boosting", "Logistic Regression", "Decision Tree")
+MODEL_TRAINER_FAST_TIER_BUDGET_SECONDS: float = 60.0
+MODEL_TRAINER_HIST_BOOSTING_MAX_ITER: int = 300  # cap; early stopping usually ends well before
+
+# Out-of-core training (utils/model/out_of_core.py): the transformed arrays are memory-mapped
+# and streamed in batches to incremental learners instead of the in-memory model zoo
+MODEL_TRAINER_OUT_OF_CORE: bool = False
+MODEL_TRAINER_OUT_OF_CORE_BATCH_SIZE: int = 65536
+MODEL_TRAINER_OUT_OF_CORE_EPOCHS: int = 5  # passes of the partial_fit learners
+MODEL_TRAINER_OUT_OF_CORE_BOOSTING_ROUNDS: int = 100
+MODEL_TRAINER_OUT_OF_CORE_BOOSTING_MAX_DEPTH: int = 3
+MODEL_TRAINER_OUT_OF_CORE_BOOSTING_LEARNING_RATE: float = 0.1
+MODEL_TRAINER_OUT_OF_CORE_WORK_DIR_NAME: str = "out_of_core"
+
+# Experiment tracking (utils/tracking.py): "local" (MLflow on MODEL_TRAINER_TRACKING_URI,
+# works offline), "dagshub" (MLflow on the DagsHub repo below) or "none"
+MODEL_TRAINER_TRACKING_BACKEND: str = "local"
+MODEL_TRAINER_TRACKING_URI: str = "sqlite:///mlflow.db"
+MODEL_TRAINER_EXPERIMENT_NAME: str = "networksecurity"
+MODEL_TRAINER_DAGSHUB_REPO: tuple = ("mohammadshuaib07866", "Machine-Learning-End-To-End-Project")
+# Longest the process waits at exit for queued runs to be written
+MODEL_TRAINER_TRACKING_EXIT_TIMEOUT_SECONDS: float = 30.0
+
 
 
+"""
+Batch Prediction related constant start with PREDICTION VAR NAME
+"""
+
+PREDICTION_DIR_NAME: str = "prediction_output"
+PREDICTION_FILE_NAME: str = f"predictions.{UNPACKED_FILE_FORMAT}"
+PREDICTION_COLUMN_NAME: str = "predicted_column"
+PREDICTION_OUTPUT_COLLECTION_NAME: str = "predictions"
+PREDICTION_CHUNK_SIZE: int = 50000
+PREDICTION_NUM_WORKERS: int = 4  # 0 scores in the calling process
+PREDICTION_MAX_IN_FLIGHT_CHUNKS: int = 8  # bounds memory: chunks read ahead of the writer
+# On 50k-row chunks sklearn's compiled tree loops outrun the NumPy engine for deep forests
+PREDICTION_USE_COMPILED_MODEL: bool = False
+# Per-worker cache of predictions keyed by the packed feature row; 0 disables it
+PREDICTION_CACHE_SIZE: int = 100000
+PREDICTION_CACHE_POLICY: str = "lru"  # "lru" or "lfu"
+
+"""
+Prediction service (app.py) related constant start with SERVING VAR NAME
+"""
+
+SERVING_HOST: str = "0.0.0.0"
+SERVING_PORT: int = 8000
+# Concurrent single-row requests are merged into one predict call of up to this many rows,
+# waiting at most this long for the batch to fill
+SERVING_MAX_BATCH_SIZE: int = 64
+SERVING_MAX_WAIT_MS: float = 2.0
+# Serve from compiled_model.bundle when present: per-call overhead dominates small batches
+SERVING_USE_COMPILED_MODEL: bool = True
+# Repeated feature rows are answered from a cache of this many predictions; 0 disables it
+SERVING_CACHE_SIZE: int = 100000
+SERVING_CACHE_POLICY: str = "lru"  # "lru" or "lfu"
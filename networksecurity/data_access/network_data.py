@@ -0,0 +1,191 @@
+import sys
+import numpy as np
+import pandas as pd
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+from networksecurity.configuration.mongo_db_connection import MongoDBClient
+from networksecurity.utils.columnar import ColumnarBuffer
+
+SAMPLES_PER_PARTITION = 32
+
+
+class NetworkData:
+    """
+    Reads the network data collection from MongoDB into a typed dataframe.
+    The collection is split into _id ranges that are read concurrently on a
+    thread pool (pymongo clients are thread-safe) and joined back in _id order.
+    """
+
+    def __init__(self, mongo_client: MongoDBClient = None):
+        try:
+            self.mongo_client = mongo_client or MongoDBClient()
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    @staticmethod
+    def _range_boundaries(collection, query: dict, num_partitions: int, total: int) -> list:
+        """Exact _id split points found by skipping along the _id index."""
+        boundaries = []
+        for i in range(1, num_partitions):
+            document = next(
+                collection.find(query, {"_id": 1})
+                .sort("_id", 1)
+                .skip(i * total // num_partitions)
+                .limit(1),
+                None,
+            )
+            if document is not None:
+                boundaries.append(document["_id"])
+        return boundaries
+
+    @staticmethod
+    def _sample_boundaries(collection, query: dict, num_partitions: int) -> list:
+        """Approximate _id split points taken from the quantiles of a $sample."""
+        pipeline = [
+            {"$match": query},
+            {"$sample": {"size": num_partitions * SAMPLES_PER_PARTITION}},
+            {"$project": {"_id": 1}},
+        ]
+        sample_ids = sorted(document["_id"] for document in collection.aggregate(pipeline))
+        if not sample_ids:
+            return []
+
+        positions = np.linspace(0, len(sample_ids), num_partitions + 1)[1:-1].astype(int)
+        return [sample_ids[position] for position in positions]
+
+    def get_partitions(self, collection, query: dict, num_partitions: int, strategy: str) -> tuple:
+        """
+        Returns (partitions, total): _id range filters in _id order that together
+        cover the query, and the number of matching documents.
+        """
+        try:
+            total = collection.count_documents(query) if query else collection.estimated_document_count()
+            num_partitions = max(1, min(num_partitions, total))
+
+            if num_partitions == 1:
+                boundaries = []
+            elif strategy == "range":
+                boundaries = self._range_boundaries(collection, query, num_partitions, total)
+            elif strategy == "sample":
+                boundaries = self._sample_boundaries(collection, query, num_partitions)
+            else:
+                raise ValueError(f"Unknown partition strategy: {strategy}")
+
+            # Duplicate sample points would produce empty ranges
+            boundaries = sorted(set(boundaries))
+
+            edges = [None] + boundaries + [None]
+            partitions = []
+            for lower, upper in zip(edges[:-1], edges[1:]):
+                id_filter = {}
+                if lower is not None:
+                    id_filter["$gte"] = lower
+                if upper is not None:
+                    id_filter["$lt"] = upper
+                partition = dict(query)
+                if id_filter:
+                    partition["_id"] = {**query.get("_id", {}), **id_filter}
+                partitions.append(partition)
+
+            logging.info(f"Split {total} documents into {len(partitions)} partitions ({strategy})")
+            return partitions, total
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def get_max_id(self, database_name: str, collection_name: str, query: dict = None):
+        """
+        Returns the largest _id matching the query, or None when nothing matches.
+        """
+        try:
+            collection = self.mongo_client.get_collection(database_name, collection_name)
+            document = next(
+                collection.find(query or {}, {"_id": 1}).sort("_id", -1).limit(1), None
+            )
+            return None if document is None else document["_id"]
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    @staticmethod
+    def read_partition(collection, query: dict, dtypes: dict, batch_size: int, capacity: int = 0) -> pd.DataFrame:
+        """
+        Streams one partition through a batched cursor into preallocated columns.
+        """
+        projection = {"_id": 0, **{column: 1 for column in dtypes}}
+        buffer = ColumnarBuffer(dtypes, capacity=capacity)
+
+        cursor = collection.find(query, projection, batch_size=batch_size)
+        while True:
+            documents = list(islice(cursor, batch_size))
+            if not documents:
+                break
+            buffer.append(documents)
+
+        return buffer.to_dataframe()
+
+    def iter_collection_chunks(
+        self,
+        database_name: str,
+        collection_name: str,
+        dtypes: dict,
+        chunk_size: int,
+        query: dict = None,
+    ):
+        """
+        Streams the matching documents as (dataframe, ids) chunks of at most chunk_size rows,
+        so a collection of any size can be processed with bounded memory.
+        """
+        try:
+            collection = self.mongo_client.get_collection(database_name, collection_name)
+            projection = {column: 1 for column in dtypes}
+            cursor = collection.find(query or {}, projection, batch_size=chunk_size)
+
+            while True:
+                documents = list(islice(cursor, chunk_size))
+                if not documents:
+                    break
+                buffer = ColumnarBuffer(dtypes, capacity=len(documents))
+                buffer.append(documents)
+                yield buffer.to_dataframe(), [document["_id"] for document in documents]
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def export_collection_as_dataframe(
+        self,
+        database_name: str,
+        collection_name: str,
+        dtypes: dict,
+        batch_size: int,
+        num_partitions: int = 1,
+        strategy: str = "range",
+        query: dict = None,
+    ) -> pd.DataFrame:
+        try:
+            query = query or {}
+            collection = self.mongo_client.get_collection(database_name, collection_name)
+
+            partitions, total = self.get_partitions(collection, query, num_partitions, strategy)
+            capacity = total // len(partitions) + 1
+
+            def read(partition):
+                return MongoDBClient.run_with_retry(
+                    self.read_partition, collection, partition, dtypes, batch_size, capacity
+                )
+
+            if len(partitions) == 1:
+                frames = [read(partitions[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=len(partitions)) as executor:
+                    # map() yields results in submission order, i.e. _id order
+                    frames = list(executor.map(read, partitions))
+
+            if len(frames) == 1:
+                return frames[0]
+
+            return pd.concat(frames, ignore_index=True)
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
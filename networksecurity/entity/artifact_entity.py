@@ -15,13 +15,16 @@ class DataValidationArtifact:
     invalid_train_file_path: str
     invalid_test_file_path: str
     drift_report_file_path: str
+    drift_baseline_file_path: str = None
 
 
 @dataclass
 class DataTransformationArtifact:
     transformed_object_file_path: str
-    transformed_train_file_path: str
-    transformed_test_file_path: str
+    transformed_train_features_file_path: str
+    transformed_train_labels_file_path: str
+    transformed_test_features_file_path: str
+    transformed_test_labels_file_path: str
 
 
 @dataclass
@@ -36,3 +39,4 @@ class ModelTrainerArtifact:
     trained_model_file_path: str
     train_metric_artifact: ClassificationMetricArtifact
     test_metric_artifact: ClassificationMetricArtifact
+    model_timing_report: dict = None
@@ -14,7 +14,10 @@ class TrainingPipelineConfig:
         self.pipeline_name = PIPELINE_NAME
         self.artifact_name = ARTIFACT_DIR
         self.artifact_dir = os.path.join(self.artifact_name, timestamp)
-        self.model_dir = os.path.join("final_model")
+        self.model_dir = os.path.join(FINAL_MODEL_DIR)
+        self.stage_cache_dir = os.path.join(self.artifact_name, STAGE_CACHE_DIR_NAME)
+        self.profile_dir = os.path.join(self.artifact_dir, PIPELINE_PROFILE_DIR_NAME)
+        self.run_report_file_path = os.path.join(self.profile_dir, PIPELINE_RUN_REPORT_FILE_NAME)
         self.timestamp = timestamp
 
 
@@ -31,6 +34,18 @@ class DataIngestionConfig:
             self.data_ingestion_dir, DATA_INGESTION_FEATURE_STORE_DIR, FILE_NAME
         )
 
+        # Shared feature store that incremental runs append to → artifacts/feature_store
+        self.shared_feature_store_dir = os.path.join(
+            training_pipeline_config.artifact_name, DATA_INGESTION_FEATURE_STORE_DIR
+        )
+        # Directory of appended part files: artifacts/feature_store/phisingdata/part-00000.parquet
+        self.shared_feature_store_parts_dir = os.path.join(
+            self.shared_feature_store_dir, DATA_INGESTION_SHARED_FEATURE_STORE_NAME
+        )
+        self.watermark_file_path = os.path.join(
+            self.shared_feature_store_dir, DATA_INGESTION_WATERMARK_FILE_NAME
+        )
+
         # Train-test split output folder
         self.training_file_path = os.path.join(
             self.data_ingestion_dir, DATA_INGESTED_DIR, TRAIN_FILE_NAME
@@ -42,8 +57,14 @@ class DataIngestionConfig:
 
         # Other settings
         self.train_test_split_ratio = DATA_INGESTION_TRAIN_TEST_SPLIT_RATION
+        self.random_state = DATA_INGESTION_RANDOM_STATE
         self.collection_name = DATA_INGESTION_COLLECTION_NAME
         self.database_name = DATA_INGESTION_DATABASE_NAME
+        self.batch_size = DATA_INGESTION_BATCH_SIZE
+        self.num_partitions = DATA_INGESTION_NUM_PARTITIONS
+        self.partition_strategy = DATA_INGESTION_PARTITION_STRATEGY
+        self.ingestion_mode = DATA_INGESTION_MODE
+        self.max_feature_store_parts = DATA_INGESTION_MAX_FEATURE_STORE_PARTS
 
 
 class DataValidationConfig:
@@ -64,16 +85,29 @@ class DataValidationConfig:
             self.valid_data_dir, TEST_FILE_NAME
         )
         self.invalid_train_file_path: str = os.path.join(
-            self.invalid_data_dir, TRAIN_FILE_NAME
+            self.invalid_data_dir, DATA_VALIDATION_INVALID_TRAIN_FILE_NAME
         )
         self.invalid_test_file_path: str = os.path.join(
-            self.invalid_data_dir, TEST_FILE_NAME
+            self.invalid_data_dir, DATA_VALIDATION_INVALID_TEST_FILE_NAME
         )
         self.drift_report_file_path: str = os.path.join(
             self.data_validation_dir,
             DATA_VALIDATION_DRIFT_REPORT_DIR,
             DATA_VALIDATION_REPORT_FILE_NAME,
         )
+        self.drift_baseline_file_path: str = os.path.join(
+            self.data_validation_dir,
+            DATA_VALIDATION_DRIFT_REPORT_DIR,
+            DATA_VALIDATION_BASELINE_FILE_NAME,
+        )
+        self.schema_report_file_path: str = os.path.join(
+            self.data_validation_dir,
+            DATA_VALIDATION_DRIFT_REPORT_DIR,
+            DATA_VALIDATION_SCHEMA_REPORT_FILE_NAME,
+        )
+        self.chunk_size: int = DATA_VALIDATION_CHUNK_SIZE
+        self.drift_statistic: str = DATA_VALIDATION_DRIFT_STATISTIC
+        self.drift_threshold: float = DATA_VALIDATION_DRIFT_THRESHOLDS[DATA_VALIDATION_DRIFT_STATISTIC]
 
 
 class DataTransformationConfig:
@@ -81,21 +115,25 @@ class DataTransformationConfig:
         self.data_transformation_dir: str = os.path.join(
             training_pipeline_config.artifact_dir, DATA_TRANSFORMATION_DIR_NAME
         )
-        self.transformed_train_file_path: str = os.path.join(
-            self.data_transformation_dir,
-            DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,
-            TRAIN_FILE_NAME.replace("csv", "npy"),
+        transformed_data_dir = os.path.join(self.data_transformation_dir, DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR)
+        self.transformed_train_features_file_path: str = os.path.join(
+            transformed_data_dir, DATA_TRANSFORMATION_TRAIN_FEATURES_FILE_NAME
         )
-        self.transformed_test_file_path: str = os.path.join(
-            self.data_transformation_dir,
-            DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,
-            TEST_FILE_NAME.replace("csv", "npy"),
+        self.transformed_train_labels_file_path: str = os.path.join(
+            transformed_data_dir, DATA_TRANSFORMATION_TRAIN_LABELS_FILE_NAME
+        )
+        self.transformed_test_features_file_path: str = os.path.join(
+            transformed_data_dir, DATA_TRANSFORMATION_TEST_FEATURES_FILE_NAME
+        )
+        self.transformed_test_labels_file_path: str = os.path.join(
+            transformed_data_dir, DATA_TRANSFORMATION_TEST_LABELS_FILE_NAME
         )
         self.transformed_object_file_path: str = os.path.join(
             self.data_transformation_dir,
             DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR,
             PREPROCESSING_OBJECT_FILE_NAME,
         )
+        self.chunk_size: int = DATA_TRANSFORMATION_CHUNK_SIZE
 
 
 class ModelTrainerConfig:
@@ -106,7 +144,77 @@ class ModelTrainerConfig:
         self.trained_model_file_path: str = os.path.join(
             self.model_trainer_dir, MODEL_TRAINER_TRAINED_MODEL_DIR, MODEL_FILE_NAME
         )
+        self.compiled_model_file_path: str = os.path.join(
+            training_pipeline_config.model_dir, COMPILED_MODEL_FILE_NAME
+        )
         self.expected_accuracy: float = MODEL_TRAINER_EXPRECTED_SCORE
         self.overfitting_underfitting_thresold = (
             MODEL_TRAINER_OVER_FITTING_UNDER_FITTING_THRESHOLD
         )
+        self.search_strategy: str = MODEL_TRAINER_SEARCH_STRATEGY
+        self.search_budget_seconds: float = MODEL_TRAINER_SEARCH_BUDGET_SECONDS
+        self.random_search_iterations: int = MODEL_TRAINER_RANDOM_SEARCH_ITERATIONS
+        self.halving_factor: int = MODEL_TRAINER_HALVING_FACTOR
+        self.halving_resource: str = MODEL_TRAINER_HALVING_RESOURCE
+        self.halving_min_samples: int = MODEL_TRAINER_HALVING_MIN_SAMPLES
+        self.early_stopping_rounds: int = MODEL_TRAINER_EARLY_STOPPING_ROUNDS
+        self.warm_start_search: bool = MODEL_TRAINER_WARM_START_SEARCH
+        self.model_tier: str = MODEL_TRAINER_MODEL_TIER
+        self.fast_tier_models: tuple = MODEL_TRAINER_FAST_TIER_MODELS
+        self.fast_tier_budget_seconds: float = MODEL_TRAINER_FAST_TIER_BUDGET_SECONDS
+        self.hist_boosting_max_iter: int = MODEL_TRAINER_HIST_BOOSTING_MAX_ITER
+        self.tracking_backend: str = MODEL_TRAINER_TRACKING_BACKEND
+        self.tracking_uri: str = MODEL_TRAINER_TRACKING_URI
+        self.experiment_name: str = MODEL_TRAINER_EXPERIMENT_NAME
+        self.dagshub_repo: tuple = MODEL_TRAINER_DAGSHUB_REPO
+        self.tracking_exit_timeout: float = MODEL_TRAINER_TRACKING_EXIT_TIMEOUT_SECONDS
+        self.out_of_core: bool = MODEL_TRAINER_OUT_OF_CORE
+        self.out_of_core_batch_size: int = MODEL_TRAINER_OUT_OF_CORE_BATCH_SIZE
+        self.out_of_core_epochs: int = MODEL_TRAINER_OUT_OF_CORE_EPOCHS
+        self.out_of_core_boosting_rounds: int = MODEL_TRAINER_OUT_OF_CORE_BOOSTING_ROUNDS
+        self.out_of_core_boosting_max_depth: int = MODEL_TRAINER_OUT_OF_CORE_BOOSTING_MAX_DEPTH
+        self.out_of_core_boosting_learning_rate: float = MODEL_TRAINER_OUT_OF_CORE_BOOSTING_LEARNING_RATE
+        self.out_of_core_work_dir: str = os.path.join(self.model_trainer_dir, MODEL_TRAINER_OUT_OF_CORE_WORK_DIR_NAME)
+
+
+class BatchPredictionConfig:
+    def __init__(self, timestamp=None):
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        timestamp = timestamp.strftime("%m_%d_%Y_%H_%M_%S")
+
+        self.model_dir: str = FINAL_MODEL_DIR
+        self.preprocessor_file_path: str = os.path.join(self.model_dir, PREPROCESSING_OBJECT_FILE_NAME)
+        self.model_file_path: str = os.path.join(self.model_dir, MODEL_FILE_NAME)
+        self.compiled_model_file_path: str = os.path.join(self.model_dir, COMPILED_MODEL_FILE_NAME)
+        self.use_compiled_model: bool = PREDICTION_USE_COMPILED_MODEL
+        self.cache_size: int = PREDICTION_CACHE_SIZE
+        self.cache_policy: str = PREDICTION_CACHE_POLICY
+        self.prediction_dir: str = os.path.join(PREDICTION_DIR_NAME, timestamp)
+        self.prediction_file_path: str = os.path.join(self.prediction_dir, PREDICTION_FILE_NAME)
+        self.prediction_column: str = PREDICTION_COLUMN_NAME
+        self.database_name: str = DATA_INGESTION_DATABASE_NAME
+        self.output_collection_name: str = PREDICTION_OUTPUT_COLLECTION_NAME
+        self.chunk_size: int = PREDICTION_CHUNK_SIZE
+        self.num_workers: int = PREDICTION_NUM_WORKERS
+        self.max_in_flight: int = PREDICTION_MAX_IN_FLIGHT_CHUNKS
+
+
+class SyntheticDataConfig:
+    def __init__(self, timestamp=None):
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        timestamp = timestamp.strftime("%m_%d_%Y_%H_%M_%S")
+
+        self.source_file_path: str = SYNTHETIC_DATA_SOURCE_FILE_PATH
+        self.synthetic_data_dir: str = os.path.join(SYNTHETIC_DATA_DIR_NAME, timestamp)
+        self.synthetic_data_file_path: str = os.path.join(self.synthetic_data_dir, SYNTHETIC_DATA_FILE_NAME)
+        self.database_name: str = DATA_INGESTION_DATABASE_NAME
+        self.collection_name: str = SYNTHETIC_DATA_COLLECTION_NAME
+        self.chunk_size: int = SYNTHETIC_DATA_CHUNK_SIZE
+        self.num_workers: int = SYNTHETIC_DATA_NUM_WORKERS
+        self.max_in_flight: int = SYNTHETIC_DATA_MAX_IN_FLIGHT_CHUNKS
+        self.smoothing: float = SYNTHETIC_DATA_SMOOTHING
+        self.random_state: int = SYNTHETIC_DATA_RANDOM_STATE
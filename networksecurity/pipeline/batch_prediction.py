@@ -0,0 +1,236 @@
+import sys
+import time
+import resource
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+from networksecurity.constants.constant import SCHEMA_FILE_PATH, TARGET_COLUMN
+from networksecurity.entity.config_entity import BatchPredictionConfig
+from networksecurity.configuration.mongo_db_connection import MongoDBClient
+from networksecurity.data_access.network_data import NetworkData
+from networksecurity.utils.model.estimator import load_network_model, get_model_version
+from networksecurity.utils.model.prediction_cache import PredictionCache, CachedNetworkModel
+from networksecurity.utils.common import (
+    read_yaml_file,
+    get_schema_dtypes,
+)
+from networksecurity.utils.columnar import iter_dataframe_chunks, ChunkedDataFrameWriter
+
+# Model loaded once per worker process by _init_worker
+_worker_model = None
+
+
+def _init_worker(
+    preprocessor_file_path: str,
+    model_file_path: str,
+    compiled_model_file_path: str = None,
+    cache_size: int = 0,
+    cache_policy: str = "lru",
+) -> None:
+    global _worker_model
+    model_paths = (preprocessor_file_path, model_file_path, compiled_model_file_path)
+    _worker_model = load_network_model(*model_paths)
+    if cache_size > 0:
+        _worker_model = CachedNetworkModel(
+            _worker_model, PredictionCache(cache_size, cache_policy), get_model_version(*model_paths)
+        )
+
+
+def _predict_chunk(features):
+    return _worker_model.predict(features)
+
+
+class BatchPrediction:
+    """
+    Streams an input file (CSV / parquet) or MongoDB collection in chunks of
+    chunk_size rows and scores the chunks on a pool of worker processes, each of
+    which loads final_model/ once and caches the predictions of repeated feature
+    rows. Predictions are written as chunks complete, in input order: appended to
+    an output file, or inserted into an output collection with unordered bulk
+    writes. At most max_in_flight chunks are held in memory.
+    """
+
+    def __init__(self, batch_prediction_config: BatchPredictionConfig = None, mongo_client: MongoDBClient = None):
+        try:
+            self.batch_prediction_config = batch_prediction_config or BatchPredictionConfig()
+            self.mongo_client = mongo_client
+            self.dtypes = get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH))
+            self.feature_columns = [column for column in self.dtypes if column != TARGET_COLUMN]
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def get_mongo_client(self) -> MongoDBClient:
+        if self.mongo_client is None:
+            self.mongo_client = MongoDBClient()
+        return self.mongo_client
+
+    def iter_input_chunks(self, input_file_path: str = None, input_collection: str = None, query: dict = None):
+        """Yields (dataframe, ids) chunks; ids are the source _ids for a collection, else None."""
+        chunk_size = self.batch_prediction_config.chunk_size
+
+        if input_file_path is not None:
+            for chunk in iter_dataframe_chunks(input_file_path, chunk_size):
+                yield chunk, None
+        else:
+            network_data = NetworkData(mongo_client=self.get_mongo_client())
+            yield from network_data.iter_collection_chunks(
+                self.batch_prediction_config.database_name,
+                input_collection,
+                {column: dtype for column, dtype in self.dtypes.items() if column in self.feature_columns},
+                chunk_size,
+                query=query,
+            )
+
+    def write_to_collection(self, collection, chunk, ids, totals: dict) -> None:
+        """Unordered bulk insert; with a collection source the output reuses the source _id."""
+        columns = list(chunk.columns)
+        # object dtype turns numpy scalars into Python ints/floats for BSON
+        rows = chunk.to_numpy(dtype=object).tolist()
+        documents = [dict(zip(columns, row)) for row in rows]
+        if ids is not None:
+            for document, source_id in zip(documents, ids):
+                document["_id"] = source_id
+
+        inserted, skipped, failed = MongoDBClient.run_with_retry(
+            MongoDBClient.insert_unordered, collection, documents
+        )
+        totals["inserted"] += inserted
+        totals["skipped"] += skipped
+        totals["failed"] += failed
+
+    def predict(
+        self,
+        input_file_path: str = None,
+        input_collection: str = None,
+        output_file_path: str = None,
+        output_collection: str = None,
+        query: dict = None,
+    ) -> dict:
+        """
+        Scores the input and writes predictions to output_file_path or output_collection
+        (defaults: the config prediction file). Returns rows, seconds, rows/sec and peak RSS.
+        """
+        try:
+            config = self.batch_prediction_config
+            if (input_file_path is None) == (input_collection is None):
+                raise ValueError("Pass exactly one of input_file_path / input_collection")
+            if output_file_path is None and output_collection is None:
+                output_file_path = config.prediction_file_path
+
+            writer = ChunkedDataFrameWriter(output_file_path) if output_file_path else None
+            collection = (
+                self.get_mongo_client().get_collection(config.database_name, output_collection)
+                if output_collection
+                else None
+            )
+            totals = {"inserted": 0, "skipped": 0, "failed": 0}
+            rows = 0
+
+            def write(chunk, ids, predictions):
+                chunk = chunk.reset_index(drop=True)
+                chunk[config.prediction_column] = predictions
+                if writer is not None:
+                    writer.write(chunk)
+                if collection is not None:
+                    self.write_to_collection(collection, chunk, ids, totals)
+
+            start_time = time.perf_counter()
+
+            worker_args = (
+                config.preprocessor_file_path,
+                config.model_file_path,
+                config.compiled_model_file_path if config.use_compiled_model else None,
+                config.cache_size,
+                config.cache_policy,
+            )
+            if config.num_workers > 0:
+                executor = ProcessPoolExecutor(
+                    max_workers=config.num_workers,
+                    initializer=_init_worker,
+                    initargs=worker_args,
+                )
+            else:
+                _init_worker(*worker_args)
+                executor = None
+
+            try:
+                # Futures are drained in submission order, so output rows keep input order
+                in_flight = deque()
+                for chunk, ids in self.iter_input_chunks(input_file_path, input_collection, query):
+                    features = chunk[self.feature_columns].to_numpy()
+                    if executor is None:
+                        write(chunk, ids, _predict_chunk(features))
+                    else:
+                        in_flight.append((chunk, ids, executor.submit(_predict_chunk, features)))
+                        if len(in_flight) >= config.max_in_flight:
+                            pending_chunk, pending_ids, future = in_flight.popleft()
+                            write(pending_chunk, pending_ids, future.result())
+                    rows += len(chunk)
+
+                while in_flight:
+                    pending_chunk, pending_ids, future = in_flight.popleft()
+                    write(pending_chunk, pending_ids, future.result())
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+                if writer is not None:
+                    writer.close()
+
+            elapsed = time.perf_counter() - start_time
+            # ru_maxrss is in KB on Linux; children are the (joined) worker processes
+            summary = {
+                "rows": rows,
+                "seconds": round(elapsed, 3),
+                "rows_per_sec": round(rows / max(elapsed, 1e-9), 1),
+                "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+                "peak_worker_rss_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+                "output_file_path": output_file_path,
+                "output_collection": output_collection,
+            }
+            if collection is not None:
+                summary.update(totals)
+
+            logging.info(f"Batch prediction finished: {summary}")
+            return summary
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+
+if __name__ == "__main__":
+    try:
+        parser = argparse.ArgumentParser(description="Score a file or MongoDB collection with final_model/")
+        source = parser.add_mutually_exclusive_group(required=True)
+        source.add_argument("--input", help="CSV or parquet file to score")
+        source.add_argument("--input-collection", help="collection in the network data database")
+        parser.add_argument("--output", help="CSV or parquet output (default: prediction_output/<timestamp>/)")
+        parser.add_argument("--output-collection", help="write predictions to this collection instead")
+        parser.add_argument("--chunk-size", type=int, default=None)
+        parser.add_argument("--workers", type=int, default=None, help="0 scores in this process")
+        parser.add_argument("--compiled", action="store_true", help="score with final_model/compiled_model.bundle")
+        parser.add_argument("--cache-size", type=int, default=None, help="per-worker prediction cache, 0 disables")
+        args = parser.parse_args()
+
+        batch_prediction_config = BatchPredictionConfig()
+        if args.chunk_size is not None:
+            batch_prediction_config.chunk_size = args.chunk_size
+        if args.workers is not None:
+            batch_prediction_config.num_workers = args.workers
+        if args.compiled:
+            batch_prediction_config.use_compiled_model = True
+        if args.cache_size is not None:
+            batch_prediction_config.cache_size = args.cache_size
+
+        summary = BatchPrediction(batch_prediction_config).predict(
+            input_file_path=args.input,
+            input_collection=args.input_collection,
+            output_file_path=args.output,
+            output_collection=args.output_collection,
+        )
+        print(summary)
+
+    except Exception as e:
+        logging.error("Error occurred while running batch prediction.")
+        raise NetworkSecurityException(e, sys.exc_info())
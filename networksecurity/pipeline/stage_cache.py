@@ -0,0 +1,134 @@
+import os
+import sys
+import shutil
+import hashlib
+import dataclasses
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+from networksecurity.utils.common import save_object, load_object
+
+HASH_BLOCK_SIZE = 1 << 20
+ARTIFACT_OBJECT_FILE_NAME = "artifact.pkl"
+CACHED_FILES_DIR_NAME = "files"
+SIDE_FILES_DIR_NAME = "side_files"
+
+
+class StageCache:
+    """
+    Content-addressed cache of pipeline stage outputs.
+    A stage is keyed by the hash of its upstream artifact files, its config
+    (minus the per-run artifact paths) and the source of the code it runs.
+    Entries live in <cache_dir>/<stage_name>/<key>/ and are never modified
+    once written, so a hit can point the returned artifact straight at them.
+    """
+
+    def __init__(self, cache_dir: str, artifact_dir: str):
+        self.cache_dir = cache_dir
+        self.artifact_dir = artifact_dir
+
+    @staticmethod
+    def _hash_file(hasher, file_path: str) -> None:
+        with open(file_path, "rb") as file_obj:
+            for block in iter(lambda: file_obj.read(HASH_BLOCK_SIZE), b""):
+                hasher.update(block)
+
+    @staticmethod
+    def artifact_file_fields(artifact) -> dict:
+        """Top-level artifact fields that point at existing files."""
+        return {
+            field.name: getattr(artifact, field.name)
+            for field in dataclasses.fields(artifact)
+            if isinstance(getattr(artifact, field.name), str)
+            and os.path.isfile(getattr(artifact, field.name))
+        }
+
+    def fingerprint(self, stage_name: str, upstream_artifact, config, code_files: list) -> str:
+        try:
+            hasher = hashlib.sha256(stage_name.encode())
+
+            if upstream_artifact is not None:
+                for name, file_path in sorted(self.artifact_file_fields(upstream_artifact).items()):
+                    hasher.update(name.encode())
+                    self._hash_file(hasher, file_path)
+
+            # Paths under the timestamped artifact dir differ on every run by design
+            settings = {
+                name: value
+                for name, value in vars(config).items()
+                if not (isinstance(value, str) and value.startswith(self.artifact_dir))
+            }
+            hasher.update(repr(sorted(settings.items())).encode())
+
+            for file_path in code_files:
+                self._hash_file(hasher, file_path)
+
+            return hasher.hexdigest()
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def load(self, stage_name: str, key: str, side_files: list = ()):
+        """
+        Returns the cached artifact (paths pointing into the cache) or None on a miss.
+        Side files (e.g. final_model/*.pkl) are copied back to their original location;
+        one the stage did not produce is removed, so no stale copy is left behind.
+        """
+        try:
+            entry_dir = os.path.join(self.cache_dir, stage_name, key)
+            artifact_path = os.path.join(entry_dir, ARTIFACT_OBJECT_FILE_NAME)
+            if not os.path.exists(artifact_path):
+                return None
+
+            for index, file_path in enumerate(side_files):
+                cached_path = os.path.join(entry_dir, SIDE_FILES_DIR_NAME, f"{index}_{os.path.basename(file_path)}")
+                if not os.path.exists(cached_path):
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+                    continue
+                os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+                # Renamed into place: a server may have the old model file memory-mapped
+                shutil.copyfile(cached_path, f"{file_path}.tmp")
+                os.replace(f"{file_path}.tmp", file_path)
+
+            return load_object(artifact_path)
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def save(self, stage_name: str, key: str, artifact, side_files: list = ()):
+        """
+        Copies the artifact's files (and side files) into the cache and returns the
+        artifact re-pointed at the cached copies.
+        """
+        try:
+            entry_dir = os.path.join(self.cache_dir, stage_name, key)
+            if os.path.exists(entry_dir):
+                return self.load(stage_name, key)
+
+            tmp_dir = f"{entry_dir}.tmp.{os.getpid()}"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+            cached_fields = {}
+            for name, file_path in self.artifact_file_fields(artifact).items():
+                relative_path = os.path.join(CACHED_FILES_DIR_NAME, name, os.path.basename(file_path))
+                os.makedirs(os.path.join(tmp_dir, os.path.dirname(relative_path)), exist_ok=True)
+                shutil.copyfile(file_path, os.path.join(tmp_dir, relative_path))
+                cached_fields[name] = os.path.join(entry_dir, relative_path)
+
+            for index, file_path in enumerate(side_files):
+                if not os.path.exists(file_path):
+                    continue
+                cached_path = os.path.join(tmp_dir, SIDE_FILES_DIR_NAME, f"{index}_{os.path.basename(file_path)}")
+                os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+                shutil.copyfile(file_path, cached_path)
+
+            cached_artifact = dataclasses.replace(artifact, **cached_fields)
+            save_object(os.path.join(tmp_dir, ARTIFACT_OBJECT_FILE_NAME), cached_artifact)
+
+            # Publish the entry atomically so a crashed run never leaves a partial hit
+            os.replace(tmp_dir, entry_dir)
+            logging.info(f"Cached {stage_name} artifact under key {key[:12]}")
+            return cached_artifact
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
@@ -0,0 +1,195 @@
+import sys
+import time
+import resource
+import argparse
+import pandas as pd
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+from networksecurity.constants.constant import SCHEMA_FILE_PATH, TARGET_COLUMN, DATA_PUSH_ROW_HASH_FIELD
+from networksecurity.entity.config_entity import SyntheticDataConfig
+from networksecurity.configuration.mongo_db_connection import MongoDBClient
+from networksecurity.utils.synthetic import SyntheticDataModel
+from networksecurity.utils.common import (
+    read_yaml_file,
+    get_schema_dtypes,
+)
+from networksecurity.utils.columnar import load_dataframe, ChunkedDataFrameWriter
+
+# Model shipped once per worker process by _init_worker
+_worker_model = None
+
+
+def _init_worker(model: SyntheticDataModel) -> None:
+    global _worker_model
+    _worker_model = model
+
+
+def _generate_chunk(rows: int, seed) -> pd.DataFrame:
+    return _worker_model.sample(rows, random_state=seed)
+
+
+class SyntheticDataGenerator:
+    """
+    Fits a SyntheticDataModel on the sample file and streams any number of
+    synthetic rows in chunks of chunk_size, generated on a pool of worker
+    processes. Chunk i is drawn from seed (random_state, i), so the output only
+    depends on random_state and chunk_size, not on the number of workers. Chunks
+    are written in order as they complete: appended to a CSV / parquet / npz file,
+    or inserted into a collection with unordered bulk writes. At most max_in_flight
+    chunks are held in memory.
+    """
+
+    def __init__(self, synthetic_data_config: SyntheticDataConfig = None, mongo_client: MongoDBClient = None):
+        try:
+            self.synthetic_data_config = synthetic_data_config or SyntheticDataConfig()
+            self.mongo_client = mongo_client
+            self.dtypes = get_schema_dtypes(read_yaml_file(SCHEMA_FILE_PATH))
+            self.model = None
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def fit(self, source_file_path: str = None) -> SyntheticDataModel:
+        try:
+            source_file_path = source_file_path or self.synthetic_data_config.source_file_path
+            logging.info(f"Fitting the synthetic data model on {source_file_path}")
+            self.model = SyntheticDataModel(
+                self.dtypes, TARGET_COLUMN, smoothing=self.synthetic_data_config.smoothing
+            ).fit(load_dataframe(source_file_path, self.dtypes))
+            return self.model
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def write_to_collection(self, collection, chunk: pd.DataFrame, position: int, totals: dict) -> None:
+        """
+        Unordered bulk insert. Documents carry the row hash push_data.py uses (values +
+        row position), so regenerating the same rows into a collection skips them.
+        """
+        chunk.index = pd.RangeIndex(position, position + len(chunk))
+        row_hashes = pd.util.hash_pandas_object(chunk, index=True).to_numpy().view("int64")
+        columns = list(chunk.columns) + [DATA_PUSH_ROW_HASH_FIELD]
+        # object dtype turns numpy scalars into Python ints for BSON
+        rows = chunk.to_numpy(dtype=object).tolist()
+        documents = [dict(zip(columns, (*row, row_hash))) for row, row_hash in zip(rows, row_hashes.tolist())]
+
+        inserted, skipped, failed = MongoDBClient.run_with_retry(
+            MongoDBClient.insert_unordered, collection, documents
+        )
+        totals["inserted"] += inserted
+        totals["skipped"] += skipped
+        totals["failed"] += failed
+
+    def generate(self, rows: int, output_file_path: str = None, output_collection: str = None) -> dict:
+        """
+        Writes rows synthetic rows to output_file_path or output_collection (default:
+        the config file path). Returns rows, seconds, rows/sec and peak RSS.
+        """
+        try:
+            config = self.synthetic_data_config
+            if output_file_path is None and output_collection is None:
+                output_file_path = config.synthetic_data_file_path
+            model = self.model or self.fit()
+
+            writer = ChunkedDataFrameWriter(output_file_path) if output_file_path else None
+            collection = None
+            if output_collection:
+                if self.mongo_client is None:
+                    self.mongo_client = MongoDBClient()
+                collection = self.mongo_client.get_collection(config.database_name, output_collection)
+                MongoDBClient.ensure_row_hash_index(collection)
+            totals = {"inserted": 0, "skipped": 0, "failed": 0}
+            written = 0
+
+            def write(chunk):
+                nonlocal written
+                if writer is not None:
+                    writer.write(chunk)
+                if collection is not None:
+                    self.write_to_collection(collection, chunk, written, totals)
+                written += len(chunk)
+
+            start_time = time.perf_counter()
+            chunks = (
+                (min(config.chunk_size, rows - start), (config.random_state, index))
+                for index, start in enumerate(range(0, rows, config.chunk_size))
+            )
+
+            if config.num_workers > 0:
+                executor = ProcessPoolExecutor(
+                    max_workers=config.num_workers, initializer=_init_worker, initargs=(model,)
+                )
+            else:
+                _init_worker(model)
+                executor = None
+
+            try:
+                # Futures are drained in submission order, so the output is the same for any worker count
+                in_flight = deque()
+                for chunk_rows, seed in chunks:
+                    if executor is None:
+                        write(_generate_chunk(chunk_rows, seed))
+                        continue
+                    in_flight.append(executor.submit(_generate_chunk, chunk_rows, seed))
+                    if len(in_flight) >= config.max_in_flight:
+                        write(in_flight.popleft().result())
+
+                while in_flight:
+                    write(in_flight.popleft().result())
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+                if writer is not None:
+                    writer.close()
+
+            elapsed = time.perf_counter() - start_time
+            # ru_maxrss is in KB on Linux; children are the (joined) worker processes
+            summary = {
+                "rows": written,
+                "seconds": round(elapsed, 3),
+                "rows_per_sec": round(written / max(elapsed, 1e-9), 1),
+                "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+                "peak_worker_rss_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+                "output_file_path": output_file_path,
+                "output_collection": output_collection,
+            }
+            if collection is not None:
+                summary.update(totals)
+
+            logging.info(f"Synthetic data generated: {summary}")
+            return summary
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+
+if __name__ == "__main__":
+    try:
+        parser = argparse.ArgumentParser(description="Generate synthetic network data for load and scale testing")
+        parser.add_argument("--rows", type=int, required=True)
+        parser.add_argument("--source", help="sample file the model is fitted on (default: data/phisingData.csv)")
+        parser.add_argument("--output", help="CSV, parquet or npz output (default: synthetic_data/<timestamp>/)")
+        parser.add_argument("--output-collection", help="insert into this collection of the network data database")
+        parser.add_argument("--chunk-size", type=int, default=None)
+        parser.add_argument("--workers", type=int, default=None, help="0 generates in this process")
+        parser.add_argument("--seed", type=int, default=None)
+        args = parser.parse_args()
+
+        synthetic_data_config = SyntheticDataConfig()
+        if args.source is not None:
+            synthetic_data_config.source_file_path = args.source
+        if args.chunk_size is not None:
+            synthetic_data_config.chunk_size = args.chunk_size
+        if args.workers is not None:
+            synthetic_data_config.num_workers = args.workers
+        if args.seed is not None:
+            synthetic_data_config.random_state = args.seed
+
+        summary = SyntheticDataGenerator(synthetic_data_config).generate(
+            args.rows, output_file_path=args.output, output_collection=args.output_collection
+        )
+        print(summary)
+
+    except Exception as e:
+        logging.error("Error occurred while generating synthetic data.")
+        raise NetworkSecurityException(e, sys.exc_info())
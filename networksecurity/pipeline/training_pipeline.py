@@ -1,5 +1,6 @@
 import os
 import sys
+from contextlib import nullcontext
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logger.logging import logging
 
@@ -7,6 +8,37 @@ from networksecurity.components.data_ingestion import DataIngestion
 from networksecurity.components.data_validation import DataValidation
 from networksecurity.components.data_transformation import DataTransformation
 from networksecurity.components.model_trainer import ModelTrainer
+from networksecurity.pipeline.stage_cache import StageCache
+from networksecurity.utils.profiling import RunProfiler, profile_stage
+from networksecurity.constants.constant import (
+    SCHEMA_FILE_PATH,
+    STAGE_CACHE_ENABLED,
+    PIPELINE_PROFILE_ENABLED,
+    PIPELINE_CPROFILE_STAGES,
+    PREPROCESSING_OBJECT_FILE_NAME,
+    MODEL_FILE_NAME,
+    COMPILED_MODEL_FILE_NAME,
+)
+import networksecurity.components.data_validation as data_validation_module
+import networksecurity.components.data_transformation as data_transformation_module
+import networksecurity.components.model_trainer as model_trainer_module
+import networksecurity.constants.constant as constant_module
+import networksecurity.entity.config_entity as config_entity_module
+import networksecurity.entity.artifact_entity as artifact_entity_module
+import networksecurity.utils.common as common_module
+import networksecurity.utils.arrays as arrays_module
+import networksecurity.utils.columnar as columnar_module
+import networksecurity.utils.ternary as ternary_module
+import networksecurity.utils.bundle as bundle_module
+import networksecurity.utils.drift as drift_module
+import networksecurity.utils.schema_validator as schema_validator_module
+import networksecurity.utils.model.imputer as imputer_module
+import networksecurity.utils.model.search as search_module
+import networksecurity.utils.model.compiled as compiled_module
+import networksecurity.utils.model.boosting as boosting_module
+import networksecurity.utils.model.out_of_core as out_of_core_module
+import networksecurity.utils.model.estimator as estimator_module
+import networksecurity.utils.metric.classification_metric as classification_metric_module
 
 from networksecurity.entity.config_entity import (
     TrainingPipelineConfig,
@@ -24,13 +56,79 @@ from networksecurity.entity.artifact_entity import (
 )
 
 
+STAGE_DATA_INGESTION = "data_ingestion"
+STAGE_DATA_VALIDATION = "data_validation"
+STAGE_DATA_TRANSFORMATION = "data_transformation"
+STAGE_MODEL_TRAINER = "model_trainer"
+
+# Source files fingerprinted into each cached stage's key: every networksecurity module
+# the stage's component imports, directly or not, except logging, exceptions, profiling
+# and tracking, which do not change what the stage writes
+_SHARED_CODE_MODULES = [
+    constant_module,
+    config_entity_module,
+    artifact_entity_module,
+    common_module,
+    ternary_module,
+    bundle_module,
+    search_module,
+]
+STAGE_CODE_MODULES = {
+    STAGE_DATA_VALIDATION: [
+        data_validation_module,
+        schema_validator_module,
+        drift_module,
+        columnar_module,
+        *_SHARED_CODE_MODULES,
+    ],
+    STAGE_DATA_TRANSFORMATION: [
+        data_transformation_module,
+        imputer_module,
+        arrays_module,
+        columnar_module,
+        *_SHARED_CODE_MODULES,
+    ],
+    STAGE_MODEL_TRAINER: [
+        model_trainer_module,
+        arrays_module,
+        compiled_module,
+        boosting_module,
+        out_of_core_module,
+        estimator_module,
+        classification_metric_module,
+        *_SHARED_CODE_MODULES,
+    ],
+}
+
+
 class TrainingPipeline:
-    def __init__(self):
+    def __init__(
+        self,
+        use_cache: bool = STAGE_CACHE_ENABLED,
+        force_stages=(),
+        profile: bool = PIPELINE_PROFILE_ENABLED,
+        cprofile_stages=PIPELINE_CPROFILE_STAGES,
+    ):
+        """
+        use_cache: reuse a stage's stored artifact when its inputs, config and code are unchanged.
+        force_stages: stage names (e.g. "model_trainer") to recompute even on a cache hit.
+        profile: write a per-stage run report (time, CPU, peak RSS, I/O, rows) next to the artifacts.
+        cprofile_stages: stage names to also run under cProfile (.prof files in the profile dir).
+        """
         try:
             # Main training pipeline configuration
             self.training_pipeline_config = TrainingPipelineConfig()
             logging.info("TrainingPipelineConfig created successfully.")
 
+            self.use_cache = use_cache
+            self.force_stages = set(force_stages)
+            self.profile = profile
+            self.cprofile_stages = tuple(cprofile_stages)
+            self.stage_cache = StageCache(
+                cache_dir=self.training_pipeline_config.stage_cache_dir,
+                artifact_dir=self.training_pipeline_config.artifact_dir,
+            )
+
             # Data Ingestion config
             self.data_ingestion_config = DataIngestionConfig(
                 training_pipeline_config=self.training_pipeline_config
@@ -40,6 +138,38 @@ class TrainingPipeline:
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
 
+    # ----------------------------------------------------
+    # STAGE CACHE
+    # ----------------------------------------------------
+    def run_cached_stage(self, stage_name, upstream_artifact, config, run_stage, code_modules, side_files=()):
+        """
+        Runs run_stage() unless an artifact with the same fingerprint is cached.
+        """
+        try:
+            if not self.use_cache:
+                return run_stage()
+
+            code_files = [module.__file__ for module in code_modules] + [SCHEMA_FILE_PATH]
+            key = self.stage_cache.fingerprint(stage_name, upstream_artifact, config, code_files)
+
+            if stage_name not in self.force_stages:
+                with profile_stage("cache_load") as record:
+                    cached_artifact = self.stage_cache.load(stage_name, key, side_files)
+                    record["cache_hit"] = cached_artifact is not None
+                if cached_artifact is not None:
+                    logging.info(f"Stage cache hit for {stage_name} ({key[:12]}), skipping recompute")
+                    return cached_artifact
+                logging.info(f"Stage cache miss for {stage_name} ({key[:12]})")
+            else:
+                logging.info(f"Stage {stage_name} forced to recompute")
+
+            artifact = run_stage()
+            with profile_stage("cache_save"):
+                return self.stage_cache.save(stage_name, key, artifact, side_files)
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
     # ----------------------------------------------------
     # 1. DATA INGESTION
     # ----------------------------------------------------
@@ -51,7 +181,8 @@ class TrainingPipeline:
                 data_ingestion_config=self.data_ingestion_config
             )
 
-            data_ingestion_artifact = data_ingestion.initiate_data_ingestion()
+            with profile_stage(STAGE_DATA_INGESTION):
+                data_ingestion_artifact = data_ingestion.initiate_data_ingestion()
 
             logging.info(
                 f"Data Ingestion Completed Successfully. Artifact: {data_ingestion_artifact}"
@@ -79,7 +210,14 @@ class TrainingPipeline:
             )
 
             logging.info("Initiating Data Validation...")
-            data_validation_artifact = data_validation.initiate_data_validation()
+            with profile_stage(STAGE_DATA_VALIDATION):
+                data_validation_artifact = self.run_cached_stage(
+                    stage_name=STAGE_DATA_VALIDATION,
+                    upstream_artifact=data_ingestion_artifact,
+                    config=data_validation_config,
+                    run_stage=data_validation.initiate_data_validation,
+                    code_modules=STAGE_CODE_MODULES[STAGE_DATA_VALIDATION],
+                )
 
             logging.info("Data Validation Completed Successfully.")
             return data_validation_artifact
@@ -104,9 +242,17 @@ class TrainingPipeline:
             )
 
             logging.info("Initiating Data Transformation...")
-            data_transformation_artifact = (
-                data_transformation.initiate_data_transformation()
-            )
+            with profile_stage(STAGE_DATA_TRANSFORMATION):
+                data_transformation_artifact = self.run_cached_stage(
+                    stage_name=STAGE_DATA_TRANSFORMATION,
+                    upstream_artifact=data_validation_artifact,
+                    config=data_transformation_config,
+                    run_stage=data_transformation.initiate_data_transformation,
+                    code_modules=STAGE_CODE_MODULES[STAGE_DATA_TRANSFORMATION],
+                    side_files=[
+                        os.path.join(self.training_pipeline_config.model_dir, PREPROCESSING_OBJECT_FILE_NAME)
+                    ],
+                )
 
             logging.info("Data Transformation Completed Successfully.")
             return data_transformation_artifact
@@ -128,7 +274,18 @@ class TrainingPipeline:
             )
 
             logging.info("Initiating Model Training...")
-            model_trainer_artifact = model_trainer.initiate_model_trainer()
+            with profile_stage(STAGE_MODEL_TRAINER):
+                model_trainer_artifact = self.run_cached_stage(
+                    stage_name=STAGE_MODEL_TRAINER,
+                    upstream_artifact=data_transformation_artifact,
+                    config=model_trainer_config,
+                    run_stage=model_trainer.initiate_model_trainer,
+                    code_modules=STAGE_CODE_MODULES[STAGE_MODEL_TRAINER],
+                    side_files=[
+                        os.path.join(self.training_pipeline_config.model_dir, MODEL_FILE_NAME),
+                        os.path.join(self.training_pipeline_config.model_dir, COMPILED_MODEL_FILE_NAME),
+                    ],
+                )
 
             logging.info("Model Training Completed Successfully.")
             return model_trainer_artifact
@@ -143,21 +300,31 @@ class TrainingPipeline:
         try:
             logging.info("Pipeline Execution Started...")
 
-            # Step 1: Ingestion
-            data_ingestion_artifact = self.start_data_ingestion()
-
-            # Step 2: Validation
-            data_validation_artifact = self.start_data_validation(
-                data_ingestion_artifact=data_ingestion_artifact
-            )
-
-            # Step 3: Transformation
-            data_transformation_artifact = self.start_data_transformation(
-                data_validation_artifact=data_validation_artifact
-            )
-            model_trainer_artifact = self.start_model_trainer(
-                data_transformation_artifact=data_transformation_artifact
+            run_profiler = (
+                RunProfiler(
+                    report_file_path=self.training_pipeline_config.run_report_file_path,
+                    profile_dir=self.training_pipeline_config.profile_dir,
+                    cprofile_stages=self.cprofile_stages,
+                )
+                if self.profile
+                else nullcontext()
             )
+            with run_profiler:
+                # Step 1: Ingestion
+                data_ingestion_artifact = self.start_data_ingestion()
+
+                # Step 2: Validation
+                data_validation_artifact = self.start_data_validation(
+                    data_ingestion_artifact=data_ingestion_artifact
+                )
+
+                # Step 3: Transformation
+                data_transformation_artifact = self.start_data_transformation(
+                    data_validation_artifact=data_validation_artifact
+                )
+                model_trainer_artifact = self.start_model_trainer(
+                    data_transformation_artifact=data_transformation_artifact
+                )
 
             logging.info("Pipeline Execution Completed Successfully.")
 
@@ -0,0 +1,191 @@
+import os
+import sys
+import numpy as np
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+from networksecurity.utils.common import load_numpy_array_data
+
+
+class CompactArrayWriter:
+    """
+    Writes float feature chunks into a (rows, n_columns) .npy file in the smallest
+    dtype that holds them exactly: int8 while every value is an integer in the int8
+    range, float32 from the first chunk that is not (fractional knn imputations,
+    NaN), in which case the rows written so far are converted on disk. The file is
+    memory-mapped, so only the chunk being written is held in memory, and
+    np.load(..., mmap_mode="r") maps it back without a copy.
+    """
+
+    def __init__(self, file_path: str, rows: int, n_columns: int):
+        try:
+            os.makedirs(os.path.dirname(file_path) or os.curdir, exist_ok=True)
+            self.file_path = file_path
+            self.rows = 0
+            self._array = np.lib.format.open_memmap(file_path, mode="w+", dtype=np.int8, shape=(rows, n_columns))
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    @staticmethod
+    def _fits_int8(chunk: np.ndarray) -> bool:
+        with np.errstate(invalid="ignore"):
+            return bool(((chunk == np.rint(chunk)) & (chunk >= -128) & (chunk <= 127)).all())
+
+    def _convert_to_float32(self) -> None:
+        converted_file_path = f"{self.file_path}.float32"
+        converted = np.lib.format.open_memmap(
+            converted_file_path, mode="w+", dtype=np.float32, shape=self._array.shape
+        )
+        block_size = 1 << 16
+        for start in range(0, self.rows, block_size):
+            stop = min(start + block_size, self.rows)
+            converted[start:stop] = self._array[start:stop]
+        del self._array
+        # The mapping stays valid after the rename
+        os.replace(converted_file_path, self.file_path)
+        self._array = converted
+        logging.info(f"{self.file_path}: non-integer values, storing the features as float32")
+
+    def write(self, chunk: np.ndarray) -> None:
+        try:
+            if self._array.dtype == np.int8 and not self._fits_int8(chunk):
+                self._convert_to_float32()
+            self._array[self.rows : self.rows + len(chunk)] = chunk
+            self.rows += len(chunk)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def close(self) -> np.dtype:
+        """Flushes the file and returns the dtype the features were stored in."""
+        if self._array is None:
+            return None
+        if self.rows != len(self._array):
+            raise ValueError(f"{self.file_path}: {self.rows} rows written, {len(self._array)} expected")
+        dtype = self._array.dtype
+        self._array.flush()
+        self._array = None
+        return dtype
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._array = None
+
+
+def _npy_layout(file_obj, data_offset: int = 0) -> tuple:
+    """(offset, dtype, shape, fortran_order) of the .npy array starting at data_offset."""
+    file_obj.seek(data_offset)
+    version = np.lib.format.read_magic(file_obj)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file_obj)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file_obj)
+    return file_obj.tell(), dtype, shape, fortran_order
+
+
+class NumpyArrayReader:
+    """
+    Reads a (features..., label) .npy written by save_numpy_array_data, or a
+    features .npy with its labels .npy next to it (labels_file_path), in row chunks.
+    Every chunk is memory-mapped on its own and unmapped once dropped, so memory use
+    follows the chunk size, not the file size. Fortran-ordered files cannot be mapped
+    by rows and are read whole.
+    """
+
+    def __init__(self, file_path: str, labels_file_path: str = None):
+        try:
+            for path in (file_path, labels_file_path):
+                if path is not None and not os.path.exists(path):
+                    raise Exception(f"The file: {path} does not exist")
+            self.file_path = file_path
+            self.labels_file_path = labels_file_path
+            self._array = None
+
+            if labels_file_path is not None:
+                with open(file_path, "rb") as file_obj:
+                    self._layout = _npy_layout(file_obj)
+                with open(labels_file_path, "rb") as file_obj:
+                    self._labels = _npy_layout(file_obj)
+                if self._layout[3] or len(self._layout[2]) != 2:
+                    raise ValueError(f"{file_path} is not a C-ordered 2-d array")
+                if self._labels[2] != (self._layout[2][0],):
+                    raise ValueError(f"{labels_file_path} does not hold one label per row of {file_path}")
+                self.rows, self.n_columns = self._layout[2][0], self._layout[2][1] + 1
+                return
+
+            with open(file_path, "rb") as file_obj:
+                layout = _npy_layout(file_obj)
+
+            if layout[3]:
+                logging.warning(f"{file_path} cannot be memory-mapped, reading it whole")
+                self._array = load_numpy_array_data(file_path)
+                self.rows, self.n_columns = self._array.shape
+            else:
+                self._layout = layout
+                self.rows, self.n_columns = layout[2]
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def _map(self, layout: tuple, start: int, stop: int, file_path: str = None) -> np.ndarray:
+        offset, dtype, shape, _ = layout
+        row_bytes = dtype.itemsize * int(np.prod(shape[1:], dtype=np.int64))
+        return np.memmap(
+            file_path or self.file_path, dtype=dtype, mode="r",
+            offset=offset + start * row_bytes, shape=(stop - start, *shape[1:]),
+        )
+
+    def read(self, start: int, stop: int) -> np.ndarray:
+        """Rows start:stop as a float64 array."""
+        try:
+            stop = min(stop, self.rows)
+            if stop <= start:
+                return np.empty((0, self.n_columns))
+            if self.labels_file_path is not None:
+                X, y = self.read_xy(start, stop)
+                return np.c_[X, y].astype(np.float64, copy=False)
+            if self._array is not None:
+                return np.asarray(self._array[start:stop], dtype=np.float64)
+            return np.array(self._map(self._layout, start, stop), dtype=np.float64)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def read_xy(self, start: int, stop: int) -> tuple:
+        """
+        Rows start:stop as (X, y). Separate feature and label files keep their stored
+        dtypes (int8 / float32 features, int8 labels); the others are float64.
+        """
+        try:
+            stop = min(stop, self.rows)
+            if self.labels_file_path is None:
+                chunk = self.read(start, stop)
+                return chunk[:, :-1], chunk[:, -1]
+            if stop <= start:
+                return np.empty((0, self.n_columns - 1), dtype=self._layout[1]), np.empty(0, dtype=self._labels[1])
+            return (
+                np.array(self._map(self._layout, start, stop)),
+                np.array(self._map(self._labels, start, stop, self.labels_file_path)),
+            )
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def iter_chunks(self, chunk_size: int, rng: np.random.Generator = None):
+        """
+        Yields (X, y) chunks of at most chunk_size rows. With rng the chunks come in
+        random order and the rows of each chunk are shuffled.
+        """
+        starts = np.arange(0, self.rows, chunk_size)
+        if rng is not None:
+            starts = rng.permutation(starts)
+        for start in starts:
+            X, y = self.read_xy(int(start), int(start) + chunk_size)
+            if rng is not None:
+                order = rng.permutation(len(y))
+                X, y = X[order], y[order]
+            yield X, y
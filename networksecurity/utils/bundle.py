@@ -0,0 +1,93 @@
+import os
+import sys
+import pickle
+import struct
+import numpy as np
+from networksecurity.exception.exception import NetworkSecurityException
+
+# File layout: magic, header, pickled metadata, then every large buffer uncompressed at an
+# aligned offset. The header holds the metadata length and the (offset, size) of each buffer.
+BUNDLE_MAGIC = b"NSBUNDLE"
+BUNDLE_VERSION = 1
+BUNDLE_ALIGNMENT = 64
+
+# Buffers below this size stay inside the pickled metadata
+BUNDLE_MIN_BUFFER_BYTES = 4096
+
+_HEADER = struct.Struct("<8sIQQ")  # magic, version, metadata length, buffer count
+_BUFFER_ENTRY = struct.Struct("<QQ")  # offset, size
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // BUNDLE_ALIGNMENT) * BUNDLE_ALIGNMENT
+
+
+def is_bundle(file_path: str) -> bool:
+    with open(file_path, "rb") as file_obj:
+        return file_obj.read(len(BUNDLE_MAGIC)) == BUNDLE_MAGIC
+
+
+def save_bundle(file_path: str, obj: object) -> None:
+    """
+    Pickles obj with protocol 5, moving the data of large NumPy arrays out of the
+    pickle into the uncompressed, aligned tail of the file. The file is written next
+    to file_path and renamed over it, so processes that still map the old file keep
+    reading intact data.
+    """
+    try:
+        buffers = []
+
+        def keep_in_band(buffer: pickle.PickleBuffer) -> bool:
+            if buffer.raw().nbytes < BUNDLE_MIN_BUFFER_BYTES:
+                return True
+            buffers.append(buffer)
+            return False
+
+        metadata = pickle.dumps(obj, protocol=5, buffer_callback=keep_in_band)
+
+        offset = _aligned(_HEADER.size + _BUFFER_ENTRY.size * len(buffers) + len(metadata))
+        entries = []
+        for buffer in buffers:
+            entries.append((offset, buffer.raw().nbytes))
+            offset = _aligned(offset + buffer.raw().nbytes)
+
+        tmp_file_path = f"{file_path}.tmp"
+        with open(tmp_file_path, "wb") as file_obj:
+            file_obj.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(metadata), len(buffers)))
+            for entry in entries:
+                file_obj.write(_BUFFER_ENTRY.pack(*entry))
+            file_obj.write(metadata)
+            for buffer, (buffer_offset, _) in zip(buffers, entries):
+                file_obj.write(b"\0" * (buffer_offset - file_obj.tell()))
+                file_obj.write(buffer.raw())
+        os.replace(tmp_file_path, file_path)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+def load_bundle(file_path: str, mmap: bool = True) -> object:
+    """
+    Loads a bundle written by save_bundle. With mmap, the large arrays are read-only
+    views of the memory-mapped file: pages are read on first use and shared by every
+    process that maps the same file.
+    """
+    try:
+        with open(file_path, "rb") as file_obj:
+            magic, version, metadata_size, buffer_count = _HEADER.unpack(file_obj.read(_HEADER.size))
+            if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+                raise ValueError(f"{file_path} is not a version {BUNDLE_VERSION} model bundle")
+            entries = [_BUFFER_ENTRY.unpack(file_obj.read(_BUFFER_ENTRY.size)) for _ in range(buffer_count)]
+            metadata = file_obj.read(metadata_size)
+
+            if mmap and buffer_count:
+                data = np.memmap(file_obj, dtype=np.uint8, mode="r")
+                buffers = [data[offset : offset + size] for offset, size in entries]
+            else:
+                buffers = []
+                for offset, size in entries:
+                    file_obj.seek(offset)
+                    buffers.append(bytearray(file_obj.read(size)))
+
+        return pickle.loads(metadata, buffers=buffers)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
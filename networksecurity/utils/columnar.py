@@ -0,0 +1,233 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.constants.constant import ARTIFACT_PARQUET_COMPRESSION
+from networksecurity.utils.ternary import pack_dataframe, unpack_dataframe
+
+
+class ColumnarBuffer:
+    """
+    Preallocated per-column numpy arrays that are filled chunk by chunk.
+    Peak memory stays close to the size of the final dataframe instead of
+    holding every document in a Python list first.
+    """
+
+    GROWTH_FACTOR = 1.5
+
+    def __init__(self, dtypes: dict, capacity: int = 0):
+        try:
+            self.dtypes = {column: np.dtype(dtype) for column, dtype in dtypes.items()}
+            self.columns = list(self.dtypes.keys())
+            self.size = 0
+            self._capacity = max(int(capacity), 0)
+            self._arrays = {
+                column: np.empty(self._capacity, dtype=dtype)
+                for column, dtype in self.dtypes.items()
+            }
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def _reserve(self, required: int) -> None:
+        if required <= self._capacity:
+            return
+
+        capacity = max(required, int(self._capacity * self.GROWTH_FACTOR))
+        for column, array in self._arrays.items():
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[: self.size] = array[: self.size]
+            self._arrays[column] = grown
+        self._capacity = capacity
+
+    def append(self, documents: list) -> int:
+        """
+        Appends a chunk of documents (dicts keyed by column name).
+        Integer columns that receive missing values are upcast to float32.
+        """
+        try:
+            rows = len(documents)
+            if rows == 0:
+                return 0
+
+            self._reserve(self.size + rows)
+            end = self.size + rows
+
+            chunk = pd.DataFrame.from_records(documents, columns=self.columns)
+            chunk.replace({"na": np.nan}, inplace=True)
+
+            for column in self.columns:
+                values = pd.to_numeric(chunk[column], errors="coerce")
+                array = self._arrays[column]
+
+                if array.dtype.kind in "iu" and values.isna().any():
+                    array = array.astype(np.float32)
+                    self._arrays[column] = array
+
+                array[self.size : end] = values.to_numpy()
+
+            self.size = end
+            return rows
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def to_dataframe(self) -> pd.DataFrame:
+        try:
+            return pd.DataFrame(
+                {column: array[: self.size] for column, array in self._arrays.items()},
+                copy=False,
+            )
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+
+def get_file_format(file_path: str) -> str:
+    """
+    Returns the artifact format ("parquet", "csv" or "npz") from the file extension.
+    """
+    extension = os.path.splitext(file_path)[1].lstrip(".").lower()
+    if extension not in ("parquet", "csv", "npz"):
+        raise ValueError(f"Unsupported artifact format: {file_path}")
+    return extension
+
+
+def save_dataframe(file_path: str, dataframe: pd.DataFrame) -> None:
+    """
+    Saves a dataframe as parquet, CSV or packed npz depending on the file extension.
+    Parquet keeps the int8 column dtypes and is compressed. npz stores each row as
+    one uint64 (2 bits per column), zip-compressed, and needs every value in
+    {-1, 0, 1, NaN}.
+    """
+    try:
+        dir_path = os.path.dirname(file_path)
+        os.makedirs(dir_path, exist_ok=True)
+
+        file_format = get_file_format(file_path)
+        if file_format == "parquet":
+            dataframe.to_parquet(
+                file_path, index=False, compression=ARTIFACT_PARQUET_COMPRESSION
+            )
+        elif file_format == "npz":
+            np.savez_compressed(file_path, **pack_dataframe(dataframe))
+        else:
+            dataframe.to_csv(file_path, index=False, header=True)
+
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+def load_dataframe(file_path: str, dtypes: dict = None) -> pd.DataFrame:
+    """
+    Loads a parquet, CSV or packed npz dataframe depending on the file extension.
+    CSV columns are cast to the given dtypes when they hold no missing values.
+    """
+    try:
+        if not os.path.exists(file_path):
+            raise Exception(f"The file: {file_path} does not exist")
+
+        file_format = get_file_format(file_path)
+        if file_format == "parquet":
+            return pd.read_parquet(file_path)
+        if file_format == "npz":
+            with np.load(file_path, allow_pickle=False) as packed:
+                return unpack_dataframe(packed["rows"], packed["columns"], packed["dtypes"])
+
+        dataframe = pd.read_csv(file_path)
+        for column, dtype in (dtypes or {}).items():
+            if column in dataframe.columns and not dataframe[column].isna().any():
+                dataframe[column] = dataframe[column].astype(dtype)
+        return dataframe
+
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+def iter_dataframe_chunks(file_path: str, chunk_size: int):
+    """
+    Yields a parquet, CSV or packed npz file as dataframes of at most chunk_size rows.
+    """
+    try:
+        if not os.path.exists(file_path):
+            raise Exception(f"The file: {file_path} does not exist")
+
+        file_format = get_file_format(file_path)
+        if file_format == "parquet":
+            for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+        elif file_format == "npz":
+            # The packed rows are small enough to load whole; only the unpacking is chunked
+            with np.load(file_path, allow_pickle=False) as packed:
+                rows, columns, dtypes = packed["rows"], packed["columns"], packed["dtypes"]
+            for start in range(0, len(rows), chunk_size):
+                yield unpack_dataframe(rows[start : start + chunk_size], columns, dtypes)
+        else:
+            yield from pd.read_csv(file_path, chunksize=chunk_size)
+
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+class ChunkedDataFrameWriter:
+    """
+    Appends dataframe chunks to one parquet, CSV or packed npz file (format from the
+    extension). Every chunk must have the columns and dtypes of the first one. npz
+    keeps the packed rows in memory and writes the file on close().
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.file_format = get_file_format(file_path)
+        self.rows = 0
+        self._writer = None
+        self._schema = None
+        self._packed = []
+
+    def write(self, dataframe: pd.DataFrame) -> None:
+        try:
+            first_chunk = self.rows == 0 and self._writer is None and self._schema is None and not self._packed
+            if first_chunk:
+                os.makedirs(os.path.dirname(self.file_path) or os.curdir, exist_ok=True)
+
+            if self.file_format == "parquet":
+                table = pa.Table.from_pandas(dataframe, schema=self._schema, preserve_index=False)
+                if self._writer is None:
+                    self._schema = table.schema
+                    self._writer = pq.ParquetWriter(
+                        self.file_path, self._schema, compression=ARTIFACT_PARQUET_COMPRESSION
+                    )
+                self._writer.write_table(table)
+            elif self.file_format == "npz":
+                self._packed.append(pack_dataframe(dataframe))
+            else:
+                dataframe.to_csv(
+                    self.file_path, mode="w" if first_chunk else "a", index=False, header=first_chunk
+                )
+                self._schema = list(dataframe.columns)
+
+            self.rows += len(dataframe)
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def close(self) -> int:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._packed:
+            np.savez_compressed(
+                self.file_path,
+                rows=np.concatenate([packed["rows"] for packed in self._packed]),
+                columns=self._packed[0]["columns"],
+                dtypes=self._packed[0]["dtypes"],
+            )
+            self._packed = []
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
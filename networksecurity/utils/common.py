@@ -5,8 +5,16 @@ import os
 import sys
 import numpy as np
 import pickle
+from networksecurity.constants.constant import (
+    MODEL_TRAINER_CV_FOLDS,
+    MODEL_TRAINER_N_JOBS,
+    MODEL_TRAINER_SEARCH_STRATEGY,
+    MODEL_TRAINER_SEARCH_BUDGET_SECONDS,
+)
+from networksecurity.utils.model.search import ModelSearch
+from networksecurity.utils.bundle import save_bundle, load_bundle, is_bundle
+from networksecurity.utils.profiling import profile_stage, record_stage
 from sklearn.metrics import r2_score
-from sklearn.model_selection import GridSearchCV
 
 
 def read_yaml_file(file_path: str) -> dict:
@@ -39,6 +47,20 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
         raise NetworkSecurityException(e, sys.exc_info())
 
 
+def get_schema_dtypes(schema_config: dict) -> dict:
+    """
+    Returns an ordered {column_name: numpy dtype} mapping from the schema "columns" list.
+    """
+    try:
+        dtypes = {}
+        for column in schema_config["columns"]:
+            for name, dtype in column.items():
+                dtypes[name] = np.dtype(dtype)
+        return dtypes
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
 def save_numpy_array_data(file_path: str, array: np.array):
     """
     Saves a numpy array to a binary .npy file.
@@ -54,14 +76,14 @@ def save_numpy_array_data(file_path: str, array: np.array):
 
 def save_object(file_path: str, obj: object) -> None:
     """
-    Saves a Python object using pickle.
+    Saves a Python object as a model bundle: a pickle with the large NumPy arrays
+    stored uncompressed after it (see networksecurity/utils/bundle.py).
     """
     try:
         logging.info("Entered the save object method of MainUtils class")
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-        with open(file_path, "wb") as file_obj:
-            pickle.dump(obj, file_obj)
+        save_bundle(file_path, obj)
 
         logging.info("Exited the save object method of MainUtils class")
 
@@ -69,14 +91,18 @@ def save_object(file_path: str, obj: object) -> None:
         raise NetworkSecurityException(e, sys.exc_info())
 
 
-def load_object(file_path: str) -> object:
+def load_object(file_path: str, mmap: bool = True) -> object:
     """
-    Loads a Python object from a pickle file.
+    Loads a Python object saved by save_object; with mmap its large arrays are
+    memory-mapped instead of read. Plain pickle files are still accepted.
     """
     try:
         if not os.path.exists(file_path):
             raise Exception(f"The file: {file_path} does not exist")
 
+        if is_bundle(file_path):
+            return load_bundle(file_path, mmap=mmap)
+
         with open(file_path, "rb") as file_obj:
             return pickle.load(file_obj)
 
@@ -84,14 +110,17 @@ def load_object(file_path: str) -> object:
         raise NetworkSecurityException(e, sys.exc_info())
 
 
-def load_numpy_array_data(file_path: str) -> np.array:
+def load_numpy_array_data(file_path: str, mmap_mode: str = None) -> np.array:
     """
-    Loads a numpy array from a .npy binary file.
+    Loads a numpy array from a .npy binary file. With mmap_mode (e.g. "r") the
+    file is memory-mapped in its stored dtype instead of read.
     """
     try:
         if not os.path.exists(file_path):
             raise Exception(f"The file: {file_path} does not exist")
 
+        if mmap_mode is not None:
+            return np.load(file_path, mmap_mode=mmap_mode)
         with open(file_path, "rb") as file_obj:
             return np.load(file_obj)
 
@@ -99,33 +128,67 @@ def load_numpy_array_data(file_path: str) -> np.array:
         raise NetworkSecurityException(e, sys.exc_info())
 
 
-def evaluate_models(X_train, y_train, X_test, y_test, models, params):
+def evaluate_models(
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    models,
+    params,
+    cv: int = MODEL_TRAINER_CV_FOLDS,
+    n_jobs: int = MODEL_TRAINER_N_JOBS,
+    search_strategy: str = MODEL_TRAINER_SEARCH_STRATEGY,
+    budget_seconds: float = MODEL_TRAINER_SEARCH_BUDGET_SECONDS,
+    **search_kwargs,
+):
+    """
+    Hyperparameter search over every model family at once (see utils/model/search.py).
+    The best parameters per family are refit on the full training set and stored
+    back into `models`; families that did not finish within the budget are dropped.
+    Returns (report, timing_report): test score per family and per-family seconds
+    (search_wall_seconds elapsed, search_fit_seconds summed over worker fits).
+    """
     try:
         report = {}
 
-        for i in range(len(list(models))):
-            model = list(models.values())[i]
-            param = params[list(models.keys())[i]]
-
-            gs = GridSearchCV(model, param, cv=3)
-            gs.fit(X_train, y_train)
-
-            model.set_params(**gs.best_params_)
-            model.fit(X_train, y_train)
-
-            # model.fit(X_train, y_train)  # Train model
-
-            y_train_pred = model.predict(X_train)
-
-            y_test_pred = model.predict(X_test)
-
-            train_model_score = r2_score(y_train, y_train_pred)
-
-            test_model_score = r2_score(y_test, y_test_pred)
-
-            report[list(models.keys())[i]] = test_model_score
-
-        return report
+        model_search = ModelSearch(
+            strategy=search_strategy,
+            cv=cv,
+            n_jobs=n_jobs,
+            budget_seconds=budget_seconds,
+            **search_kwargs,
+        )
+        with profile_stage("search", rows=len(X_train)):
+            best_estimators, timing_report = model_search.search(X_train, y_train, models, params)
+
+            # The families are searched and refit concurrently in worker processes, so
+            # only the time ModelSearch measured per family is known: wall time from the
+            # search start until the family's last fit ended, plus the fit time summed
+            # over its workers
+            for name, timing in timing_report.items():
+                record_stage(
+                    name,
+                    wall_seconds=timing["search_wall_seconds"],
+                    fit_seconds=timing["search_fit_seconds"],
+                    fits=timing["fits"],
+                    timed_by="model_search",
+                )
+                record_stage(f"{name}/refit", wall_seconds=timing["refit_seconds"], timed_by="model_search")
+
+        for name in list(models):
+            if name not in best_estimators:
+                del models[name]
+                continue
+
+            model = models[name] = best_estimators[name]
+
+            with profile_stage(f"predict/{name}", rows=len(X_test)):
+                y_test_pred = model.predict(X_test)
+            report[name] = r2_score(y_test, y_test_pred)
+
+            logging.info(f"{name}: test score {report[name]:.4f}, {timing_report[name]}")
+
+        return report, timing_report
 
     except Exception as e:
-        raise NetworkSecurityException(e, sys.exc_info())
\ No newline at end of file
+        raise NetworkSecurityException(e, sys.exc_info())
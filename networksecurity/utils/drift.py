@@ -0,0 +1,141 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+from scipy.stats import chi2
+from networksecurity.exception.exception import NetworkSecurityException
+
+DRIFT_STATISTICS = ("chi2", "psi", "js")
+
+# Added to every bin before PSI / JS so empty bins do not produce log(0)
+HISTOGRAM_SMOOTHING = 1e-4
+
+# Integer data spanning at most this many distinct values is coded through a lookup table
+LOOKUP_TABLE_MAX_SPAN = 1 << 16
+
+
+def value_codes(data: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Index of each cell's value in the sorted `values`, len(values) for anything else.
+    """
+    other = len(values)
+    if data.size == 0 or other == 0:
+        return np.full(data.shape, other, dtype=np.intp)
+
+    if np.issubdtype(data.dtype, np.integer):
+        low, high = int(data.min()), int(data.max())
+        if high - low < LOOKUP_TABLE_MAX_SPAN:
+            lookup = np.full(high - low + 1, other, dtype=np.intp)
+            in_range = (values >= low) & (values <= high) & (values == np.round(values))
+            lookup[values[in_range].astype(np.intp) - low] = np.flatnonzero(in_range)
+            return lookup[data.astype(np.intp) - low]
+
+    codes = np.minimum(np.searchsorted(values, data), other - 1)
+    return np.where(values[codes] == data, codes, other)
+
+
+def value_histograms(dataframe: pd.DataFrame, values: np.ndarray = None):
+    """
+    Per-column value counts of every column in one vectorized pass.
+    Returns (values, counts) where counts has shape (n_columns, len(values) + 1);
+    the trailing bin counts values outside `values` (unseen categories and NaN).
+    `values` defaults to the distinct non-missing values of the dataframe.
+    """
+    try:
+        data = dataframe.to_numpy()
+        n_columns = data.shape[1]
+
+        if np.issubdtype(data.dtype, np.integer) and data.dtype.itemsize == 1:
+            # int8 columns: a 256-bin count of the raw bytes per column, then fold the
+            # byte bins into value bins; no per-cell code array is materialized
+            byte_counts = np.stack(
+                [np.bincount(data[:, column].view(np.uint8), minlength=256) for column in range(n_columns)]
+            ).reshape(n_columns, 256)
+            byte_values = np.arange(256, dtype=np.uint8).view(data.dtype)
+            if values is None:
+                values = np.sort(byte_values[byte_counts.sum(axis=0) > 0])
+            values = np.asarray(values)
+
+            fold = np.zeros((256, len(values) + 1), dtype=np.int64)
+            fold[np.arange(256), value_codes(byte_values, values)] = 1
+            return values, byte_counts @ fold
+
+        values = np.unique(data[~pd.isna(data)]) if values is None else np.asarray(values)
+        n_bins = len(values) + 1
+
+        keys = value_codes(data, values) + np.arange(n_columns) * n_bins
+        counts = np.bincount(keys.ravel(), minlength=n_columns * n_bins).reshape(n_columns, n_bins)
+        return values, counts
+
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+def save_histograms(file_path: str, columns: list, values: np.ndarray, counts: np.ndarray) -> None:
+    """
+    Saves baseline histograms as a compressed .npz (a few hundred bytes for this schema).
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb") as file_obj:
+            np.savez_compressed(file_obj, columns=np.asarray(columns, dtype=str), values=values, counts=counts)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+def load_histograms(file_path: str):
+    """
+    Loads baseline histograms saved by save_histograms: (columns, values, counts).
+    """
+    try:
+        if not os.path.exists(file_path):
+            raise Exception(f"The file: {file_path} does not exist")
+
+        with np.load(file_path) as baseline:
+            return baseline["columns"].tolist(), baseline["values"], baseline["counts"]
+
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+def drift_statistics(base_counts: np.ndarray, current_counts: np.ndarray) -> dict:
+    """
+    Drift statistics per column from two (n_columns, n_bins) histograms:
+      chi2 / p_value - chi-square test of homogeneity of the two samples
+      psi            - population stability index of current vs base
+      js             - Jensen-Shannon distance (base 2, in [0, 1])
+    Every statistic is computed for all columns at once.
+    """
+    try:
+        base_counts = base_counts.astype(np.float64)
+        current_counts = current_counts.astype(np.float64)
+
+        # Chi-square over the 2 x n_bins contingency table of each column
+        observed = np.stack([base_counts, current_counts], axis=1)
+        sample_totals = observed.sum(axis=2, keepdims=True)
+        bin_totals = observed.sum(axis=1, keepdims=True)
+        expected = sample_totals * bin_totals / np.maximum(sample_totals.sum(axis=1, keepdims=True), 1.0)
+        chi2_statistic = np.divide(
+            (observed - expected) ** 2, expected, out=np.zeros_like(expected), where=expected > 0
+        ).sum(axis=(1, 2))
+        degrees_of_freedom = np.maximum((bin_totals[:, 0, :] > 0).sum(axis=1) - 1, 0)
+        p_value = np.where(degrees_of_freedom > 0, chi2.sf(chi2_statistic, np.maximum(degrees_of_freedom, 1)), 1.0)
+
+        base_share = base_counts + HISTOGRAM_SMOOTHING
+        base_share /= base_share.sum(axis=1, keepdims=True)
+        current_share = current_counts + HISTOGRAM_SMOOTHING
+        current_share /= current_share.sum(axis=1, keepdims=True)
+
+        psi = ((current_share - base_share) * np.log(current_share / base_share)).sum(axis=1)
+
+        mixture = 0.5 * (base_share + current_share)
+        js_divergence = 0.5 * (
+            (base_share * np.log2(base_share / mixture)).sum(axis=1)
+            + (current_share * np.log2(current_share / mixture)).sum(axis=1)
+        )
+        js = np.sqrt(np.maximum(js_divergence, 0.0))
+
+        return {"chi2": chi2_statistic, "p_value": p_value, "psi": psi, "js": js}
+
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
@@ -19,3 +19,14 @@ def get_classification_score(y_true, y_pred) -> ClassificationMetricArtifact:
 
     except Exception as e:
         raise NetworkSecurityException(e, sys.exc_info())
+
+
+def get_classification_score_from_counts(tp: int, fp: int, fn: int, **_) -> ClassificationMetricArtifact:
+    """Same scores from confusion counts (e.g. accumulated over chunks); 0 where undefined, as sklearn."""
+    try:
+        precision = tp / (tp + fp) if tp + fp else 0.0
+        recall = tp / (tp + fn) if tp + fn else 0.0
+        f1 = 2 * tp / (2 * tp + fp + fn) if tp else 0.0
+        return ClassificationMetricArtifact(f1_score=f1, precision_score=precision, recall_score=recall)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
@@ -0,0 +1,81 @@
+import sys
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.utils.validation import check_is_fitted
+from networksecurity.exception.exception import NetworkSecurityException
+
+
+def ternary_category_codes(X) -> np.ndarray:
+    """
+    {-1, 0, 1} features as category codes {0, 1, 2}. Fractional values (the knn
+    imputer averages neighbours) go to the nearest value; NaN stays missing.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    return np.clip(np.rint(X), -1, 1) + 1
+
+
+class TernaryHistGradientBoostingClassifier(ClassifierMixin, BaseEstimator):
+    """
+    HistGradientBoostingClassifier that treats every ternary feature as a
+    categorical one, so a node can split {-1, 1} against {0} instead of only on an
+    order. Boosting stops early once the loss on a validation_fraction holdout has
+    not improved for n_iter_no_change iterations, so max_iter is a cap rather than
+    a setting to search.
+    """
+
+    def __init__(
+        self,
+        learning_rate: float = 0.1,
+        max_iter: int = 300,
+        max_leaf_nodes: int = 31,
+        min_samples_leaf: int = 20,
+        l2_regularization: float = 0.0,
+        early_stopping: bool = True,
+        n_iter_no_change: int = 10,
+        validation_fraction: float = 0.1,
+        random_state: int = None,
+    ):
+        self.learning_rate = learning_rate
+        self.max_iter = max_iter
+        self.max_leaf_nodes = max_leaf_nodes
+        self.min_samples_leaf = min_samples_leaf
+        self.l2_regularization = l2_regularization
+        self.early_stopping = early_stopping
+        self.n_iter_no_change = n_iter_no_change
+        self.validation_fraction = validation_fraction
+        self.random_state = random_state
+
+    def fit(self, X, y, sample_weight=None):
+        try:
+            X = ternary_category_codes(X)
+            self.model_ = HistGradientBoostingClassifier(
+                learning_rate=self.learning_rate,
+                max_iter=self.max_iter,
+                max_leaf_nodes=self.max_leaf_nodes,
+                min_samples_leaf=self.min_samples_leaf,
+                l2_regularization=self.l2_regularization,
+                categorical_features=np.ones(X.shape[1], dtype=bool),
+                early_stopping=self.early_stopping,
+                n_iter_no_change=self.n_iter_no_change,
+                validation_fraction=self.validation_fraction,
+                random_state=self.random_state,
+            ).fit(X, y, sample_weight=sample_weight)
+            self.classes_ = self.model_.classes_
+            self.n_features_in_ = self.model_.n_features_in_
+            self.n_iter_ = self.model_.n_iter_
+            return self
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def decision_function(self, X) -> np.ndarray:
+        check_is_fitted(self, "model_")
+        return self.model_.decision_function(ternary_category_codes(X))
+
+    def predict_proba(self, X) -> np.ndarray:
+        check_is_fitted(self, "model_")
+        return self.model_.predict_proba(ternary_category_codes(X))
+
+    def predict(self, X) -> np.ndarray:
+        check_is_fitted(self, "model_")
+        return self.model_.predict(ternary_category_codes(X))
@@ -0,0 +1,314 @@
+import sys
+import numpy as np
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.dummy import DummyClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.ensemble import (
+    AdaBoostClassifier,
+    GradientBoostingClassifier,
+    RandomForestClassifier,
+)
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.utils.bundle import save_bundle, load_bundle
+
+COMPILED_MODEL_KINDS = ("tree", "forest", "gradient_boosting", "adaboost", "logistic")
+
+# Rows are scored in blocks of this many, which bounds the path arrays
+# to block x n_trees integers
+COMPILED_PREDICT_BLOCK_SIZE = 4096
+
+# Paths that reached a leaf are dropped from the working set every this many levels
+COMPILED_COMPACT_EVERY_LEVELS = 4
+
+_TREE_LEAF = -1
+
+
+def _float32_thresholds(threshold: np.ndarray) -> np.ndarray:
+    """
+    Largest float32 <= each float64 threshold. For a float32 feature x,
+    x <= t and x <= floor32(t) are the same test, so traversal can compare
+    in float32 and still split exactly like sklearn.
+    """
+    with np.errstate(over="ignore"):
+        rounded = threshold.astype(np.float32)
+    too_large = rounded.astype(np.float64) > threshold
+    rounded[too_large] = np.nextafter(rounded[too_large], np.float32(-np.inf))
+    return rounded
+
+
+def _flatten_trees(trees: list, missing_values: bool = True) -> dict:
+    """
+    Concatenates fitted sklearn trees into flat node arrays. Children are stored
+    interleaved (left at 2 * node, right at 2 * node + 1) and leaves point to
+    themselves, so a path that reaches a leaf early can keep stepping unmasked.
+    """
+    features, thresholds, children, missing_left, roots = [], [], [], [], []
+    offset = 0
+    max_depth = 0
+
+    for tree in trees:
+        tree_ = tree.tree_
+        node_ids = np.arange(tree_.node_count) + offset
+        is_leaf = tree_.children_left == _TREE_LEAF
+
+        left = np.where(is_leaf, node_ids, tree_.children_left + offset)
+        right = np.where(is_leaf, node_ids, tree_.children_right + offset)
+
+        features.append(np.where(is_leaf, 0, tree_.feature))
+        thresholds.append(np.where(is_leaf, 0.0, tree_.threshold))
+        children.append(np.column_stack([left, right]).ravel())
+        if missing_values and hasattr(tree_, "missing_go_to_left"):
+            missing_left.append(tree_.missing_go_to_left.astype(bool) & ~is_leaf)
+        else:
+            missing_left.append(np.zeros(tree_.node_count, dtype=bool))
+        roots.append(offset)
+
+        max_depth = max(max_depth, tree_.max_depth)
+        offset += tree_.node_count
+
+    return {
+        "feature": np.concatenate(features).astype(np.intp),
+        "threshold": _float32_thresholds(np.concatenate(thresholds)),
+        "children": np.concatenate(children).astype(np.intp),
+        "missing_left": np.concatenate(missing_left),
+        "roots": np.array(roots, dtype=np.intp),
+        "max_depth": np.array(max_depth),
+    }
+
+
+def _sequential_sum(terms: np.ndarray) -> np.ndarray:
+    """
+    Sum over the first axis strictly in order, like sklearn's per-estimator += loops.
+    np.sum may pair the terms differently, which can change the rounding.
+    """
+    return np.add.accumulate(terms, axis=0, out=terms)[-1]
+
+
+def _leaf_class_index(trees: list, classes: np.ndarray) -> np.ndarray:
+    """Per node: index in classes of the label a single tree predicts at that leaf."""
+    indices = []
+    for tree in trees:
+        labels = tree.classes_.take(np.argmax(tree.tree_.value[:, 0, :], axis=1))
+        index = np.searchsorted(classes, labels)
+        index = np.minimum(index, len(classes) - 1)
+        indices.append(np.where(classes[index] == labels, index, -1))
+    return np.concatenate(indices).astype(np.intp)
+
+
+def _compile_forest(model: RandomForestClassifier) -> dict:
+    n_classes = len(model.classes_)
+    leaf_proba = []
+    for tree in model.estimators_:
+        # Same normalization as DecisionTreeClassifier.predict_proba
+        proba = tree.tree_.value[:, 0, :n_classes].copy()
+        normalizer = proba.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        proba /= normalizer
+        leaf_proba.append(proba)
+
+    arrays = _flatten_trees(model.estimators_)
+    arrays["leaf_value"] = np.concatenate(leaf_proba)
+    return arrays
+
+
+def _compile_gradient_boosting(model: GradientBoostingClassifier) -> dict:
+    if not (isinstance(model.init_, DummyClassifier) or model.init_ == "zero"):
+        raise ValueError("Only the default (prior) or 'zero' init estimator can be compiled")
+
+    stages = model.estimators_
+    trees = [stages[i, k] for i in range(stages.shape[0]) for k in range(stages.shape[1])]
+
+    # The sklearn fast path for dense input ignores missing_go_to_left: NaN goes right
+    arrays = _flatten_trees(trees, missing_values=False)
+    arrays["leaf_value"] = np.concatenate([tree.tree_.value[:, 0, 0] for tree in trees])
+    # The prior does not depend on X, one row gives the constant raw score
+    arrays["init_raw"] = model._raw_predict_init(np.zeros((1, model.n_features_in_)))[0]
+    arrays["learning_rate"] = np.array(model.learning_rate, dtype=np.float64)
+    return arrays
+
+
+def _compile_adaboost(model: AdaBoostClassifier) -> dict:
+    if not all(isinstance(tree, DecisionTreeClassifier) for tree in model.estimators_):
+        raise ValueError("AdaBoost can only be compiled with decision tree estimators")
+
+    arrays = _flatten_trees(model.estimators_)
+    arrays["leaf_class"] = _leaf_class_index(model.estimators_, model.classes_)
+    # decision_function pairs estimators with their weights but normalizes by the sum of all
+    arrays["estimator_weights"] = np.asarray(model.estimator_weights_[: len(model.estimators_)])
+    arrays["weight_sum"] = np.array(model.estimator_weights_.sum())
+    return arrays
+
+
+def compile_model(model) -> "CompiledModel":
+    """
+    Compiles a fitted classifier from the model zoo into flat NumPy arrays.
+    Raises ValueError for estimators (or settings) that cannot be compiled.
+    """
+    if getattr(model, "n_outputs_", 1) != 1:
+        raise ValueError("Multi-output estimators cannot be compiled")
+
+    if isinstance(model, DecisionTreeClassifier):
+        kind = "tree"
+        arrays = _flatten_trees([model])
+        arrays["leaf_class"] = _leaf_class_index([model], model.classes_)
+    elif isinstance(model, RandomForestClassifier):
+        kind = "forest"
+        arrays = _compile_forest(model)
+    elif isinstance(model, GradientBoostingClassifier):
+        kind = "gradient_boosting"
+        arrays = _compile_gradient_boosting(model)
+    elif isinstance(model, AdaBoostClassifier):
+        kind = "adaboost"
+        arrays = _compile_adaboost(model)
+    elif isinstance(model, (LogisticRegression, SGDClassifier)):
+        kind = "logistic"
+        arrays = {"coef": model.coef_.copy(), "intercept": model.intercept_.copy()}
+    else:
+        raise ValueError(f"Cannot compile estimator of type {type(model).__name__}")
+
+    return CompiledModel(kind, model.classes_.copy(), arrays)
+
+
+class CompiledModel:
+    """
+    Array-backed predictor for a fitted tree ensemble or logistic regression.
+
+    Tree models are stored as flat node arrays and evaluated for all trees of
+    a block of rows at once, one vectorized step per tree level; per-tree
+    results are then accumulated in the same order and precision as sklearn,
+    so predict() returns exactly what the original estimator would.
+    """
+
+    def __init__(self, kind: str, classes: np.ndarray, arrays: dict):
+        if kind not in COMPILED_MODEL_KINDS:
+            raise ValueError(f"Unknown compiled model kind: {kind}")
+        self.kind = kind
+        self.classes_ = classes
+        self.arrays = arrays
+        for name, array in arrays.items():
+            setattr(self, name, array)
+        if "children" in arrays:
+            self.is_leaf = self.children[0::2] == np.arange(len(self.feature))
+            self.has_missing_left = bool(self.missing_left.any())
+
+    def _apply(self, X: np.ndarray) -> np.ndarray:
+        """
+        Leaf node of every tree for every row of a float32 block, shape (n_trees, n).
+        All (tree, row) paths step down one level per pass, tree-major so that
+        consecutive lookups stay within one tree's nodes.
+        """
+        n_rows, n_features = X.shape
+        n_paths = n_rows * len(self.roots)
+        flat = X.ravel()
+
+        leaves = np.empty(n_paths, dtype=np.intp)
+        position = np.arange(n_paths, dtype=np.intp)
+        nodes = np.repeat(self.roots, n_rows)
+        row_start = np.tile(np.arange(n_rows, dtype=np.intp) * n_features, len(self.roots))
+
+        depth = max(int(self.max_depth), 1)
+        for level in range(1, depth + 1):
+            values = flat[row_start + self.feature[nodes]]
+            go_right = values > self.threshold[nodes]
+            if self.has_missing_left:
+                go_right |= np.isnan(values) & ~self.missing_left[nodes]
+            nodes = self.children[2 * nodes + go_right]
+
+            if level == depth:
+                # Every remaining path is at a leaf after max_depth steps
+                if len(position) == n_paths:
+                    leaves = nodes
+                else:
+                    leaves[position] = nodes
+            elif level % COMPILED_COMPACT_EVERY_LEVELS == 0:
+                done = self.is_leaf[nodes]
+                leaves[position[done]] = nodes[done]
+                active = ~done
+                position, nodes, row_start = position[active], nodes[active], row_start[active]
+
+        return leaves.reshape(len(self.roots), n_rows)
+
+    def _predict_tree(self, X: np.ndarray) -> np.ndarray:
+        nodes = self._apply(X)
+        return self.classes_.take(self.leaf_class[nodes[0]], axis=0)
+
+    def _predict_forest(self, X: np.ndarray) -> np.ndarray:
+        nodes = self._apply(X)
+        proba = _sequential_sum(self.leaf_value[nodes])
+        proba /= len(nodes)
+        return self.classes_.take(np.argmax(proba, axis=1), axis=0)
+
+    def _predict_gradient_boosting(self, X: np.ndarray) -> np.ndarray:
+        nodes = self._apply(X)
+        n_outputs = len(self.init_raw)
+        # (1 + n_stages, n_outputs, n): the init score, then every stage's scaled leaf values
+        terms = np.empty((1 + len(nodes) // n_outputs, n_outputs, X.shape[0]), dtype=np.float64)
+        terms[0] = self.init_raw[:, np.newaxis]
+        np.multiply(float(self.learning_rate), self.leaf_value[nodes].reshape(-1, n_outputs, X.shape[0]), out=terms[1:])
+        raw = _sequential_sum(terms).T
+
+        if raw.shape[1] == 1:
+            return self.classes_[(raw.ravel() >= 0).astype(int)]
+        return self.classes_[np.argmax(raw, axis=1)]
+
+    def _predict_adaboost(self, X: np.ndarray) -> np.ndarray:
+        nodes = self._apply(X)
+        n_classes = len(self.classes_)
+        weights = self.estimator_weights[:, np.newaxis, np.newaxis]
+
+        votes = self.leaf_class[nodes][:, :, np.newaxis] == np.arange(n_classes)
+        pred = _sequential_sum(np.where(votes, weights, -1 / (n_classes - 1) * weights))
+        pred /= self.weight_sum
+
+        if n_classes == 2:
+            pred[:, 0] *= -1
+            return self.classes_.take(pred.sum(axis=1) > 0, axis=0)
+        return self.classes_.take(np.argmax(pred, axis=1), axis=0)
+
+    def _predict_logistic(self, X: np.ndarray) -> np.ndarray:
+        scores = X @ self.coef.T + self.intercept
+        if scores.shape[1] == 1:
+            return self.classes_[(scores.ravel() > 0).astype(int)]
+        return self.classes_.take(np.argmax(scores, axis=1), axis=0)
+
+    def predict(self, X) -> np.ndarray:
+        try:
+            if self.kind == "logistic":
+                X = np.asarray(X)
+                if X.dtype not in (np.float32, np.float64):
+                    X = X.astype(np.float64)
+                return self._predict_logistic(X)
+
+            # sklearn trees split float32 features
+            X = np.ascontiguousarray(X, dtype=np.float32)
+            predict_block = getattr(self, f"_predict_{self.kind}")
+            if X.shape[0] <= COMPILED_PREDICT_BLOCK_SIZE:
+                return predict_block(X)
+            return np.concatenate(
+                [
+                    predict_block(X[start : start + COMPILED_PREDICT_BLOCK_SIZE])
+                    for start in range(0, X.shape[0], COMPILED_PREDICT_BLOCK_SIZE)
+                ]
+            )
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+
+def save_compiled_model(file_path: str, compiled_model: CompiledModel) -> None:
+    """Writes the node arrays to a model bundle, uncompressed."""
+    try:
+        save_bundle(
+            file_path,
+            {"kind": compiled_model.kind, "classes": compiled_model.classes_, "arrays": compiled_model.arrays},
+        )
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+def load_compiled_model(file_path: str) -> CompiledModel:
+    """The node arrays are memory-mapped, so serving processes share one copy."""
+    try:
+        data = load_bundle(file_path)
+        return CompiledModel(data["kind"], data["classes"], data["arrays"])
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
@@ -1,7 +1,10 @@
 import os, sys
+import hashlib
 from networksecurity.constants.constant import SAVED_MODEL_DIR, MODEL_FILE_NAME
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logger.logging import logging
+from networksecurity.utils.common import load_object
+from networksecurity.utils.model.compiled import load_compiled_model
 
 
 class NetworkModel:
@@ -19,3 +22,34 @@ class NetworkModel:
             return y_hat
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
+
+
+def load_network_model(
+    preprocessor_file_path: str, model_file_path: str, compiled_model_file_path: str = None
+) -> NetworkModel:
+    """
+    Loads the preprocessor with the compiled model when compiled_model_file_path exists,
+    else with the pickled estimator. Both predict the same labels.
+    """
+    try:
+        preprocessor = load_object(preprocessor_file_path)
+        if compiled_model_file_path and os.path.exists(compiled_model_file_path):
+            logging.info(f"Using compiled model {compiled_model_file_path}")
+            return NetworkModel(preprocessor=preprocessor, model=load_compiled_model(compiled_model_file_path))
+        return NetworkModel(preprocessor=preprocessor, model=load_object(model_file_path))
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+def get_model_version(*file_paths) -> str:
+    """Short content hash of the model files that exist; a retrained model gets a new version."""
+    try:
+        hasher = hashlib.sha256()
+        for file_path in file_paths:
+            if file_path and os.path.exists(file_path):
+                with open(file_path, "rb") as file_obj:
+                    for block in iter(lambda: file_obj.read(1 << 20), b""):
+                        hasher.update(block)
+        return hasher.hexdigest()[:12]
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
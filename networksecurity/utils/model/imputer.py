@@ -0,0 +1,250 @@
+import sys
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.neighbors import KDTree
+from sklearn.utils.validation import check_is_fitted
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+
+IMPUTER_STRATEGIES = ("knn", "mode", "conditional_mode")
+
+# Brute-force search works on blocks of query rows sized so that the block x n_patterns
+# distance matrix and its argpartition indices (16 bytes per entry) stay within this
+KNN_MEMORY_BYTES = 64 * 1024**2
+
+# A KD-tree over the training patterns is built per missing-value mask once there are at
+# least this many patterns and this many rows with the mask; smaller searches are brute
+# force (on 130k phishing patterns a build costs about as much as 500 brute-force rows)
+KNN_TREE_MIN_PATTERNS = 4096
+KNN_TREE_MIN_ROWS = 512
+
+# Trees are kept between transform calls (not in the artifact), at most this many
+KNN_MAX_CACHED_TREES = 16
+
+
+class TernaryImputer(TransformerMixin, BaseEstimator):
+    """
+    Missing-value imputer for the {-1, 0, 1} phishing features.
+
+    strategy:
+      "knn"              - mean of the n_neighbors nearest complete training rows on the
+                           observed columns (same rule as KNNImputer with uniform weights).
+                           Training rows are bucketed into distinct patterns with a count and
+                           only rows with missing values are searched, grouped by their
+                           missing-value mask: large groups query a KD-tree over the
+                           patterns' observed columns, small ones a memory-bounded brute
+                           force. Rows without any observed value, or a fit without a complete
+                           row, fall back to the column modes.
+      "mode"             - most frequent training value of the column
+      "conditional_mode" - most frequent value of the column given the value of the one
+                           other column that predicts it best; falls back to the mode
+
+    Batches without missing values are returned as they are, without any search.
+    """
+
+    def __init__(self, strategy: str = "knn", n_neighbors: int = 3, missing_values=np.nan):
+        self.strategy = strategy
+        self.n_neighbors = n_neighbors
+        self.missing_values = missing_values
+
+    @staticmethod
+    def _as_float_array(X) -> np.ndarray:
+        return np.asarray(X, dtype=np.float64)
+
+    @staticmethod
+    def _column_modes(X: np.ndarray) -> np.ndarray:
+        modes = np.zeros(X.shape[1])
+        for column in range(X.shape[1]):
+            values, counts = np.unique(X[:, column][~np.isnan(X[:, column])], return_counts=True)
+            if len(values):
+                modes[column] = values[np.argmax(counts)]
+        return modes
+
+    def _fit_conditional_modes(self, X: np.ndarray) -> None:
+        """
+        For each column pick the other column whose value best predicts it (highest
+        accuracy of the per-value mode) and keep that value -> mode lookup table.
+        """
+        n_features = X.shape[1]
+        observed = ~np.isnan(X)
+
+        # Integer codes per column so every column pair is one bincount
+        values, codes = [], np.zeros(X.shape, dtype=np.int64)
+        for column in range(n_features):
+            column_values, column_codes = np.unique(X[observed[:, column], column], return_inverse=True)
+            values.append(column_values)
+            codes[observed[:, column], column] = column_codes
+
+        n_values = max((len(column_values) for column_values in values), default=0)
+        self.predictor_columns_ = np.full(n_features, -1)
+        self.conditional_modes_ = {}
+
+        for target in range(n_features):
+            n_target = len(values[target])
+            if n_target == 0:
+                self.conditional_modes_[target] = {}
+                continue
+
+            # One bincount gives the (predictor value, target value) table of every predictor;
+            # pairs where either side is missing go to a trailing overflow bin
+            keys = (np.arange(n_features) * n_values + codes) * n_target + codes[:, [target]]
+            keys[~(observed & observed[:, [target]])] = n_features * n_values * n_target
+            counts = np.bincount(keys.ravel(), minlength=n_features * n_values * n_target + 1)
+            counts = counts[:-1].reshape(n_features, n_values, n_target)
+
+            totals = counts.sum(axis=(1, 2))
+            accuracy = np.divide(counts.max(axis=2).sum(axis=1), totals, out=np.full(n_features, -1.0), where=totals > 0)
+            accuracy[target] = -1.0
+            predictor = int(np.argmax(accuracy))
+            if accuracy[predictor] < 0:
+                self.conditional_modes_[target] = {}
+                continue
+
+            self.predictor_columns_[target] = predictor
+            self.conditional_modes_[target] = {
+                float(values[predictor][code]): float(values[target][np.argmax(counts[predictor, code])])
+                for code in range(len(values[predictor]))
+                if counts[predictor, code].any()
+            }
+
+    def fit(self, X, y=None):
+        try:
+            if self.strategy not in IMPUTER_STRATEGIES:
+                raise ValueError(f"Unknown imputer strategy: {self.strategy}, expected one of {IMPUTER_STRATEGIES}")
+            if not (isinstance(self.missing_values, float) and np.isnan(self.missing_values)):
+                raise ValueError("TernaryImputer only supports missing_values=np.nan")
+
+            if hasattr(X, "columns"):
+                self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+            X = self._as_float_array(X)
+            self.n_features_in_ = X.shape[1]
+            self.modes_ = self._column_modes(X)
+
+            if self.strategy == "knn":
+                # Only complete rows can donate to every column
+                complete = X[~np.isnan(X).any(axis=1)]
+                if not len(complete):
+                    logging.warning("No complete training row: the knn imputer falls back to the column modes")
+                patterns, counts = np.unique(complete.astype(np.int8), axis=0, return_counts=True)
+                self.patterns_ = patterns
+                self.pattern_counts_ = counts.astype(np.int64)
+                self._trees = {}
+            elif self.strategy == "conditional_mode":
+                self._fit_conditional_modes(X)
+
+            return self
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # The KD-trees are a cache rebuilt on demand, not part of the artifact
+        state.pop("_trees", None)
+        return state
+
+    def _tree(self, mask: np.ndarray, patterns: np.ndarray, observed_columns: np.ndarray) -> KDTree:
+        trees = self.__dict__.setdefault("_trees", {})
+        key = mask.tobytes()
+        if key not in trees:
+            if len(trees) >= KNN_MAX_CACHED_TREES:
+                trees.pop(next(iter(trees)))
+            trees[key] = KDTree(patterns[:, observed_columns])
+        return trees[key]
+
+    @staticmethod
+    def _nearest_brute_force(
+        values: np.ndarray, observed: np.ndarray, patterns: np.ndarray, squared_patterns: np.ndarray, n_query: int
+    ) -> np.ndarray:
+        """
+        Indices of the n_query patterns nearest to each row of values (missing columns
+        zero-filled) over the observed columns, nearest first.
+        """
+        nearest = np.empty((len(values), n_query), dtype=np.intp)
+        pattern_norms = squared_patterns @ observed.astype(np.float64)
+        block_size = max(1, KNN_MEMORY_BYTES // (16 * len(patterns)))
+
+        for start in range(0, len(values), block_size):
+            block = values[start : start + block_size]
+            # Squared euclidean distance on the observed columns: |x|^2 - 2 x . p + |p_o|^2,
+            # built in place (x is zero on the missing columns)
+            distances = block @ patterns.T
+            distances *= -2.0
+            distances += pattern_norms
+            distances += (block**2).sum(axis=1, keepdims=True)
+
+            block_nearest = np.argpartition(distances, n_query - 1, axis=1)[:, :n_query]
+            order = np.argsort(np.take_along_axis(distances, block_nearest, axis=1), axis=1, kind="stable")
+            nearest[start : start + block_size] = np.take_along_axis(block_nearest, order, axis=1)
+
+        return nearest
+
+    def _impute_knn(self, X: np.ndarray, missing: np.ndarray) -> None:
+        rows = np.flatnonzero(missing.any(axis=1))
+        patterns = self.patterns_.astype(np.float64)
+        squared_patterns = patterns**2
+        n_query = min(self.n_neighbors, len(patterns))
+
+        # Rows sharing a missing-value mask are searched together on the same columns
+        masks, mask_index = np.unique(missing[rows], axis=0, return_inverse=True)
+        mask_index = mask_index.ravel()
+
+        for mask_number, mask in enumerate(masks):
+            mask_rows = rows[mask_index == mask_number]
+            observed_columns = np.flatnonzero(~mask)
+            missing_columns = np.flatnonzero(mask)
+
+            if n_query == 0 or len(observed_columns) == 0:
+                X[np.ix_(mask_rows, missing_columns)] = self.modes_[missing_columns]
+                continue
+
+            use_tree = mask.tobytes() in self.__dict__.get("_trees", {}) or (
+                len(patterns) >= KNN_TREE_MIN_PATTERNS and len(mask_rows) >= KNN_TREE_MIN_ROWS
+            )
+            if use_tree:
+                nearest = self._tree(mask, patterns, observed_columns).query(
+                    X[np.ix_(mask_rows, observed_columns)], k=n_query, return_distance=False, sort_results=True
+                )
+            else:
+                values = np.where(mask, 0.0, X[mask_rows])
+                nearest = self._nearest_brute_force(values, ~mask, patterns, squared_patterns, n_query)
+
+            # A pattern stands for `count` identical rows; take rows up to n_neighbors
+            counts = self.pattern_counts_[nearest]
+            taken = np.minimum(counts, np.maximum(self.n_neighbors - (np.cumsum(counts, axis=1) - counts), 0))
+            donors = patterns[nearest[:, :, np.newaxis], missing_columns]
+            imputed = (donors * taken[:, :, None]).sum(axis=1) / taken.sum(axis=1, keepdims=True)
+            X[np.ix_(mask_rows, missing_columns)] = imputed
+
+    def _impute_conditional_mode(self, X: np.ndarray, missing: np.ndarray) -> None:
+        for column in np.flatnonzero(missing.any(axis=0)):
+            rows = np.flatnonzero(missing[:, column])
+            values = np.full(len(rows), self.modes_[column])
+            predictor = self.predictor_columns_[column]
+            if predictor >= 0:
+                predictor_values = X[rows, predictor]
+                for predictor_value, mode in self.conditional_modes_[column].items():
+                    values[predictor_values == predictor_value] = mode
+            X[rows, column] = values
+
+    def transform(self, X):
+        try:
+            check_is_fitted(self, "modes_")
+            X = self._as_float_array(X)
+            missing = np.isnan(X)
+
+            # Fast path: nothing to impute
+            if not missing.any():
+                return X
+
+            X = X.copy()
+            if self.strategy == "knn":
+                self._impute_knn(X, missing)
+            elif self.strategy == "conditional_mode":
+                self._impute_conditional_mode(X, missing)
+            else:
+                X[missing] = np.take(self.modes_, np.nonzero(missing)[1])
+            return X
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
@@ -0,0 +1,100 @@
+import sys
+import time
+import asyncio
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+
+
+class MicroBatcher:
+    """
+    Merges concurrent single-row predictions into one vectorized predict call.
+
+    submit() puts a row on an asyncio queue and awaits its result. A background
+    task takes the first waiting row, keeps collecting until max_batch_size rows
+    are queued or max_wait_seconds have passed, then runs predict_fn on the stacked
+    batch in a worker thread so the event loop keeps accepting requests meanwhile.
+    """
+
+    def __init__(self, predict_fn, max_batch_size: int, max_wait_seconds: float):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max(int(max_batch_size), 1)
+        self.max_wait_seconds = max_wait_seconds
+        self.batches = 0
+        self.rows = 0
+        self._queue = None
+        self._task = None
+        # One thread is enough: each call is already vectorized over the whole batch
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="predict")
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._executor.shutdown(wait=True)
+
+    async def submit(self, row: np.ndarray):
+        """Returns the prediction for one feature row."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((row, future))
+        return await future
+
+    async def predict_many(self, features: np.ndarray):
+        """Scores an already-batched request directly, on the same worker thread."""
+        return await self.run_exclusive(self.predict_fn, features)
+
+    async def run_exclusive(self, func, *args):
+        """Runs func on the worker thread, so it never overlaps a predict call."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _collect(self) -> list:
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait_seconds
+
+        while len(batch) < self.max_batch_size:
+            # Take whatever is already queued without yielding to the loop
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            remaining = deadline - time.perf_counter()
+            if len(batch) >= self.max_batch_size or remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            futures = [future for _, future in batch]
+            try:
+                features = np.vstack([row for row, _ in batch])
+                predictions = await loop.run_in_executor(self._executor, self.predict_fn, features)
+                self.batches += 1
+                self.rows += len(batch)
+                for future, prediction in zip(futures, predictions):
+                    if not future.done():
+                        future.set_result(prediction)
+            except asyncio.CancelledError:
+                for future in futures:
+                    future.cancel()
+                raise
+            except Exception as e:
+                logging.error(f"Batched prediction of {len(batch)} rows failed: {e}")
+                error = NetworkSecurityException(e, sys.exc_info())
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
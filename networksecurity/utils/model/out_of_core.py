@@ -0,0 +1,273 @@
+import os
+import sys
+import shutil
+import tempfile
+import numpy as np
+from scipy.special import expit
+from sklearn.base import BaseEstimator, ClassifierMixin
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+
+
+def _map_rows(file_path: str, dtype, width: int, start: int, stop: int, mode: str = "r") -> np.ndarray:
+    """Rows start:stop of a headerless (rows, width) file, mapped on their own."""
+    itemsize = np.dtype(dtype).itemsize
+    return np.memmap(file_path, dtype=dtype, mode=mode, offset=start * width * itemsize, shape=(stop - start, width))
+
+
+class StreamingHistGradientBoostingClassifier(ClassifierMixin, BaseEstimator):
+    """
+    Binary gradient boosting on histogram-binned features that trains from a stream
+    of (X, y) chunks, for data larger than memory.
+
+    The first pass learns the bin edges from the first chunk and spills the binned
+    features (uint8) and labels to work files; every later pass reads those files
+    in batch_size chunks, each mapped and unmapped on its own. Trees are complete
+    binary trees of max_depth levels grown one level per pass from gradient
+    histograms, so a fit reads the data n_estimators * max_depth times. The running
+    scores live in a work file too, so memory use does not grow with the rows.
+    Missing values get a bin of their own, after every value bin.
+    """
+
+    def __init__(
+        self,
+        n_estimators: int = 100,
+        learning_rate: float = 0.1,
+        max_depth: int = 3,
+        max_bins: int = 32,
+        l2_regularization: float = 1.0,
+        min_samples_leaf: int = 20,
+        batch_size: int = 65536,
+        work_dir: str = None,
+    ):
+        self.n_estimators = n_estimators
+        self.learning_rate = learning_rate
+        self.max_depth = max_depth
+        self.max_bins = max_bins
+        self.l2_regularization = l2_regularization
+        self.min_samples_leaf = min_samples_leaf
+        self.batch_size = batch_size
+        self.work_dir = work_dir
+
+    # ----------------------- Binning -----------------------
+    def _fit_bins(self, X: np.ndarray) -> None:
+        """Bin edges per feature: between the distinct values, or at quantiles when there are too many."""
+        value_bins = self.max_bins - 1
+        self.bin_thresholds_ = []
+        for column in X.T:
+            values = np.unique(column[~np.isnan(column)])
+            if len(values) <= value_bins:
+                thresholds = (values[:-1] + values[1:]) / 2
+            else:
+                thresholds = np.unique(np.quantile(values, np.linspace(0, 1, value_bins + 1)[1:-1]))
+            self.bin_thresholds_.append(thresholds)
+        self.n_features_in_ = X.shape[1]
+
+    def _bin(self, X: np.ndarray) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        binned = np.empty(X.shape, dtype=np.uint8)
+        for j, thresholds in enumerate(self.bin_thresholds_):
+            column = X[:, j]
+            binned[:, j] = np.searchsorted(thresholds, column, side="right")
+            binned[np.isnan(column), j] = self.max_bins - 1
+        return binned
+
+    # ----------------------- Trees -----------------------
+    def _descend(self, binned: np.ndarray, tree: int, levels: int) -> np.ndarray:
+        """Heap index of the node each row reaches after `levels` splits of tree."""
+        features, thresholds = self.split_features_[tree], self.split_bins_[tree]
+        node = np.zeros(len(binned), dtype=np.intp)
+        rows = np.arange(len(binned))
+        for _ in range(levels):
+            right = binned[rows, features[node]] > thresholds[node]
+            node = 2 * node + 1 + right
+        return node
+
+    def _tree_scores(self, binned: np.ndarray, tree: int) -> np.ndarray:
+        leaves = self._descend(binned, tree, self.max_depth) - (2**self.max_depth - 1)
+        return self.leaf_values_[tree][leaves]
+
+    def _grow_level(self, tree: int, level: int, histograms: np.ndarray) -> None:
+        """Picks the split of every node of the level from its (gradient, hessian, count) histograms."""
+        lam = self.l2_regularization
+        first = 2**level - 1
+        for k, (grad, hess, count) in enumerate(histograms):
+            node = first + k
+            grad_left, hess_left, count_left = (np.cumsum(stat, axis=1)[:, :-1] for stat in (grad, hess, count))
+            grad_total, hess_total, count_total = grad[0].sum(), hess[0].sum(), count[0].sum()
+            gain = (
+                grad_left**2 / (hess_left + lam)
+                + (grad_total - grad_left) ** 2 / (hess_total - hess_left + lam)
+                - grad_total**2 / (hess_total + lam)
+            )
+            allowed = (count_left >= self.min_samples_leaf) & (count_total - count_left >= self.min_samples_leaf)
+            gain = np.where(allowed, gain, 0.0)
+            feature, threshold = np.unravel_index(np.argmax(gain), gain.shape)
+
+            if gain[feature, threshold] > 0:
+                self.split_features_[tree, node] = feature
+                self.split_bins_[tree, node] = threshold
+                sides = [
+                    (grad_left[feature, threshold], hess_left[feature, threshold]),
+                    (grad_total - grad_left[feature, threshold], hess_total - hess_left[feature, threshold]),
+                ]
+            else:
+                # No split: every row goes left (no bin is above max_bins)
+                self.split_bins_[tree, node] = self.max_bins
+                sides = [(grad_total, hess_total), (0.0, 0.0)]
+
+            if level == self.max_depth - 1:
+                leaf = 2 * k
+                for offset, (grad_sum, hess_sum) in enumerate(sides):
+                    self.leaf_values_[tree, leaf + offset] = -self.learning_rate * grad_sum / (hess_sum + lam)
+
+    # ----------------------- Fit -----------------------
+    def _spill(self, batches, binned_file_path: str, labels_file_path: str) -> int:
+        """First pass: bins every chunk and appends it to the work files. Returns the row count."""
+        rows = 0
+        classes = np.array([])
+        with open(binned_file_path, "wb") as binned_file, open(labels_file_path, "wb") as labels_file:
+            for X, y in batches:
+                X, y = np.asarray(X, dtype=np.float64), np.asarray(y)
+                if rows == 0:
+                    self._fit_bins(X)
+                classes = np.union1d(classes, np.unique(y))
+                if len(classes) > 2:
+                    raise ValueError(f"Only binary targets are supported, got classes {classes}")
+                self._bin(X).tofile(binned_file)
+                # Raw labels: which class is the positive one is only known after the last chunk
+                y.astype(np.float64).tofile(labels_file)
+                rows += len(y)
+
+        if rows == 0:
+            raise ValueError("No training rows")
+        if len(classes) < 2:
+            raise ValueError(f"Need two classes to train, got {classes}")
+        self.classes_ = classes
+        return rows
+
+    def fit_batches(self, batches):
+        """Fits on an iterable of (X, y) chunks, which is read exactly once."""
+        try:
+            n_nodes, n_leaves = 2**self.max_depth - 1, 2**self.max_depth
+            work_dir = tempfile.mkdtemp(prefix="streaming_hgb_", dir=self.work_dir)
+            try:
+                binned_file_path = os.path.join(work_dir, "binned.u8")
+                labels_file_path = os.path.join(work_dir, "labels.f8")
+                scores_file_path = os.path.join(work_dir, "scores.f8")
+                rows = self._spill(batches, binned_file_path, labels_file_path)
+                n_features, n_bins = self.n_features_in_, self.max_bins
+
+                positive_class = self.classes_[1]
+                positives = 0
+                for start in range(0, rows, self.batch_size):
+                    labels = _map_rows(labels_file_path, np.float64, 1, start, min(start + self.batch_size, rows))
+                    positives += int((labels == positive_class).sum())
+                rate = min(max(positives / rows, 1e-6), 1 - 1e-6)
+                self.baseline_ = float(np.log(rate / (1 - rate)))
+                np.full(rows, self.baseline_).tofile(scores_file_path)
+
+                self.split_features_ = np.zeros((self.n_estimators, n_nodes), dtype=np.intp)
+                self.split_bins_ = np.zeros((self.n_estimators, n_nodes), dtype=np.intp)
+                self.leaf_values_ = np.zeros((self.n_estimators, n_leaves))
+
+                for tree in range(self.n_estimators):
+                    for level in range(self.max_depth):
+                        n_level_nodes = 2**level
+                        size = n_level_nodes * n_features * n_bins
+                        histograms = np.zeros((3, size))
+                        for start in range(0, rows, self.batch_size):
+                            stop = min(start + self.batch_size, rows)
+                            binned = _map_rows(binned_file_path, np.uint8, n_features, start, stop)
+                            labels = _map_rows(labels_file_path, np.float64, 1, start, stop)[:, 0] == positive_class
+                            if level == 0 and tree > 0:
+                                # The previous tree's scores are added on the first pass of the next one
+                                scores = _map_rows(scores_file_path, np.float64, 1, start, stop, mode="r+")
+                                scores[:, 0] += self._tree_scores(binned, tree - 1)
+                                scores.flush()
+                                del scores
+                            scores = _map_rows(scores_file_path, np.float64, 1, start, stop)[:, 0]
+
+                            probability = expit(scores)
+                            gradient, hessian = probability - labels, probability * (1 - probability)
+                            node = self._descend(binned, tree, level) - (n_level_nodes - 1)
+                            keys = ((node[:, None] * n_features + np.arange(n_features)) * n_bins + binned).ravel()
+                            histograms[0] += np.bincount(keys, np.repeat(gradient, n_features), minlength=size)
+                            histograms[1] += np.bincount(keys, np.repeat(hessian, n_features), minlength=size)
+                            histograms[2] += np.bincount(keys, minlength=size)
+
+                        histograms = histograms.reshape(3, n_level_nodes, n_features, n_bins).transpose(1, 0, 2, 3)
+                        self._grow_level(tree, level, histograms)
+
+                logging.info(
+                    f"Streaming boosting fitted: {self.n_estimators} trees of depth {self.max_depth} "
+                    f"on {rows} rows ({self.n_estimators * self.max_depth + 1} passes)"
+                )
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+            return self
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def fit(self, X, y):
+        X, y = np.asarray(X), np.asarray(y)
+        return self.fit_batches(
+            (X[start : start + self.batch_size], y[start : start + self.batch_size])
+            for start in range(0, len(X), self.batch_size)
+        )
+
+    # ----------------------- Predict -----------------------
+    def decision_function(self, X) -> np.ndarray:
+        binned = self._bin(X)
+        scores = np.full(len(binned), self.baseline_)
+        for tree in range(self.n_estimators):
+            scores += self._tree_scores(binned, tree)
+        return scores
+
+    def predict_proba(self, X) -> np.ndarray:
+        probability = expit(self.decision_function(X))
+        return np.c_[1 - probability, probability]
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[(self.decision_function(X) > 0).astype(np.intp)]
+
+
+def fit_incremental(model, reader, classes, batch_size: int, epochs: int, random_state: int = None):
+    """
+    Trains a partial_fit estimator with epochs passes over a NumpyArrayReader, in
+    shuffled batch_size chunks. partial_fit needs every class up front.
+    """
+    try:
+        rng = np.random.default_rng(random_state)
+        for _ in range(epochs):
+            for X, y in reader.iter_chunks(batch_size, rng):
+                model.partial_fit(X, y, classes=classes)
+        return model
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+def stream_confusion_counts(model, reader, batch_size: int) -> dict:
+    """tp / fp / fn / tn of model.predict over a NumpyArrayReader, one chunk in memory at a time."""
+    try:
+        counts = {"tp": 0, "fp": 0, "fn": 0, "tn": 0}
+        for X, y in reader.iter_chunks(batch_size):
+            predicted, actual = model.predict(X) == 1, y == 1
+            counts["tp"] += int((predicted & actual).sum())
+            counts["fp"] += int((predicted & ~actual).sum())
+            counts["fn"] += int((~predicted & actual).sum())
+            counts["tn"] += int((~predicted & ~actual).sum())
+        return counts
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
+
+
+def r2_from_counts(counts: dict) -> float:
+    """r2_score of 0/1 predictions against 0/1 labels, from their confusion counts."""
+    rows = sum(counts.values())
+    positives = counts["tp"] + counts["fn"]
+    total_variance = positives - positives**2 / rows if rows else 0.0
+    if total_variance == 0:
+        return 0.0
+    return 1 - (counts["fp"] + counts["fn"]) / total_variance
@@ -0,0 +1,243 @@
+import sys
+import numpy as np
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+from networksecurity.utils.ternary import pack_rows
+
+CACHE_POLICIES = ("lru", "lfu")
+
+# Fibonacci hashing multiplier: spreads the packed keys over the table slots
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+# Share of max_size freed at once when the cache is full, so the table is
+# rebuilt once per many inserts instead of on every insert
+EVICTION_FRACTION = 0.1
+
+
+class PredictionCache:
+    """
+    Fixed-size map from packed feature rows (uint64) to predictions.
+
+    Stored as an open-addressing hash table in NumPy arrays with linear probing,
+    so a whole batch of keys is looked up or inserted in a few vectorized passes.
+    The table holds at most max_size entries and keeps its load factor at or
+    below one half. When full, the least recently used ("lru") or least often
+    hit ("lfu", ties broken by recency) entries are evicted together. Entries
+    belong to one model_version; a different version clears the cache.
+    """
+
+    def __init__(self, max_size: int, policy: str = "lru", model_version: str = None):
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy: {policy}")
+        self.max_size = max(int(max_size), 1)
+        self.policy = policy
+        self.model_version = model_version
+
+        self.capacity = 1 << int(np.ceil(np.log2(2 * self.max_size)))
+        self._shift = np.uint64(64 - int(np.log2(self.capacity)))
+        self.keys = np.zeros(self.capacity, dtype=np.uint64)
+        self.occupied = np.zeros(self.capacity, dtype=bool)
+        self.last_used = np.zeros(self.capacity, dtype=np.int64)
+        self.use_count = np.zeros(self.capacity, dtype=np.int64)
+        self.values = None
+        self.size = 0
+        self._clock = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "policy": self.policy,
+            "model_version": self.model_version,
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def clear(self) -> None:
+        self.occupied[:] = False
+        self.last_used[:] = 0
+        self.use_count[:] = 0
+        self.size = 0
+
+    def ensure_version(self, model_version: str) -> None:
+        """Drops every entry when the predictions were made by another model version."""
+        if model_version != self.model_version:
+            if self.size:
+                self.invalidations += 1
+                logging.info(f"Model version {self.model_version} -> {model_version}: cleared {self.size} cached predictions")
+            self.clear()
+            self.model_version = model_version
+
+    def _home_slots(self, keys: np.ndarray) -> np.ndarray:
+        return ((keys * _HASH_MULTIPLIER) >> self._shift).astype(np.intp)
+
+    def _find(self, keys: np.ndarray) -> np.ndarray:
+        """Slot holding each key, or -1."""
+        slots = np.full(len(keys), -1, dtype=np.intp)
+        pending = np.arange(len(keys))
+        probe = self._home_slots(keys)
+        mask = self.capacity - 1
+
+        while len(pending):
+            occupied = self.occupied[probe]
+            match = occupied & (self.keys[probe] == keys[pending])
+            slots[pending[match]] = probe[match]
+            # An empty slot ends the probe sequence: the key is absent
+            keep = occupied & ~match
+            pending = pending[keep]
+            probe = (probe[keep] + 1) & mask
+
+        return slots
+
+    def _place(self, keys: np.ndarray) -> np.ndarray:
+        """Claims a free slot for each (distinct, absent) key and returns the slots."""
+        slots = np.empty(len(keys), dtype=np.intp)
+        pending = np.arange(len(keys))
+        probe = self._home_slots(keys)
+        mask = self.capacity - 1
+
+        while len(pending):
+            claim = ~self.occupied[probe]
+            if len(pending) > 1:
+                # Several keys may probe the same free slot: the first one claims it
+                _, first = np.unique(np.where(claim, probe, -1), return_index=True)
+                first_probe = np.zeros(len(pending), dtype=bool)
+                first_probe[first] = True
+                claim &= first_probe
+
+            claimed = probe[claim]
+            self.occupied[claimed] = True
+            self.keys[claimed] = keys[pending[claim]]
+            slots[pending[claim]] = claimed
+
+            pending = pending[~claim]
+            probe = (probe[~claim] + 1) & mask
+
+        return slots
+
+    def _evict(self, count: int) -> None:
+        """Removes the count lowest-ranked entries and rebuilds the probe sequences."""
+        occupied = np.flatnonzero(self.occupied)
+        if self.policy == "lru":
+            order = np.argsort(self.last_used[occupied], kind="stable")
+        else:
+            order = np.lexsort((self.last_used[occupied], self.use_count[occupied]))
+        kept = occupied[order[count:]]
+
+        keys, values = self.keys[kept], self.values[kept]
+        last_used, use_count = self.last_used[kept], self.use_count[kept]
+
+        # Deleting from a linear-probing table would break the probe chains of the
+        # remaining keys, so they are reinserted into an empty table instead
+        self.clear()
+        slots = self._place(keys)
+        self.values[slots] = values
+        self.last_used[slots] = last_used
+        self.use_count[slots] = use_count
+        self.size = len(kept)
+        self.evictions += count
+
+    def lookup(self, keys: np.ndarray) -> tuple:
+        """Returns (values, hit) for a batch of keys; values are only meaningful where hit."""
+        try:
+            self._clock += 1
+            slots = self._find(keys) if self.size else np.full(len(keys), -1, dtype=np.intp)
+            hit = slots >= 0
+
+            hit_slots = slots[hit]
+            self.last_used[hit_slots] = self._clock
+            np.add.at(self.use_count, hit_slots, 1)
+            self.hits += int(hit.sum())
+            self.misses += int(len(keys) - hit.sum())
+
+            if self.values is None:
+                return None, hit
+            values = self.values[np.where(hit, slots, 0)]
+            return values, hit
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def insert(self, keys: np.ndarray, values: np.ndarray) -> None:
+        """Adds distinct keys that are not cached yet, evicting entries if the cache is full."""
+        try:
+            keys, values = keys[-self.max_size :], np.asarray(values)[-self.max_size :]
+            if self.values is None:
+                self.values = np.zeros(self.capacity, dtype=values.dtype)
+
+            overflow = self.size + len(keys) - self.max_size
+            if overflow > 0:
+                self._evict(min(self.size, overflow + int(self.max_size * EVICTION_FRACTION)))
+
+            slots = self._place(keys)
+            self.values[slots] = values
+            self.last_used[slots] = self._clock
+            self.use_count[slots] = 1
+            self.size += len(keys)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+
+class CachedNetworkModel:
+    """
+    Puts a PredictionCache in front of a NetworkModel. Each predict() packs the
+    rows, answers the cached ones from the cache and sends only the distinct
+    uncached rows to the model. Rows that do not pack (values outside
+    {-1, 0, 1, NaN}) always go to the model.
+    """
+
+    def __init__(self, network_model, cache: PredictionCache, model_version: str = None):
+        self.network_model = network_model
+        self.cache = cache
+        self.cache.ensure_version(model_version)
+
+    def set_model(self, network_model, model_version: str) -> None:
+        """Swaps in another model; cached predictions of an older version are dropped."""
+        self.network_model = network_model
+        self.cache.ensure_version(model_version)
+
+    def _predict_packed(self, x: np.ndarray, keys: np.ndarray) -> np.ndarray:
+        cached, hit = self.cache.lookup(keys)
+        if hit.all():
+            return cached
+
+        missed = np.flatnonzero(~hit)
+        if len(missed) == 1:
+            unique_keys, first, inverse = keys[missed], np.zeros(1, dtype=np.intp), np.zeros(1, dtype=np.intp)
+        else:
+            # Repeated rows inside the batch are scored once
+            unique_keys, first, inverse = np.unique(keys[missed], return_index=True, return_inverse=True)
+        fresh = np.asarray(self.network_model.predict(x[missed[first]]))
+        self.cache.insert(unique_keys, fresh)
+
+        predictions = cached if cached is not None else np.empty(len(x), dtype=fresh.dtype)
+        predictions[missed] = fresh[inverse.ravel()]
+        return predictions
+
+    def predict(self, x):
+        try:
+            x = np.asarray(x)
+            keys, packable = pack_rows(x)
+            if packable.all():
+                return self._predict_packed(x, keys)
+
+            rest = np.asarray(self.network_model.predict(x[~packable]))
+            predictions = np.empty(len(x), dtype=rest.dtype)
+            predictions[~packable] = rest
+            if packable.any():
+                predictions[packable] = self._predict_packed(x[packable], keys[packable])
+            return predictions
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
@@ -0,0 +1,421 @@
+import os
+import sys
+import math
+import time
+import tempfile
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.base import clone
+from sklearn.ensemble._forest import BaseForest
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import ParameterGrid, ParameterSampler, StratifiedKFold
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+
+SEARCH_STRATEGIES = ("grid", "random", "halving")
+HALVING_RESOURCES = ("n_samples", "n_estimators")
+
+# Grid/random searches are dispatched in batches of this many tasks per worker,
+# so the time budget is checked between batches
+TASKS_PER_WORKER_BATCH = 4
+
+
+def _fit_and_score(model, params: dict, X, y, train_index, test_index):
+    """
+    Fits one (params, fold) candidate in a worker process and returns (score, seconds,
+    end time as time.time()). X and y arrive as read-only memmaps, so only the fold
+    indices are pickled.
+    """
+    start_time = time.perf_counter()
+    estimator = clone(model).set_params(**params)
+    estimator.fit(X[train_index], y[train_index])
+    score = estimator.score(X[test_index], y[test_index])
+    return score, time.perf_counter() - start_time, time.time()
+
+
+def _path_scores(estimator, path_param: str, path_values: list, X_test, y_test) -> list:
+    """
+    Scores every smaller ensemble size from one fitted ensemble:
+    staged predictions for boosting, averaged tree prefixes for forests.
+    """
+    y_test = np.asarray(y_test)
+    wanted = sorted(set(path_values))
+    scores = {}
+
+    if hasattr(estimator, "staged_predict"):
+        last_score = None
+        for stage, y_pred in enumerate(estimator.staged_predict(X_test), start=1):
+            last_score = accuracy_score(y_test, y_pred)
+            if stage in wanted:
+                scores[stage] = last_score
+        # Early stopping (or a perfect fit) ends boosting before the largest size,
+        # which is exactly where a standalone fit of that size would have stopped too
+        for size in wanted:
+            scores.setdefault(size, last_score)
+    else:
+        # Trees of a seeded forest are drawn in the same order whatever n_estimators
+        # is, so the first k trees are the forest a fit with n_estimators=k would build
+        X_float = np.asarray(X_test, dtype=np.float32)
+        proba_sum = np.zeros((len(X_float), len(estimator.classes_)))
+        for size, tree in enumerate(estimator.estimators_, start=1):
+            proba_sum += tree.predict_proba(X_float)
+            if size in wanted:
+                y_pred = estimator.classes_.take(np.argmax(proba_sum, axis=1))
+                scores[size] = accuracy_score(y_test, y_pred)
+
+    return [scores[value] for value in path_values]
+
+
+def _fit_and_score_path(model, params: dict, path_param: str, path_values: list, X, y, train_index, test_index):
+    """
+    Scores a whole sweep of path_param from as few fits as possible and returns
+    (scores in path_values order, seconds, end time). n_estimators sweeps fit the largest
+    ensemble once; C sweeps of LogisticRegression are warm-started from small C upwards.
+    """
+    start_time = time.perf_counter()
+    X_train, y_train = X[train_index], y[train_index]
+    X_test, y_test = X[test_index], y[test_index]
+
+    if path_param == "n_estimators":
+        estimator = clone(model).set_params(**params, n_estimators=max(path_values))
+        estimator.fit(X_train, y_train)
+        scores = _path_scores(estimator, path_param, path_values, X_test, y_test)
+    else:
+        estimator = clone(model).set_params(**params, warm_start=True)
+        scores_by_value = {}
+        for value in sorted(set(path_values)):
+            estimator.set_params(**{path_param: value})
+            estimator.fit(X_train, y_train)
+            scores_by_value[value] = estimator.score(X_test, y_test)
+        scores = [scores_by_value[value] for value in path_values]
+
+    return scores, time.perf_counter() - start_time, time.time()
+
+
+def _path_param(model, param_grid: dict):
+    """The swept parameter that can be scored from a single fit, if any."""
+    if "n_estimators" in param_grid and len(param_grid["n_estimators"]) > 1:
+        if hasattr(model, "staged_predict") or isinstance(model, BaseForest):
+            return "n_estimators"
+    if "C" in param_grid and len(param_grid["C"]) > 1 and isinstance(model, LogisticRegression):
+        return "C"
+    return None
+
+
+def _shared_array(array, file_path: str) -> np.ndarray:
+    """
+    array as a read-only memmap the workers can open by file name: a memmap of a
+    whole .npy file (the trainer's transformed arrays) is used as it is, anything
+    else is written to file_path first.
+    """
+    if isinstance(array, np.memmap) and str(array.filename).endswith(".npy") and array.flags.c_contiguous:
+        mapped = np.load(array.filename, mmap_mode="r")
+        if mapped.shape == array.shape and mapped.dtype == array.dtype and mapped.offset == array.offset:
+            return mapped
+    np.save(file_path, np.ascontiguousarray(array))
+    return np.load(file_path, mmap_mode="r")
+
+
+def _refit(model, params: dict, X, y):
+    start_time = time.perf_counter()
+    estimator = clone(model).set_params(**params)
+    estimator.fit(X, y)
+    return estimator, time.perf_counter() - start_time
+
+
+class _FamilyState:
+    """Remaining candidates, scores and timings of one model family during a search."""
+
+    def __init__(self, name, model, candidates, resource=None, resource_schedule=None, path_param=None):
+        self.name = name
+        self.model = model
+        self.path_param = path_param
+        self.candidates = candidates
+        self.resource = resource
+        self.resource_schedule = resource_schedule or [None]
+        self.round = 0
+        self.best_params = None
+        self.best_score = -np.inf
+        # fit_seconds sums the fits in the workers; finished_at is the time.time() at
+        # which the family's last fit ended, in whichever worker ran it
+        self.fit_seconds = 0.0
+        self.finished_at = None
+        self.fits = 0
+        self.model_fits = 0
+        self.done = False
+
+
+class ModelSearch:
+    """
+    Parallel hyperparameter search over several model families at once.
+
+    strategy:
+      "grid"    - every combination of the parameter grid
+      "random"  - n_iter combinations sampled from the grid per family
+      "halving" - successive halving: all candidates are scored with a small resource
+                  (training rows, or n_estimators for ensembles), the best 1/factor
+                  are kept and the resource is multiplied by factor each round
+
+    Every round fans (family, candidate, fold) fits out over one process pool;
+    training arrays are shared with workers as memory-mapped files. The search
+    stops early once budget_seconds is exceeded and keeps the best seen so far.
+
+    With warm_start, candidates that only differ in n_estimators (ensembles) or C
+    (LogisticRegression) share one fit per fold: the largest ensemble is fit once
+    and smaller sizes are scored from its stages, C is swept as a warm-started path.
+    """
+
+    def __init__(
+        self,
+        strategy: str = "grid",
+        cv: int = 3,
+        n_jobs: int = -1,
+        budget_seconds: float = None,
+        n_iter: int = 10,
+        factor: int = 3,
+        resource: str = "n_samples",
+        min_samples: int = 500,
+        random_state: int = None,
+        warm_start: bool = True,
+    ):
+        if strategy not in SEARCH_STRATEGIES:
+            raise ValueError(f"Unknown search strategy: {strategy}, expected one of {SEARCH_STRATEGIES}")
+        if resource not in HALVING_RESOURCES:
+            raise ValueError(f"Unknown halving resource: {resource}, expected one of {HALVING_RESOURCES}")
+
+        self.strategy = strategy
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.budget_seconds = budget_seconds
+        self.n_iter = n_iter
+        self.factor = factor
+        self.resource = resource
+        self.min_samples = min_samples
+        self.random_state = random_state
+        self.warm_start = warm_start
+
+    def _over_budget(self, start_time: float) -> bool:
+        return self.budget_seconds is not None and time.perf_counter() - start_time > self.budget_seconds
+
+    def _halving_schedule(self, n_candidates: int, min_resource: int, max_resource: int, values: list = None) -> list:
+        """
+        Resources per round, ending at exactly max_resource once a single candidate is
+        left and divided by factor going back from there. With values (the grid's
+        n_estimators) every round is snapped to the nearest of them.
+        """
+        n_rounds = max(1, math.ceil(math.log(max(n_candidates, 1), self.factor)) + 1)
+        schedule = [max(min_resource, max_resource // self.factor ** (n_rounds - 1 - k)) for k in range(n_rounds)]
+        if values is not None:
+            schedule = [min(values, key=lambda value: (abs(value - resource), value)) for resource in schedule]
+        return schedule
+
+    def _init_family(self, name, model, param_grid, n_train: int) -> _FamilyState:
+        grid = list(ParameterGrid(param_grid))
+
+        if self.strategy == "random" and len(grid) > self.n_iter:
+            grid = list(
+                ParameterSampler(param_grid, n_iter=self.n_iter, random_state=self.random_state)
+            )
+
+        path_param = _path_param(model, param_grid) if self.warm_start else None
+
+        if self.strategy != "halving" or len(grid) == 1:
+            return _FamilyState(name, model, grid, path_param=path_param)
+
+        if self.resource == "n_estimators" and "n_estimators" in param_grid:
+            # n_estimators becomes the budget, so drop it from the candidate grid
+            estimator_values = list(param_grid["n_estimators"])
+            reduced_grid = {key: value for key, value in param_grid.items() if key != "n_estimators"}
+            candidates = list(ParameterGrid(reduced_grid))
+            schedule = self._halving_schedule(
+                len(candidates), min(estimator_values), max(estimator_values), estimator_values
+            )
+            path_param = _path_param(model, reduced_grid) if self.warm_start else None
+            return _FamilyState(name, model, candidates, "n_estimators", schedule, path_param)
+
+        schedule = self._halving_schedule(len(grid), min(self.min_samples, n_train), n_train)
+        return _FamilyState(name, model, grid, "n_samples", schedule, path_param)
+
+    def _round_tasks(self, family: _FamilyState, folds: list, rng_order: np.ndarray) -> list:
+        """(family, candidate_index, params, train_index, test_index) for the family's current round."""
+        budget = family.resource_schedule[min(family.round, len(family.resource_schedule) - 1)]
+        tasks = []
+        for candidate_index, params in enumerate(family.candidates):
+            params = dict(params)
+            if family.resource == "n_estimators":
+                params["n_estimators"] = budget
+
+            for train_index, test_index in folds:
+                if family.resource == "n_samples":
+                    # Deterministic pseudo-random subset of the fold's training rows
+                    train_size = max(1, int(budget * len(train_index) / len(rng_order)))
+                    train_index = train_index[np.argsort(rng_order[train_index], kind="stable")[:train_size]]
+                tasks.append((family, candidate_index, params, train_index, test_index))
+        return tasks
+
+    @staticmethod
+    def _group_path_tasks(tasks: list) -> list:
+        """
+        Groups tasks of one family and fold that differ only in the family's path
+        parameter. Returns (family, params, path_values, train_index, test_index, members).
+        """
+        groups = {}
+        for task_index, (family, _, params, train_index, test_index) in enumerate(tasks):
+            path_param = family.path_param
+            base_params = {key: value for key, value in params.items() if key != path_param}
+            key = (id(family), repr(sorted(base_params.items())), id(test_index), len(train_index))
+            if key not in groups:
+                groups[key] = (family, base_params, [], train_index, test_index, [])
+            group = groups[key]
+            group[2].append(params.get(path_param))
+            group[5].append(task_index)
+        return list(groups.values())
+
+    def _run_tasks(self, parallel, tasks, X_shared, y_shared, start_time, batched: bool):
+        """Runs tasks in one go (or batch by batch under a budget); returns finished results."""
+        groups = self._group_path_tasks(tasks)
+
+        batch_size = len(groups)
+        if batched and self.budget_seconds is not None:
+            batch_size = max(1, effective_n_jobs(self.n_jobs) * TASKS_PER_WORKER_BATCH)
+
+        finished = []
+        for start in range(0, len(groups), batch_size):
+            if start and self._over_budget(start_time):
+                logging.warning(f"Search budget of {self.budget_seconds}s exhausted, skipping remaining fits")
+                break
+            batch = groups[start : start + batch_size]
+            results = parallel(
+                delayed(_fit_and_score_path)(
+                    family.model, params, family.path_param, path_values,
+                    X_shared, y_shared, train_index, test_index,
+                )
+                if family.path_param is not None
+                else delayed(_fit_and_score)(family.model, params, X_shared, y_shared, train_index, test_index)
+                for family, params, path_values, train_index, test_index, _ in batch
+            )
+
+            # Expand each group result back to one (score, seconds, model_fits, end time) per candidate
+            for (family, _, _, _, _, members), (scores, seconds, end_time) in zip(batch, results):
+                scores = scores if family.path_param is not None else [scores]
+                for position, (task_index, score) in enumerate(zip(members, scores)):
+                    finished.append(
+                        (tasks[task_index], (score, seconds / len(members), int(position == 0), end_time))
+                    )
+
+        return finished
+
+    def _score_round(self, families: list, finished: list) -> None:
+        """Averages fold scores per candidate, records the best, keeps the top 1/factor."""
+        for family in families:
+            fold_scores = {}
+            for (task_family, candidate_index, params, _, _), (score, seconds, model_fits, end_time) in finished:
+                if task_family is not family:
+                    continue
+                fold_scores.setdefault(candidate_index, (params, []))[1].append(score)
+                family.fit_seconds += seconds
+                family.finished_at = max(family.finished_at or end_time, end_time)
+                family.fits += 1
+                family.model_fits += model_fits
+
+            # Only candidates with every fold scored are comparable
+            complete = [
+                (candidate_index, params, float(np.mean(scores)))
+                for candidate_index, (params, scores) in sorted(fold_scores.items())
+                if len(scores) == self.cv
+            ]
+            if not complete:
+                family.done = True
+                continue
+
+            # First best on ties, like GridSearchCV
+            best_index = int(np.argmax([score for _, _, score in complete]))
+            _, best_params, best_score = complete[best_index]
+            family.best_params, family.best_score = best_params, best_score
+
+            if self.strategy != "halving" or family.resource is None:
+                family.done = True
+                continue
+
+            keep = max(1, math.ceil(len(complete) / self.factor))
+            ranked = sorted(range(len(complete)), key=lambda i: (-complete[i][2], i))[:keep]
+            family.candidates = [
+                {key: value for key, value in complete[i][1].items()
+                 if not (family.resource == "n_estimators" and key == "n_estimators")}
+                for i in sorted(ranked)
+            ]
+            family.round += 1
+            # A lone n_estimators candidate still climbs to the full ensemble size;
+            # a lone n_samples candidate is refit on all rows anyway
+            family.done = family.round >= len(family.resource_schedule) or (
+                len(family.candidates) == 1 and family.resource == "n_samples"
+            )
+
+    def search(self, X_train, y_train, models: dict, params: dict):
+        """
+        Returns (best_estimators, timing_report) where best_estimators maps each family
+        that finished at least one candidate to its best parameters refit on all of X_train.
+        """
+        try:
+            start_time = time.perf_counter()
+            # Wall clock, comparable with the end times the worker processes report
+            search_started_at = time.time()
+            folds = list(StratifiedKFold(n_splits=self.cv).split(X_train, y_train))
+            rng_order = np.random.default_rng(self.random_state).permutation(len(y_train))
+
+            families = [self._init_family(name, model, params[name], len(y_train)) for name, model in models.items()]
+
+            with tempfile.TemporaryDirectory() as mmap_dir:
+                # Share the training arrays with the workers through memory-mapped files
+                X_shared = _shared_array(X_train, os.path.join(mmap_dir, "X_train.npy"))
+                y_shared = _shared_array(y_train, os.path.join(mmap_dir, "y_train.npy"))
+
+                with Parallel(n_jobs=self.n_jobs) as parallel:
+                    round_number = 0
+                    while True:
+                        active = [family for family in families if not family.done]
+                        if not active or (round_number and self._over_budget(start_time)):
+                            break
+
+                        tasks = [task for family in active for task in self._round_tasks(family, folds, rng_order)]
+                        logging.info(
+                            f"{self.strategy} search round {round_number}: {len(tasks)} fits "
+                            f"over {len(active)} model families"
+                        )
+                        finished = self._run_tasks(
+                            parallel, tasks, X_shared, y_shared, start_time,
+                            batched=self.strategy != "halving",
+                        )
+                        self._score_round(active, finished)
+                        round_number += 1
+
+                    finalists = [family for family in families if family.best_params is not None]
+                    refits = parallel(
+                        delayed(_refit)(family.model, family.best_params, X_shared, y_shared)
+                        for family in finalists
+                    )
+
+            best_estimators, timing_report = {}, {}
+            for family, (estimator, refit_seconds) in zip(finalists, refits):
+                best_estimators[family.name] = estimator
+                timing_report[family.name] = {
+                    "strategy": self.strategy,
+                    "fits": family.fits,
+                    "model_fits": family.model_fits,
+                    "search_wall_seconds": round(family.finished_at - search_started_at, 3),
+                    "search_fit_seconds": round(family.fit_seconds, 3),
+                    "refit_seconds": round(refit_seconds, 3),
+                    "cv_score": round(family.best_score, 6),
+                    "best_params": family.best_params,
+                }
+
+            skipped = [family.name for family in families if family.best_params is None]
+            if skipped:
+                logging.warning(f"No candidate finished within the budget for: {skipped}")
+
+            logging.info(f"Model search finished in {time.perf_counter() - start_time:.2f}s")
+            return best_estimators, timing_report
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
@@ -0,0 +1,187 @@
+import os
+import sys
+import time
+import yaml
+import cProfile
+import resource
+from contextlib import contextmanager
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+
+# Set while a RunProfiler is active; profile_stage() and record_rows() are no-ops otherwise
+_active_profiler = None
+
+
+def _read_proc_fields(file_path: str) -> dict:
+    try:
+        with open(file_path) as proc_file:
+            fields = (line.split(":", 1) for line in proc_file if ":" in line)
+            return {name: value.split()[0] for name, value in fields if value.strip()}
+    except OSError:
+        return {}
+
+
+def _peak_rss_kb() -> int:
+    """Peak RSS since the last _reset_peak_rss(), or of the whole process where it cannot be reset."""
+    peak = _read_proc_fields("/proc/self/status").get("VmHWM")
+    return int(peak) if peak else resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _reset_peak_rss() -> bool:
+    # Linux: writing 5 to clear_refs resets VmHWM to the current RSS
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _snapshot() -> dict:
+    self_usage = resource.getrusage(resource.RUSAGE_SELF)
+    children_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    io = _read_proc_fields("/proc/self/io")
+    return {
+        "wall": time.perf_counter(),
+        "cpu": self_usage.ru_utime + self_usage.ru_stime,
+        "children_cpu": children_usage.ru_utime + children_usage.ru_stime,
+        # rchar/wchar count every read()/write() (page cache included); block counts are the fallback
+        "bytes_read": int(io["rchar"]) if io else self_usage.ru_inblock * 512,
+        "bytes_written": int(io["wchar"]) if io else self_usage.ru_oublock * 512,
+    }
+
+
+class RunProfiler:
+    """
+    Records wall time, CPU time (own and reaped child processes), peak RSS, bytes
+    read/written and rows processed for every stage run inside it, and writes them
+    as a YAML run report. Stages nest: "model_trainer/predict/Random Forest".
+
+    Stages listed in cprofile_stages also run under cProfile and dump a pstats file
+    (snakeviz, gprof2dot, ...) into profile_dir. Every stage records its pid and
+    unix start/end times, so an external py-spy recording can be cut per stage.
+    """
+
+    def __init__(self, report_file_path: str, profile_dir: str = None, cprofile_stages=()):
+        self.report_file_path = report_file_path
+        self.profile_dir = profile_dir or os.path.dirname(report_file_path)
+        self.cprofile_stages = set(cprofile_stages)
+        self.stages = []
+        self._stack = []
+        self._cprofile_active = False
+        self._peak_rss_resettable = _reset_peak_rss()
+
+    def __enter__(self):
+        global _active_profiler
+        self._previous_profiler, _active_profiler = _active_profiler, self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _active_profiler
+        _active_profiler = self._previous_profiler
+        self.write_report(failed=exc_type is not None)
+
+    @contextmanager
+    def stage(self, name: str, rows: int = None):
+        full_name = f"{self._stack[-1]['stage']}/{name}" if self._stack else name
+        record = {"stage": full_name, "pid": os.getpid(), "rows": rows, "started_at": time.time()}
+
+        if self._stack:
+            # The peak so far belongs to the enclosing stage before it is reset
+            parent = self._stack[-1]
+            parent["_peak_rss_kb"] = max(parent["_peak_rss_kb"], _peak_rss_kb())
+        if self._peak_rss_resettable:
+            _reset_peak_rss()
+        record["_peak_rss_kb"] = _peak_rss_kb()
+
+        profiler = None
+        if not self._cprofile_active and (name in self.cprofile_stages or full_name in self.cprofile_stages):
+            profiler, self._cprofile_active = cProfile.Profile(), True
+
+        self._stack.append(record)
+        start = _snapshot()
+        if profiler:
+            profiler.enable()
+        try:
+            yield record
+        finally:
+            if profiler:
+                profiler.disable()
+                self._cprofile_active = False
+                os.makedirs(self.profile_dir, exist_ok=True)
+                record["cprofile_file_path"] = os.path.join(self.profile_dir, f"{full_name.replace('/', '.')}.prof")
+                profiler.dump_stats(record["cprofile_file_path"])
+
+            end = _snapshot()
+            self._stack.pop()
+            peak_rss_kb = max(record.pop("_peak_rss_kb"), _peak_rss_kb())
+            if self._stack:
+                self._stack[-1]["_peak_rss_kb"] = max(self._stack[-1]["_peak_rss_kb"], peak_rss_kb)
+
+            record.update(
+                {
+                    "ended_at": time.time(),
+                    "wall_seconds": round(end["wall"] - start["wall"], 4),
+                    "cpu_seconds": round(end["cpu"] - start["cpu"], 4),
+                    "children_cpu_seconds": round(end["children_cpu"] - start["children_cpu"], 4),
+                    "peak_rss_mb": round(peak_rss_kb / 1024, 1),
+                    "bytes_read": end["bytes_read"] - start["bytes_read"],
+                    "bytes_written": end["bytes_written"] - start["bytes_written"],
+                }
+            )
+            if record["rows"] and record["wall_seconds"] > 0:
+                record["rows_per_sec"] = round(record["rows"] / record["wall_seconds"], 1)
+            self.stages.append(record)
+            logging.info(
+                f"Stage {full_name}: {record['wall_seconds']}s wall, {record['cpu_seconds']}s cpu, "
+                f"peak RSS {record['peak_rss_mb']} MB, rows={record['rows']}"
+            )
+
+    def record_rows(self, rows: int) -> None:
+        if self._stack:
+            self._stack[-1]["rows"] = (self._stack[-1]["rows"] or 0) + int(rows)
+
+    def add_stage(self, name: str, **fields) -> None:
+        """Adds a stage timed elsewhere (e.g. per-family search inside worker processes)."""
+        full_name = f"{self._stack[-1]['stage']}/{name}" if self._stack else name
+        started_at = self._stack[-1]["started_at"] if self._stack else time.time()
+        self.stages.append({"stage": full_name, "pid": os.getpid(), "started_at": started_at, **fields})
+
+    def write_report(self, failed: bool = False) -> None:
+        try:
+            report = {
+                "pid": os.getpid(),
+                "failed": failed,
+                # Peak RSS is per stage only where VmHWM can be reset (Linux); else process-wide
+                "peak_rss_scope": "stage" if self._peak_rss_resettable else "process",
+                # Start order; a stage added with add_stage() shares its parent's start time
+                "stages": sorted(self.stages, key=lambda record: (record["started_at"], record["stage"].count("/"))),
+            }
+            os.makedirs(os.path.dirname(self.report_file_path), exist_ok=True)
+            with open(self.report_file_path, "w") as report_file:
+                yaml.safe_dump(report, report_file, sort_keys=False)
+            logging.info(f"Run report written to {self.report_file_path}")
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+
+@contextmanager
+def profile_stage(name: str, rows: int = None):
+    """Profiles the block as a stage of the active RunProfiler, if any."""
+    if _active_profiler is None:
+        yield {}
+        return
+    with _active_profiler.stage(name, rows) as record:
+        yield record
+
+
+def record_stage(name: str, **fields) -> None:
+    """Adds a stage timed elsewhere under the innermost running stage of the active RunProfiler."""
+    if _active_profiler is not None:
+        _active_profiler.add_stage(name, **fields)
+
+
+def record_rows(rows: int) -> None:
+    """Adds rows to the innermost running stage of the active RunProfiler."""
+    if _active_profiler is not None:
+        _active_profiler.record_rows(rows)
@@ -0,0 +1,203 @@
+import sys
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+from networksecurity.utils.common import get_schema_dtypes
+from networksecurity.utils.columnar import iter_dataframe_chunks, ChunkedDataFrameWriter
+from networksecurity.utils.drift import value_codes
+
+VALIDATION_ERRORS_COLUMN = "validation_errors"
+
+
+class SchemaValidator:
+    """
+    Streaming validator compiled from data_schema/schema.yaml.
+
+    A file is read in chunks of chunk_size rows and every chunk is checked in
+    vectorized form against the schema:
+      - column set:  missing columns fail the file, extra columns are reported
+      - dtype:       non-numeric, non-integral or out-of-range values for the column dtype
+      - value domain: value_domain / column_domains
+      - nulls:       per-column null ratio against max_null_ratio
+    Rows with a dtype or domain violation, or a null target_column, go to the invalid
+    file with a validation_errors column. The other rows, null cells included (they
+    are left to the imputer), go to the valid file cast to the schema dtypes; integer
+    columns become float there so they can hold NaN. Value histograms of the valid
+    rows are accumulated in the same scan for drift detection.
+    """
+
+    def __init__(self, schema_config: dict, chunk_size: int, target_column: str = None):
+        try:
+            self.chunk_size = chunk_size
+            self.dtypes = get_schema_dtypes(schema_config)
+            self.columns = list(self.dtypes)
+            self.target_column = target_column
+            # float32 holds every int8 / int16 value exactly
+            self.valid_dtypes = {
+                column: (dtype if dtype.kind not in "iu" else np.dtype(np.float32 if dtype.itemsize <= 2 else np.float64))
+                for column, dtype in self.dtypes.items()
+            }
+            self.max_null_ratio = float(schema_config.get("max_null_ratio", 0.0))
+
+            default_domain = schema_config.get("value_domain")
+            column_domains = schema_config.get("column_domains") or {}
+            domains = [column_domains.get(column, default_domain) for column in self.columns]
+
+            self.values = np.unique(
+                np.concatenate([np.asarray(domain) for domain in domains if domain is not None] or [np.array([])])
+            )
+
+            # allowed[column, code]: codes index self.values, the last code is any other value
+            self.allowed = np.ones((len(self.columns), len(self.values) + 1), dtype=bool)
+            for index, domain in enumerate(domains):
+                if domain is not None:
+                    self.allowed[index] = np.append(np.isin(self.values, domain), False)
+
+            self.integral = np.array([dtype.kind in "iu" for dtype in self.dtypes.values()])
+            self.lower = np.array(
+                [np.iinfo(dtype).min if dtype.kind in "iu" else -np.inf for dtype in self.dtypes.values()]
+            )
+            self.upper = np.array(
+                [np.iinfo(dtype).max if dtype.kind in "iu" else np.inf for dtype in self.dtypes.values()]
+            )
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    def check_columns(self, dataframe: pd.DataFrame):
+        """Returns the extra columns; raises if a schema column is missing."""
+        missing = [column for column in self.columns if column not in dataframe.columns]
+        if missing:
+            raise Exception(f"Dataset is missing schema columns: {missing}")
+        return [column for column in dataframe.columns if column not in self.dtypes]
+
+    def validate_chunk(self, chunk: pd.DataFrame):
+        """
+        Returns (valid_df, invalid_df, valid_codes, violations) for one chunk, where
+        violations maps check name -> per-column count of failing cells.
+        """
+        data = chunk[self.columns]
+        n_columns = len(self.columns)
+
+        typed = all(data[column].dtype == dtype for column, dtype in self.dtypes.items())
+        if typed:
+            # Already typed (parquet artifacts): nulls and dtype violations are impossible
+            numeric = data.to_numpy()
+            null = null_target = bad_dtype = None
+        else:
+            if all(is_numeric_dtype(data[column]) for column in self.columns):
+                numeric = data.to_numpy(dtype=np.float64)
+            else:
+                numeric = data.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+            null = data.isna().to_numpy()
+            finite = np.isfinite(numeric)
+            bad_dtype = (
+                (np.isnan(numeric) & ~null)
+                | (self.integral & finite & (numeric != np.round(numeric)))
+                | (numeric < self.lower)
+                | (numeric > self.upper)
+            )
+            # Null features are imputed later, a null target cannot be
+            null_target = np.zeros_like(null)
+            if self.target_column is not None:
+                target = self.columns.index(self.target_column)
+                null_target[:, target] = null[:, target]
+
+        codes = value_codes(numeric, self.values)
+        out_of_domain = ~self.allowed[np.arange(n_columns), codes]
+        if not typed:
+            out_of_domain &= ~null & ~bad_dtype
+            invalid = (null_target | bad_dtype | out_of_domain).any(axis=1)
+        else:
+            invalid = out_of_domain.any(axis=1)
+
+        no_violations = np.zeros(n_columns, dtype=np.int64)
+        violations = {
+            "null": no_violations if typed else null.sum(axis=0),
+            "dtype": no_violations if typed else bad_dtype.sum(axis=0),
+            "domain": out_of_domain.sum(axis=0),
+        }
+
+        if not invalid.any():
+            valid_df = (
+                data.reset_index(drop=True) if typed else pd.DataFrame(numeric, columns=self.columns)
+            ).astype(self.valid_dtypes)
+            return valid_df, None, codes, violations
+
+        valid_df = pd.DataFrame(numeric[~invalid], columns=self.columns).astype(self.valid_dtypes)
+
+        invalid_df = pd.DataFrame(numeric[invalid].astype(np.float64), columns=self.columns)
+        errors = [[] for _ in range(len(invalid_df))]
+        for check, mask in (("null", null_target), ("dtype", bad_dtype), ("domain", out_of_domain)):
+            if mask is None:
+                continue
+            for row, column in zip(*np.nonzero(mask[invalid])):
+                errors[row].append(f"{check}:{self.columns[column]}")
+        invalid_df[VALIDATION_ERRORS_COLUMN] = [";".join(row_errors) for row_errors in errors]
+
+        return valid_df, invalid_df, codes[~invalid], violations
+
+    def validate_file(self, file_path: str, valid_file_path: str, invalid_file_path: str):
+        """
+        Validates a parquet / CSV file in one chunked scan.
+        Returns (report, counts): the report dict and the (n_columns, len(values) + 1)
+        value histograms of the valid rows.
+        """
+        try:
+            n_columns, n_bins = len(self.columns), len(self.values) + 1
+            counts = np.zeros((n_columns, n_bins), dtype=np.int64)
+            offsets = np.arange(n_columns) * n_bins
+            violations = {check: np.zeros(n_columns, dtype=np.int64) for check in ("null", "dtype", "domain")}
+            rows, extra_columns = 0, None
+
+            valid_writer = ChunkedDataFrameWriter(valid_file_path)
+            invalid_writer = ChunkedDataFrameWriter(invalid_file_path)
+
+            with valid_writer, invalid_writer:
+                for chunk in iter_dataframe_chunks(file_path, self.chunk_size):
+                    if extra_columns is None:
+                        extra_columns = self.check_columns(chunk)
+
+                    valid_df, invalid_df, valid_codes, chunk_violations = self.validate_chunk(chunk)
+                    rows += len(chunk)
+
+                    if len(valid_df) or valid_writer.rows == 0:
+                        valid_writer.write(valid_df)
+                    if invalid_df is not None:
+                        invalid_writer.write(invalid_df)
+
+                    counts += np.bincount(
+                        (valid_codes + offsets).ravel(), minlength=n_columns * n_bins
+                    ).reshape(n_columns, n_bins)
+                    for check, column_counts in chunk_violations.items():
+                        violations[check] += column_counts
+
+            null_ratio = violations["null"] / max(rows, 1)
+            status = not extra_columns and bool((null_ratio <= self.max_null_ratio).all())
+
+            report = {
+                "rows": rows,
+                "valid_rows": valid_writer.rows,
+                "invalid_rows": invalid_writer.rows,
+                "extra_columns": extra_columns or [],
+                "null_ratio": {
+                    column: float(ratio) for column, ratio in zip(self.columns, null_ratio) if ratio > 0
+                },
+                "dtype_violations": {
+                    column: int(count) for column, count in zip(self.columns, violations["dtype"]) if count
+                },
+                "domain_violations": {
+                    column: int(count) for column, count in zip(self.columns, violations["domain"]) if count
+                },
+                "invalid_file_path": invalid_file_path if invalid_writer.rows else None,
+                "status": status,
+            }
+            logging.info(
+                f"Validated {file_path}: {report['valid_rows']} valid, {report['invalid_rows']} invalid rows"
+            )
+            return report, counts
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
@@ -0,0 +1,144 @@
+import sys
+import numpy as np
+import pandas as pd
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+from networksecurity.utils.drift import value_codes
+
+
+def conditional_mutual_information(x: np.ndarray, y: np.ndarray, z: np.ndarray, nx: int, ny: int, nz: int) -> float:
+    """I(X; Y | Z) in nats from integer codes in range(nx), range(ny), range(nz)."""
+    counts = np.bincount((z * nx + x) * ny + y, minlength=nz * nx * ny).reshape(nz, nx, ny)
+    p_xyz = counts / counts.sum()
+    p_z = p_xyz.sum(axis=(1, 2), keepdims=True)
+    p_xz = p_xyz.sum(axis=2, keepdims=True)
+    p_yz = p_xyz.sum(axis=1, keepdims=True)
+    nonzero = p_xyz > 0
+    ratio = (p_xyz * p_z)[nonzero] / (p_xz * p_yz)[nonzero]
+    return float((p_xyz[nonzero] * np.log(ratio)).sum())
+
+
+class SyntheticDataModel:
+    """
+    Tree-augmented naive Bayes model of a categorical table, used to generate
+    synthetic rows. The label is drawn from its marginal distribution; every
+    feature is then drawn given the label and one parent feature. The parents
+    form the maximum spanning tree of the feature pairs' mutual information given
+    the label, so the strongest pairwise dependencies are kept along with each
+    feature's label conditional.
+
+    Each conditional table is smoothed towards P(feature | label) with `smoothing`
+    pseudo-rows, so label/parent combinations that are rare in the sample do not
+    produce degenerate distributions.
+    """
+
+    def __init__(self, dtypes: dict, label_column: str, smoothing: float = 1.0):
+        self.dtypes = dict(dtypes)
+        self.label_column = label_column
+        self.smoothing = smoothing
+        self.feature_columns = [column for column in self.dtypes if column != label_column]
+        self.values = {}
+        self.label_cdf = None
+        self.order = []
+        self.parents = {}
+        self.cdfs = {}
+
+    def fit(self, dataframe: pd.DataFrame):
+        try:
+            dataframe = dataframe[list(self.dtypes)]
+            complete = dataframe.dropna()
+            if len(complete) < len(dataframe):
+                logging.info(f"Fitting the synthetic data model on {len(complete)} of {len(dataframe)} rows (no NaN)")
+            if complete.empty:
+                raise ValueError("No complete rows to fit the synthetic data model on")
+
+            codes = {}
+            for column in self.dtypes:
+                data = complete[column].to_numpy()
+                self.values[column] = np.unique(data)
+                codes[column] = value_codes(data, self.values[column])
+
+            label = codes[self.label_column]
+            n_labels = len(self.values[self.label_column])
+            label_counts = np.bincount(label, minlength=n_labels)
+            self.label_cdf = np.cumsum(label_counts / label_counts.sum())
+
+            n_values = {column: len(self.values[column]) for column in self.dtypes}
+            features = self.feature_columns
+            weights = np.zeros((len(features), len(features)))
+            for i in range(len(features)):
+                for j in range(i + 1, len(features)):
+                    weights[i, j] = weights[j, i] = conditional_mutual_information(
+                        codes[features[i]], codes[features[j]], label,
+                        n_values[features[i]], n_values[features[j]], n_labels,
+                    )
+
+            # Prim's algorithm; the insertion order puts every parent before its children
+            in_tree = np.zeros(len(features), dtype=bool)
+            best_weight = np.full(len(features), -np.inf)
+            best_parent = np.full(len(features), -1)
+            best_weight[0] = 0.0
+            self.order, self.parents = [], {}
+            for _ in range(len(features)):
+                node = int(np.argmax(np.where(in_tree, -np.inf, best_weight)))
+                in_tree[node] = True
+                self.order.append(features[node])
+                self.parents[features[node]] = features[best_parent[node]] if best_parent[node] >= 0 else None
+                closer = ~in_tree & (weights[node] > best_weight)
+                best_weight[closer] = weights[node][closer]
+                best_parent[closer] = node
+
+            for column in self.order:
+                n_column = n_values[column]
+                # P(column | label), the prior every conditional table is smoothed towards
+                given_label = np.bincount(label * n_column + codes[column], minlength=n_labels * n_column)
+                given_label = given_label.reshape(n_labels, 1, n_column) + 1e-9
+                given_label = given_label / given_label.sum(axis=2, keepdims=True)
+
+                parent = self.parents[column]
+                if parent is None:
+                    probabilities = given_label
+                else:
+                    n_parent = n_values[parent]
+                    keys = (label * n_parent + codes[parent]) * n_column + codes[column]
+                    counts = np.bincount(keys, minlength=n_labels * n_parent * n_column)
+                    counts = counts.reshape(n_labels, n_parent, n_column) + self.smoothing * given_label
+                    probabilities = counts / counts.sum(axis=2, keepdims=True)
+                self.cdfs[column] = np.cumsum(probabilities, axis=2)
+
+            logging.info(
+                "Synthetic data model fitted: "
+                + ", ".join(f"{self.parents[column]} -> {column}" for column in self.order[1:])
+            )
+            return self
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
+
+    @staticmethod
+    def _draw(cdf: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """One code per row of cdf (n, k) by inverse transform sampling."""
+        draws = (rng.random((len(cdf), 1)) >= cdf).sum(axis=1)
+        return np.minimum(draws, cdf.shape[1] - 1)
+
+    def sample(self, rows: int, random_state=None) -> pd.DataFrame:
+        """rows synthetic rows with the schema columns and dtypes; random_state seeds np.random.default_rng."""
+        try:
+            if self.label_cdf is None:
+                raise ValueError("The synthetic data model is not fitted")
+            rng = np.random.default_rng(random_state)
+
+            label = self._draw(np.broadcast_to(self.label_cdf, (rows, len(self.label_cdf))), rng)
+            codes = {}
+            for column in self.order:
+                parent = self.parents[column]
+                parent_codes = codes[parent] if parent is not None else 0
+                codes[column] = self._draw(self.cdfs[column][label, parent_codes], rng)
+            codes[self.label_column] = label
+
+            return pd.DataFrame(
+                {column: self.values[column][codes[column]].astype(dtype) for column, dtype in self.dtypes.items()}
+            )
+
+        except Exception as e:
+            raise NetworkSecurityException(e, sys.exc_info())
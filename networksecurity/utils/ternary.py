@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+# Each {-1, 0, 1} feature is stored as value + 1 in 2 bits; 3 marks a missing value
+BITS_PER_FEATURE = 2
+MISSING_CODE = 3
+MAX_PACKED_FEATURES = 64 // BITS_PER_FEATURE
+
+
+def feature_weights(n_features: int) -> np.ndarray:
+    """4 ** j per feature: codes @ weights puts feature j in bits 2j and 2j + 1."""
+    if n_features > MAX_PACKED_FEATURES:
+        raise ValueError(f"At most {MAX_PACKED_FEATURES} features fit in a uint64, got {n_features}")
+    return np.left_shift(np.int64(1), BITS_PER_FEATURE * np.arange(n_features, dtype=np.int64))
+
+
+def pack_rows(X) -> tuple:
+    """
+    Packs each row of ternary features into one uint64.
+    Returns (keys, packable): rows holding a value outside {-1, 0, 1, NaN} cannot be
+    packed; their key is 0 and packable is False.
+    """
+    X = np.asarray(X)
+    weights = feature_weights(X.shape[1])
+    if X.dtype == object:
+        try:
+            X = X.astype(np.float64)
+        except (TypeError, ValueError):
+            return np.zeros(len(X), dtype=np.uint64), np.zeros(len(X), dtype=bool)
+
+    if np.issubdtype(X.dtype, np.integer):
+        codes = X.astype(np.int64) + 1
+        valid = (codes >= 0) & (codes <= 2)
+    else:
+        missing = np.isnan(X)
+        codes = X + 1
+        if missing.any():
+            codes[missing] = MISSING_CODE
+        valid = (codes == 0) | (codes == 1) | (codes == 2) | missing
+
+    packable = valid.all(axis=1)
+    if not packable.all():
+        codes = np.where(valid, codes, 0)
+
+    # The codes occupy disjoint bits, so the weighted sum is their bitwise OR
+    # (with 32 features it wraps around int64, which the uint64 view undoes)
+    keys = (codes.astype(np.int64) @ weights).view(np.uint64)
+    keys[~packable] = 0
+    return keys, packable
+
+
+def _byte_table() -> np.ndarray:
+    """Values of the 4 features held in each possible byte; the missing code decodes to 2."""
+    byte = np.arange(256, dtype=np.uint16)[:, np.newaxis]
+    codes = (byte >> (BITS_PER_FEATURE * np.arange(4, dtype=np.uint16))) & MISSING_CODE
+    return codes.astype(np.int8) - 1
+
+
+_BYTE_TABLE = _byte_table()
+
+
+def unpack_rows(keys, n_features: int, dtype=np.float64) -> np.ndarray:
+    """
+    Inverse of pack_rows: (n, n_features) array of dtype. Missing codes become NaN,
+    which needs a float dtype.
+    """
+    feature_weights(n_features)
+    keys = np.ascontiguousarray(keys, dtype="<u8")
+    # One table lookup per byte decodes 4 features at once
+    values = _BYTE_TABLE[keys.view(np.uint8)].reshape(len(keys), MAX_PACKED_FEATURES)[:, :n_features]
+
+    missing = values == MISSING_CODE - 1
+    if not missing.any():
+        return values.astype(dtype)
+    if not np.issubdtype(np.dtype(dtype), np.floating):
+        raise ValueError("Packed rows hold missing values, unpack them to a float dtype")
+    values = values.astype(dtype)
+    values[missing] = np.nan
+    return values
+
+
+def pack_dataframe(dataframe: pd.DataFrame) -> dict:
+    """
+    Packs every column of a ternary dataframe (label included) into one uint64 per row.
+    Returns the arrays to store: rows, column names and column dtypes.
+    """
+    keys, packable = pack_rows(dataframe.to_numpy())
+    if not packable.all():
+        raise ValueError(
+            f"{int((~packable).sum())} rows hold values outside {{-1, 0, 1, NaN}} and cannot be packed"
+        )
+    return {
+        "rows": keys,
+        "columns": np.array(dataframe.columns, dtype=str),
+        "dtypes": np.array([str(dtype) for dtype in dataframe.dtypes], dtype=str),
+    }
+
+
+def unpack_dataframe(rows: np.ndarray, columns: np.ndarray, dtypes: np.ndarray) -> pd.DataFrame:
+    """Inverse of pack_dataframe; columns get back their stored dtypes."""
+    columns, dtypes = [str(column) for column in columns], [np.dtype(str(dtype)) for dtype in dtypes]
+    if all(dtype == np.int8 for dtype in dtypes):
+        return pd.DataFrame(unpack_rows(rows, len(columns), np.int8), columns=columns)
+
+    values = unpack_rows(rows, len(columns), np.float64)
+    return pd.DataFrame({column: values[:, j].astype(dtype) for j, (column, dtype) in enumerate(zip(columns, dtypes))})
+
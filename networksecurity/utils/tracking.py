@@ -0,0 +1,199 @@
+import sys
+import time
+import queue
+import atexit
+import threading
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logger.logging import logging
+
+TRACKING_BACKENDS = ("local", "dagshub", "none")
+
+# Upper bound of one MlflowClient.log_batch call (the MLflow REST API limit)
+LOG_BATCH_MAX_METRICS = 1000
+
+
+class TrackingSink:
+    """
+    Destination of experiment metrics. log_run() only records the run; backends
+    decide when it is written. Subclasses override _write_runs().
+    """
+
+    def log_run(self, run_name: str, metrics: dict, params: dict = None, tags: dict = None) -> None:
+        self._write_runs([self._make_run(run_name, metrics, params, tags)])
+
+    @staticmethod
+    def _make_run(run_name: str, metrics: dict, params: dict = None, tags: dict = None) -> dict:
+        return {
+            "run_name": run_name,
+            "timestamp_ms": int(time.time() * 1000),
+            "metrics": {key: float(value) for key, value in metrics.items() if value is not None},
+            "params": {key: str(value) for key, value in (params or {}).items() if value is not None},
+            "tags": {key: str(value) for key, value in (tags or {}).items() if value is not None},
+        }
+
+    def _write_runs(self, runs: list) -> None:
+        raise NotImplementedError
+
+    def flush(self, timeout: float = None) -> bool:
+        """Waits until every logged run is written; False if timeout expired first."""
+        return True
+
+    def close(self, timeout: float = None) -> None:
+        pass
+
+
+class NullTrackingSink(TrackingSink):
+    """Drops every run; used when tracking is disabled."""
+
+    def _write_runs(self, runs: list) -> None:
+        pass
+
+
+class MlflowTrackingSink(TrackingSink):
+    """
+    Writes runs to MLflow from a background thread, so logging never waits on the
+    tracking server. Runs queued while the thread is busy are written together,
+    with one log_batch call per run. MLflow (and DagsHub) are imported and
+    connected on the first write, not at construction; if that fails, tracking is
+    disabled with a warning and training carries on.
+    """
+
+    def __init__(
+        self,
+        tracking_uri: str = None,
+        experiment_name: str = None,
+        dagshub_repo: tuple = None,
+        exit_timeout: float = None,
+    ):
+        self.tracking_uri = tracking_uri
+        self.experiment_name = experiment_name
+        self.dagshub_repo = dagshub_repo
+        self.exit_timeout = exit_timeout
+        self._client = None
+        self._experiment_id = None
+        self._disabled = False
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def log_run(self, run_name: str, metrics: dict, params: dict = None, tags: dict = None) -> None:
+        if self._disabled:
+            return
+        self._queue.put(self._make_run(run_name, metrics, params, tags))
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, name="mlflow-tracking", daemon=True)
+                self._thread.start()
+                atexit.register(self.close, self.exit_timeout)
+
+    def _connect(self) -> None:
+        if self.dagshub_repo:
+            import dagshub
+
+            repo_owner, repo_name = self.dagshub_repo
+            dagshub.init(repo_owner=repo_owner, repo_name=repo_name, mlflow=True)
+
+        from mlflow.tracking import MlflowClient
+
+        self._client = MlflowClient(tracking_uri=self.tracking_uri)
+        if self.experiment_name:
+            experiment = self._client.get_experiment_by_name(self.experiment_name)
+            self._experiment_id = (
+                experiment.experiment_id if experiment else self._client.create_experiment(self.experiment_name)
+            )
+        else:
+            self._experiment_id = "0"
+        logging.info(f"MLflow tracking connected: {self._client.tracking_uri}")
+
+    def _write_runs(self, runs: list) -> None:
+        from mlflow.entities import Metric, Param, RunTag
+
+        for run in runs:
+            mlflow_run = self._client.create_run(self._experiment_id, run_name=run["run_name"])
+            run_id = mlflow_run.info.run_id
+            metrics = [Metric(key, value, run["timestamp_ms"], 0) for key, value in run["metrics"].items()]
+            params = [Param(key, value) for key, value in run["params"].items()]
+            tags = [RunTag(key, value) for key, value in run["tags"].items()]
+            for start in range(0, max(len(metrics), 1), LOG_BATCH_MAX_METRICS):
+                first_batch = start == 0
+                self._client.log_batch(
+                    run_id,
+                    metrics=metrics[start : start + LOG_BATCH_MAX_METRICS],
+                    params=params if first_batch else [],
+                    tags=tags if first_batch else [],
+                )
+            self._client.set_terminated(run_id)
+
+    def _worker(self) -> None:
+        while True:
+            runs = [self._queue.get()]
+            # Everything queued meanwhile goes out in the same round
+            while True:
+                try:
+                    runs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = runs[-1] is None
+            pending = [run for run in runs if run is not None]
+            try:
+                if pending and not self._disabled:
+                    if self._client is None:
+                        self._connect()
+                    self._write_runs(pending)
+            except Exception as e:
+                self._disabled = True
+                logging.warning(f"Experiment tracking disabled, {len(pending)} runs dropped: {e}")
+            finally:
+                for _ in runs:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self, timeout: float = None) -> bool:
+        if self._thread is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout: float = None) -> None:
+        """Writes the queued runs and stops the thread (runs at interpreter exit too)."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        thread.join(timeout)
+        if thread.is_alive():
+            logging.warning(f"Experiment tracking still writing after {timeout}s; remaining runs dropped")
+
+
+def get_tracking_sink(
+    backend: str,
+    tracking_uri: str = None,
+    experiment_name: str = None,
+    dagshub_repo: tuple = None,
+    exit_timeout: float = None,
+) -> TrackingSink:
+    """
+    "local": MLflow at tracking_uri (e.g. sqlite:///mlflow.db), no network.
+    "dagshub": MLflow on the DagsHub repo (repo_owner, repo_name).
+    "none": tracking disabled.
+    """
+    try:
+        if backend not in TRACKING_BACKENDS:
+            raise ValueError(f"Unknown tracking backend: {backend}")
+        if backend == "none":
+            return NullTrackingSink()
+        if backend == "dagshub":
+            return MlflowTrackingSink(
+                experiment_name=experiment_name, dagshub_repo=dagshub_repo, exit_timeout=exit_timeout
+            )
+        return MlflowTrackingSink(tracking_uri=tracking_uri, experiment_name=experiment_name, exit_timeout=exit_timeout)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys.exc_info())
@@ -1,20 +1,25 @@
 import pandas as pd
-from pymongo import MongoClient
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logger.logging import logging
+from networksecurity.configuration.mongo_db_connection import MongoDBClient
+from networksecurity.constants.constant import (
+    DATA_PUSH_CSV_CHUNK_SIZE,
+    DATA_PUSH_INSERT_BATCH_SIZE,
+    DATA_PUSH_MAX_WORKERS,
+    DATA_PUSH_MAX_IN_FLIGHT_BATCHES,
+    DATA_PUSH_ROW_HASH_FIELD,
+)
+from networksecurity.utils.columnar import iter_dataframe_chunks
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import os
 import sys
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-MONGODB_URL = os.environ.get("MONGODB_URL")
+import time
 
 
 class NetworkDataExtract:
-    def __init__(self):
+    def __init__(self, mongo_client: MongoDBClient = None):
         try:
-            self.mongo_client = MongoClient(MONGODB_URL)
+            self.mongo_client = (mongo_client or MongoDBClient()).client
             logging.info("MongoDB connection established successfully")
         except Exception as e:
             raise NetworkSecurityException(e, sys.exc_info())
@@ -41,19 +46,116 @@ class NetworkDataExtract:
 
     def insert_data_mongodb(self, records, database, collections):
         """
-        Inserts a list of JSON records into MongoDB.
+        Inserts a list of JSON records into MongoDB, with the same row hashes as
+        load_csv_to_mongodb (record position = row position), so rows that are
+        already loaded are skipped. Returns a dict with inserted/skipped/failed counts.
         """
         try:
-            db = self.mongo_client[database]
-            coll = db[collections]
-            result = coll.insert_many(records)
-            logging.info(f"Inserted {len(result.inserted_ids)} records into {database}.{collections}")
-            return result.inserted_ids
+            coll = self.mongo_client[database][collections]
+            MongoDBClient.ensure_row_hash_index(coll)
+
+            dataframe = pd.DataFrame.from_records(records)
+            totals = {"inserted": 0, "skipped": 0, "failed": 0}
+            for start in range(0, len(dataframe), DATA_PUSH_INSERT_BATCH_SIZE):
+                documents = self.hashed_documents(dataframe.iloc[start : start + DATA_PUSH_INSERT_BATCH_SIZE], start)
+                inserted, skipped, failed = MongoDBClient.run_with_retry(
+                    MongoDBClient.insert_unordered, coll, documents
+                )
+                totals["inserted"] += inserted
+                totals["skipped"] += skipped
+                totals["failed"] += failed
+
+            logging.info(f"Inserted records into {database}.{collections}: {totals}")
+            return totals
 
         except Exception as e:
             logging.error(f"Error inserting data into MongoDB: {e}")
             raise NetworkSecurityException(e, sys.exc_info())
 
+    @staticmethod
+    def hashed_documents(batch: pd.DataFrame, position: int) -> list:
+        """
+        BSON-ready dicts of the batch, each with the content hash of its row (values +
+        row position, counted from position), so a reloaded row hashes the same.
+        """
+        batch = batch.set_axis(pd.RangeIndex(position, position + len(batch)))
+        row_hashes = pd.util.hash_pandas_object(batch, index=True).to_numpy().view("int64")
+        columns = list(batch.columns) + [DATA_PUSH_ROW_HASH_FIELD]
+        # astype(object) converts numpy scalars to Python ints/floats for BSON
+        rows = batch.to_numpy(dtype=object)
+        return [
+            dict(zip(columns, (*row, row_hash)))
+            for row, row_hash in zip(rows.tolist(), row_hashes.astype(object).tolist())
+        ]
+
+    @classmethod
+    def iter_document_batches(cls, file_path, chunk_size=DATA_PUSH_CSV_CHUNK_SIZE, batch_size=DATA_PUSH_INSERT_BATCH_SIZE):
+        """
+        Streams the source file (CSV, parquet or packed npz) in chunks and yields insert
+        batches of BSON-ready dicts. Every document carries a content hash of the row
+        (values + row position), so duplicate rows in the source are kept but a
+        reloaded row is not.
+        """
+        position = 0
+        for chunk in iter_dataframe_chunks(file_path, chunk_size):
+            # Row positions in the file, so the hashes do not depend on the format
+            for start in range(0, len(chunk), batch_size):
+                yield cls.hashed_documents(chunk.iloc[start : start + batch_size], position + start)
+            position += len(chunk)
+
+    def load_csv_to_mongodb(
+        self,
+        file_path,
+        database,
+        collections,
+        max_workers=DATA_PUSH_MAX_WORKERS,
+        max_in_flight=DATA_PUSH_MAX_IN_FLIGHT_BATCHES,
+    ):
+        """
+        Idempotent, streaming bulk load of a CSV file into MongoDB.
+        Insert batches run concurrently with at most max_in_flight batches queued,
+        so memory stays bounded regardless of file size.
+        Returns a dict with inserted/skipped/failed counts.
+        """
+        try:
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"CSV file does not exist: {file_path}")
+
+            coll = self.mongo_client[database][collections]
+            MongoDBClient.ensure_row_hash_index(coll)
+
+            totals = {"inserted": 0, "skipped": 0, "failed": 0}
+            start_time = time.perf_counter()
+
+            def collect(done):
+                for future in done:
+                    inserted, skipped, failed = future.result()
+                    totals["inserted"] += inserted
+                    totals["skipped"] += skipped
+                    totals["failed"] += failed
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                in_flight = set()
+                for documents in self.iter_document_batches(file_path):
+                    if len(in_flight) >= max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    in_flight.add(executor.submit(MongoDBClient.insert_unordered, coll, documents))
+
+                collect(wait(in_flight).done)
+
+            elapsed = time.perf_counter() - start_time
+            rows = sum(totals.values())
+            logging.info(
+                f"Loaded {file_path} into {database}.{collections}: {totals} "
+                f"in {elapsed:.2f}s ({rows / max(elapsed, 1e-9):,.0f} rows/sec)"
+            )
+            return totals
+
+        except Exception as e:
+            logging.error(f"Error loading CSV into MongoDB: {e}")
+            raise NetworkSecurityException(e, sys.exc_info())
+
     def read_data_mongodb(self, database, collections, query={}):
         """
         Reads data from MongoDB collection.
@@ -63,7 +165,7 @@ class NetworkDataExtract:
         try:
             db = self.mongo_client[database]
             coll = db[collections]
-            data = list(coll.find(query, {"_id": 0}))
+            data = list(coll.find(query, {"_id": 0, DATA_PUSH_ROW_HASH_FIELD: 0}))
             logging.info(f"Read {len(data)} records from {database}.{collections}")
             return data
         except Exception as e:
@@ -78,12 +180,9 @@ if __name__ == "__main__":
         # CSV file relative path
         csv_file = "data/phisingData.csv"
 
-        # Convert CSV to JSON
-        records = extractor.csv_to_json(csv_file)
-
-        # Insert data into MongoDB
-        inserted_ids = extractor.insert_data_mongodb(records, "networksecuritydata", "data")
-        logging.info(f"Inserted IDs: {inserted_ids[:5]} ...")  # Show first 5 IDs
+        # Stream CSV into MongoDB (safe to rerun, already loaded rows are skipped)
+        load_summary = extractor.load_csv_to_mongodb(csv_file, "networksecuritydata", "data")
+        logging.info(f"Load summary: {load_summary}")
 
         # Read data from MongoDB
         data_from_db = extractor.read_data_mongodb("networksecuritydata", "data")
@@ -0,0 +1,67 @@
+import io
+import os
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sklearn.tree import DecisionTreeClassifier
+
+from app import FEATURE_COLUMNS, create_app
+from networksecurity.constants.constant import MODEL_FILE_NAME, PREDICTION_COLUMN_NAME, PREPROCESSING_OBJECT_FILE_NAME
+from networksecurity.utils.common import save_object
+from networksecurity.utils.model.imputer import TernaryImputer
+from networksecurity.utils.ternary import pack_rows
+
+
+@pytest.fixture(scope="module")
+def model_dir(tmp_path_factory):
+    rng = np.random.default_rng(0)
+    X = rng.integers(-1, 2, size=(500, len(FEATURE_COLUMNS))).astype(np.float64)
+    y = (X[:, 0] + X[:, 1] > 0).astype(np.int64)
+    preprocessor = TernaryImputer(strategy="mode").fit(X)
+    model = DecisionTreeClassifier(random_state=0).fit(X, y)
+
+    model_dir = str(tmp_path_factory.mktemp("final_model"))
+    save_object(os.path.join(model_dir, PREPROCESSING_OBJECT_FILE_NAME), preprocessor)
+    save_object(os.path.join(model_dir, MODEL_FILE_NAME), model)
+    return model_dir
+
+
+@pytest.fixture(params=[0, 1000], ids=["no_cache", "cache"])
+def client(request, model_dir):
+    with TestClient(create_app(model_dir=model_dir, cache_size=request.param)) as client:
+        yield client
+
+
+def test_empty_requests_return_empty_predictions(client):
+    header_only_csv = ",".join(FEATURE_COLUMNS) + "\n"
+
+    batch = client.post("/predict/batch", json=[])
+    upload = client.post("/predict/file", files={"file": ("empty.csv", header_only_csv.encode())})
+    packed = client.post("/predict/packed", content=b"")
+
+    assert batch.status_code == 200 and batch.json() == {PREDICTION_COLUMN_NAME: []}
+    assert upload.status_code == 200 and upload.json() == []
+    assert packed.status_code == 200 and packed.content == b""
+
+
+def test_endpoints_agree_on_the_same_rows(client):
+    rng = np.random.default_rng(1)
+    X = rng.integers(-1, 2, size=(20, len(FEATURE_COLUMNS))).astype(np.float64)
+    X[::4, 2] = np.nan
+    records = [
+        {column: None if np.isnan(value) else int(value) for column, value in zip(FEATURE_COLUMNS, row)} for row in X
+    ]
+    csv = io.StringIO()
+    csv.write(",".join(FEATURE_COLUMNS) + "\n")
+    for row in X:
+        csv.write(",".join("" if np.isnan(value) else str(int(value)) for value in row) + "\n")
+
+    batch = client.post("/predict/batch", json=records).json()[PREDICTION_COLUMN_NAME]
+    upload = client.post("/predict/file", files={"file": ("rows.csv", csv.getvalue())}).json()
+    upload = [row[PREDICTION_COLUMN_NAME] for row in upload]
+    packed = client.post("/predict/packed", content=pack_rows(X)[0].astype("<u8").tobytes()).content
+    single = client.post("/predict", json=records[0]).json()[PREDICTION_COLUMN_NAME]
+
+    assert batch == upload == np.frombuffer(packed, dtype=np.int8).tolist()
+    assert single == batch[0]
@@ -0,0 +1,83 @@
+import pickle
+
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.impute import KNNImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+
+from networksecurity.utils.bundle import is_bundle, load_bundle, save_bundle
+
+
+@pytest.fixture(scope="module")
+def ternary_data():
+    rng = np.random.default_rng(0)
+    X = rng.integers(-1, 2, size=(2000, 30)).astype(np.float64)
+    y = (X[:, 0] + X[:, 1] - X[:, 2] > 0).astype(np.int64)
+    return X, y
+
+
+ESTIMATORS = {
+    "random_forest": lambda: RandomForestClassifier(n_estimators=16, random_state=0),
+    "gradient_boosting": lambda: GradientBoostingClassifier(n_estimators=16, random_state=0),
+    "logistic_regression": lambda: LogisticRegression(),
+    "knn_imputer_pipeline": lambda: Pipeline(
+        [("imputer", KNNImputer(n_neighbors=3)), ("model", RandomForestClassifier(n_estimators=8, random_state=0))]
+    ),
+}
+
+
+@pytest.mark.parametrize("name", ESTIMATORS)
+@pytest.mark.parametrize("mmap", [True, False])
+def test_round_trip_predicts_like_the_original(tmp_path, ternary_data, name, mmap):
+    X, y = ternary_data
+    model = ESTIMATORS[name]().fit(X, y)
+    file_path = str(tmp_path / "model.bundle")
+
+    save_bundle(file_path, model)
+    loaded = load_bundle(file_path, mmap=mmap)
+
+    assert is_bundle(file_path)
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+    np.testing.assert_array_equal(loaded.predict_proba(X), model.predict_proba(X))
+
+
+def test_mmap_load_predicts_from_read_only_views(tmp_path, ternary_data):
+    X, y = ternary_data
+    model = Pipeline(
+        [("imputer", KNNImputer(n_neighbors=3)), ("model", RandomForestClassifier(n_estimators=8, random_state=0))]
+    ).fit(X, y)
+    file_path = str(tmp_path / "model.bundle")
+    save_bundle(file_path, model)
+
+    loaded = load_bundle(file_path, mmap=True)
+
+    # The imputer's training rows are large enough to leave the pickle, so they come
+    # back as a read-only view of the mapped file
+    fit_X = loaded.named_steps["imputer"]._fit_X
+    assert not fit_X.flags.writeable
+    with pytest.raises(ValueError):
+        fit_X[0, 0] = 0
+
+    X_missing = X[:50].copy()
+    X_missing[::3, 4] = np.nan
+    np.testing.assert_array_equal(loaded.predict(X_missing), model.predict(X_missing))
+
+
+def test_small_objects_stay_in_the_pickle(tmp_path):
+    file_path = str(tmp_path / "small.bundle")
+    obj = {"weights": np.arange(10, dtype=np.float64), "name": "small"}
+
+    save_bundle(file_path, obj)
+    loaded = load_bundle(file_path)
+
+    np.testing.assert_array_equal(loaded["weights"], obj["weights"])
+    assert loaded["name"] == "small"
+
+
+def test_plain_pickle_is_not_a_bundle(tmp_path):
+    file_path = tmp_path / "model.pkl"
+    file_path.write_bytes(pickle.dumps(LogisticRegression()))
+
+    assert not is_bundle(str(file_path))
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import AdaBoostClassifier, GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+import networksecurity.utils.model.compiled as compiled_module
+from networksecurity.utils.model.compiled import (
+    COMPILED_MODEL_KINDS,
+    compile_model,
+    load_compiled_model,
+    save_compiled_model,
+)
+
+# One or more estimators per compiled kind; the bool says whether it is fit and
+# scored with missing values (sklearn only accepts NaN in single trees and forests)
+ESTIMATORS = {
+    "tree": [(lambda: DecisionTreeClassifier(random_state=0), True)],
+    "forest": [(lambda: RandomForestClassifier(n_estimators=20, random_state=0), True)],
+    "gradient_boosting": [(lambda: GradientBoostingClassifier(n_estimators=20, random_state=0), False)],
+    "adaboost": [(lambda: AdaBoostClassifier(n_estimators=20, random_state=0), False)],
+    "logistic": [
+        (lambda: LogisticRegression(max_iter=500), False),
+        (lambda: SGDClassifier(random_state=0), False),
+    ],
+}
+CASES = [
+    pytest.param(kind, make, missing, id=f"{kind}-{index}")
+    for kind, estimators in ESTIMATORS.items()
+    for index, (make, missing) in enumerate(estimators)
+]
+
+
+def ternary_data(n_rows: int, n_classes: int, missing_rate: float, seed: int):
+    rng = np.random.default_rng(seed)
+    X = rng.integers(-1, 2, size=(n_rows, 12)).astype(np.float64)
+    y = (X[:, 0] + X[:, 1] - X[:, 2] + rng.normal(0, 0.5, n_rows) > 0).astype(np.int64)
+    if n_classes == 3:
+        y[X[:, 3] == 1] = 2
+    X[rng.random(X.shape) < missing_rate] = np.nan
+    return X, y
+
+
+def fractional_rows(model, n_rows: int, seed: int) -> np.ndarray:
+    """Uniform values in [-1.5, 1.5], plus rows sitting exactly on and next to the split thresholds."""
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(-1.5, 1.5, size=(n_rows, model.n_features_in_))
+    trees = getattr(model, "estimators_", [model] if hasattr(model, "tree_") else [])
+    thresholds = np.concatenate([tree.tree_.threshold[tree.tree_.feature >= 0] for tree in np.ravel(trees)] or [[]])
+    # Splits that only separate missing values have an infinite threshold
+    thresholds = thresholds[np.isfinite(thresholds)]
+    if len(thresholds):
+        edges = np.concatenate([thresholds, np.nextafter(thresholds, np.inf), np.nextafter(thresholds, -np.inf)])
+        X[: len(X) // 2] = rng.choice(edges, size=(len(X) // 2, X.shape[1]))
+    return X
+
+
+def test_every_kind_is_covered():
+    assert set(ESTIMATORS) == set(COMPILED_MODEL_KINDS)
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+@pytest.mark.parametrize("kind, make, missing", CASES)
+def test_predicts_like_the_estimator(kind, make, missing, n_classes):
+    X, y = ternary_data(1500, n_classes, missing_rate=0.1 if missing else 0.0, seed=0)
+    model = make().fit(X, y)
+
+    compiled = compile_model(model)
+
+    assert compiled.kind == kind
+    X_test, _ = ternary_data(1000, n_classes, missing_rate=0.2 if missing else 0.0, seed=1)
+    X_fractional = fractional_rows(model, 1000, seed=2)
+    if missing:
+        X_fractional[::5, 1] = np.nan
+    for X_check in (X_test, X_fractional):
+        np.testing.assert_array_equal(compiled.predict(X_check), model.predict(X_check))
+
+
+@pytest.mark.parametrize("kind, make, missing", CASES)
+def test_bundle_round_trip(tmp_path, kind, make, missing):
+    X, y = ternary_data(1500, 2, missing_rate=0.1 if missing else 0.0, seed=3)
+    model = make().fit(X, y)
+    file_path = str(tmp_path / "compiled_model.bundle")
+
+    save_compiled_model(file_path, compile_model(model))
+    loaded = load_compiled_model(file_path)
+
+    assert loaded.kind == kind
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+    X_fractional = fractional_rows(model, 500, seed=4)
+    np.testing.assert_array_equal(loaded.predict(X_fractional), model.predict(X_fractional))
+
+
+def test_large_inputs_are_scored_in_blocks(monkeypatch):
+    monkeypatch.setattr(compiled_module, "COMPILED_PREDICT_BLOCK_SIZE", 64)
+    X, y = ternary_data(1000, 2, missing_rate=0.1, seed=5)
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y)
+
+    np.testing.assert_array_equal(compile_model(model).predict(X), model.predict(X))
+
+
+def test_unsupported_estimators_are_rejected():
+    X, y = ternary_data(100, 2, missing_rate=0.0, seed=6)
+
+    with pytest.raises(ValueError):
+        compile_model(KNeighborsClassifier().fit(X, y))
+    with pytest.raises(ValueError):
+        compile_model(GradientBoostingClassifier(n_estimators=5, init=LogisticRegression()).fit(X, y))
@@ -0,0 +1,118 @@
+import pickle
+import warnings
+
+import numpy as np
+import pytest
+from sklearn.impute import KNNImputer
+
+import networksecurity.utils.model.imputer as imputer_module
+from networksecurity.utils.model.imputer import TernaryImputer
+
+
+def ternary_rows(n_rows: int, n_features: int, missing_rate: float = 0.0, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    X = rng.integers(-1, 2, size=(n_rows, n_features)).astype(np.float64)
+    X[rng.random(X.shape) < missing_rate] = np.nan
+    return X
+
+
+def unambiguous_rows(X_train: np.ndarray, X: np.ndarray, n_neighbors: int) -> np.ndarray:
+    """Rows with missing values whose n_neighbors nearest training rows are one set (no tie at the boundary)."""
+    observed = ~np.isnan(X)
+    values = np.where(observed, X, 0.0)
+    distances = (
+        (values**2).sum(axis=1, keepdims=True) - 2.0 * values @ X_train.T + observed.astype(np.float64) @ (X_train**2).T
+    )
+    distances = np.sort(distances, axis=1)
+    return np.flatnonzero((~observed).any(axis=1) & (distances[:, n_neighbors - 1] < distances[:, n_neighbors]))
+
+
+@pytest.fixture(params=["brute_force", "tree", "small_blocks"])
+def search_path(request, monkeypatch):
+    if request.param == "tree":
+        monkeypatch.setattr(imputer_module, "KNN_TREE_MIN_PATTERNS", 0)
+        monkeypatch.setattr(imputer_module, "KNN_TREE_MIN_ROWS", 0)
+    elif request.param == "small_blocks":
+        # One query row per block
+        monkeypatch.setattr(imputer_module, "KNN_MEMORY_BYTES", 1)
+    return request.param
+
+
+def test_knn_matches_sklearn_knn_imputer(search_path):
+    X_train = ternary_rows(300, 20, seed=1)
+    X = ternary_rows(200, 20, missing_rate=0.15, seed=2)
+    rows = unambiguous_rows(X_train, X, n_neighbors=3)
+    assert len(rows) > 50
+
+    expected = KNNImputer(n_neighbors=3).fit(X_train).transform(X)
+    imputed = TernaryImputer(strategy="knn", n_neighbors=3).fit(X_train).transform(X)
+
+    np.testing.assert_allclose(imputed[rows], expected[rows])
+    assert not np.isnan(imputed).any()
+
+
+def test_duplicate_training_rows_count_as_neighbors(search_path):
+    # Two copies of one row and one of another: the nearest three rows are all three
+    X_train = np.array([[1, 1, 1], [1, 1, 1], [-1, -1, -1], [0, 0, 0]], dtype=np.float64)
+    X = np.array([[1, 1, np.nan]])
+
+    imputed = TernaryImputer(strategy="knn", n_neighbors=3).fit(X_train).transform(X)
+    expected = KNNImputer(n_neighbors=3).fit(X_train).transform(X)
+
+    np.testing.assert_allclose(imputed, expected)
+
+
+def test_clean_batch_is_returned_without_search():
+    X_train = ternary_rows(50, 5, seed=3)
+    X = ternary_rows(20, 5, seed=4)
+
+    imputed = TernaryImputer(strategy="knn").fit(X_train).transform(X)
+
+    np.testing.assert_array_equal(imputed, X)
+
+
+def test_no_complete_training_row_falls_back_to_modes():
+    X = np.array([[1, np.nan], [np.nan, 0], [0, np.nan]])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        imputer = TernaryImputer(strategy="knn").fit(X)
+        imputed = imputer.transform(X)
+
+    assert not np.isnan(imputed).any()
+    np.testing.assert_array_equal(imputed[~np.isnan(X)], X[~np.isnan(X)])
+    np.testing.assert_array_equal(imputed[np.isnan(X)], imputer.modes_[np.nonzero(np.isnan(X))[1]])
+
+
+def test_row_without_observed_values_takes_the_modes():
+    X_train = np.array([[1, 0], [1, -1], [0, -1]], dtype=np.float64)
+
+    imputed = TernaryImputer(strategy="knn").fit(X_train).transform(np.array([[np.nan, np.nan]]))
+
+    np.testing.assert_array_equal(imputed, [[1, -1]])
+
+
+def test_search_trees_are_not_pickled(monkeypatch):
+    monkeypatch.setattr(imputer_module, "KNN_TREE_MIN_PATTERNS", 0)
+    monkeypatch.setattr(imputer_module, "KNN_TREE_MIN_ROWS", 0)
+    X_train = ternary_rows(500, 10, seed=5)
+    imputer = TernaryImputer(strategy="knn").fit(X_train)
+    size = len(pickle.dumps(imputer))
+
+    X = ternary_rows(100, 10, missing_rate=0.1, seed=6)
+    imputed = imputer.transform(X)
+
+    assert imputer._trees
+    assert len(pickle.dumps(imputer)) == size
+    np.testing.assert_array_equal(pickle.loads(pickle.dumps(imputer)).transform(X), imputed)
+
+
+@pytest.mark.parametrize("strategy", ["mode", "conditional_mode"])
+def test_cheap_strategies_fill_every_missing_cell(strategy):
+    X_train = ternary_rows(200, 8, missing_rate=0.05, seed=7)
+    X = ternary_rows(50, 8, missing_rate=0.2, seed=8)
+
+    imputed = TernaryImputer(strategy=strategy).fit(X_train).transform(X)
+
+    assert not np.isnan(imputed).any()
+    assert np.isin(imputed, [-1, 0, 1]).all()
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from networksecurity.utils.model.prediction_cache import EVICTION_FRACTION, CachedNetworkModel, PredictionCache
+from networksecurity.utils.ternary import pack_rows
+
+
+class DictCache:
+    """Reference model of PredictionCache: a dict of key -> [value, last_used, use_count]."""
+
+    def __init__(self, max_size: int, policy: str):
+        self.max_size = max_size
+        self.policy = policy
+        self.entries = {}
+        self.clock = 0
+
+    def rank(self, key):
+        _, last_used, use_count = self.entries[key]
+        return last_used if self.policy == "lru" else (use_count, last_used)
+
+    def lookup(self, key):
+        self.clock += 1
+        if key not in self.entries:
+            return None
+        self.entries[key][1] = self.clock
+        self.entries[key][2] += 1
+        return self.entries[key][0]
+
+    def insert(self, key, value):
+        overflow = len(self.entries) + 1 - self.max_size
+        if overflow > 0:
+            count = min(len(self.entries), overflow + int(self.max_size * EVICTION_FRACTION))
+            for evicted in sorted(self.entries, key=self.rank)[:count]:
+                del self.entries[evicted]
+        self.entries[key] = [value, self.clock, 1]
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_matches_dict_model_one_key_at_a_time(policy):
+    rng = np.random.default_rng(1)
+    max_size = 50
+    cache, reference = PredictionCache(max_size, policy), DictCache(max_size, policy)
+
+    # Skewed key stream, so some keys are hot and eviction order matters
+    stream = rng.zipf(1.3, size=5000).astype(np.uint64) * np.uint64(0x9E3779B1)
+    for key in stream:
+        keys = np.array([key], dtype=np.uint64)
+        values, hit = cache.lookup(keys)
+        expected = reference.lookup(int(key))
+
+        assert bool(hit[0]) == (expected is not None)
+        if hit[0]:
+            assert values[0] == expected
+        else:
+            value = np.int8(key % np.uint64(2))
+            cache.insert(keys, np.array([value]))
+            reference.insert(int(key), value)
+
+        assert cache.size <= max_size
+        assert cache.size == len(reference.entries) == int(cache.occupied.sum())
+
+    cached_keys = set(cache.keys[cache.occupied].tolist())
+    assert cached_keys == set(reference.entries)
+    assert cache.evictions > 0
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_batches_never_exceed_max_size(policy):
+    rng = np.random.default_rng(2)
+    max_size = 200
+    cache = PredictionCache(max_size, policy)
+    inserted = {}
+
+    for _ in range(300):
+        keys = np.unique(rng.integers(1, 2000, size=rng.integers(1, 150)).astype(np.uint64))
+        values, hit = cache.lookup(keys)
+        for key, value in zip(keys[hit], values[hit] if values is not None else []):
+            assert inserted[int(key)] == value
+
+        missed = keys[~hit]
+        fresh = (missed % np.uint64(3)).astype(np.int8)
+        cache.insert(missed, fresh)
+        inserted.update(zip(missed.tolist(), fresh.tolist()))
+
+        assert cache.size <= max_size
+        assert cache.size == int(cache.occupied.sum())
+        # Inserts evict before placing, so the keys just inserted are all cached; under
+        # lru the keys just hit are the most recent ones and survive too (lfu may drop them)
+        expected_cached = keys if policy == "lru" else missed
+        _, found = cache.lookup(expected_cached)
+        assert found.all()
+
+
+def test_new_model_version_clears_the_cache():
+    cache = PredictionCache(10, "lru", model_version="a")
+    keys = np.arange(1, 6, dtype=np.uint64)
+    cache.insert(keys, np.ones(5, dtype=np.int8))
+
+    cache.ensure_version("b")
+
+    _, hit = cache.lookup(keys)
+    assert not hit.any()
+    assert cache.size == 0
+    assert cache.invalidations == 1
+
+
+class CountingModel:
+    def __init__(self):
+        self.rows_scored = 0
+
+    def predict(self, x):
+        self.rows_scored += len(x)
+        return (np.nan_to_num(np.asarray(x, dtype=np.float64)).sum(axis=1) > 0).astype(np.int8)
+
+
+def test_cached_model_predicts_like_the_model():
+    rng = np.random.default_rng(3)
+    X = rng.integers(-1, 2, size=(500, 30)).astype(np.float64)
+    X[::7, 3] = np.nan
+    X[5, 0] = 0.5  # does not pack, always goes to the model
+    model = CountingModel()
+    cached_model = CachedNetworkModel(model, PredictionCache(1000, "lfu"), model_version="v1")
+
+    np.testing.assert_array_equal(cached_model.predict(X), CountingModel().predict(X))
+    rows_scored = model.rows_scored
+    np.testing.assert_array_equal(cached_model.predict(X), CountingModel().predict(X))
+
+    _, packable = pack_rows(X)
+    assert model.rows_scored - rows_scored == int((~packable).sum())
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from networksecurity.utils.schema_validator import VALIDATION_ERRORS_COLUMN, SchemaValidator
+
+SCHEMA = {
+    "columns": [{"a": "int8"}, {"b": "int8"}, {"Result": "int8"}],
+    "value_domain": [-1, 0, 1],
+    "max_null_ratio": 0.2,
+}
+
+
+def validate(tmp_path, dataframe, schema=SCHEMA, chunk_size=2, file_name="data.csv"):
+    file_path = str(tmp_path / file_name)
+    if file_name.endswith(".csv"):
+        dataframe.to_csv(file_path, index=False)
+    else:
+        dataframe.to_parquet(file_path, index=False)
+    valid_file_path, invalid_file_path = str(tmp_path / "valid.parquet"), str(tmp_path / "invalid.parquet")
+
+    validator = SchemaValidator(schema, chunk_size, target_column="Result")
+    report, counts = validator.validate_file(file_path, valid_file_path, invalid_file_path)
+    valid = pd.read_parquet(valid_file_path)
+    invalid = pd.read_parquet(invalid_file_path) if report["invalid_file_path"] else None
+    return report, counts, valid, invalid
+
+
+def test_null_features_stay_valid_and_only_count_toward_the_null_ratio(tmp_path):
+    dataframe = pd.DataFrame(
+        {
+            "a": [1, None, 0, -1, 1],
+            "b": [0, 1, None, 1, -1],
+            "Result": [1, -1, 1, -1, 1],
+        }
+    )
+
+    report, _, valid, invalid = validate(tmp_path, dataframe)
+
+    assert invalid is None
+    assert report["valid_rows"] == 5 and report["invalid_rows"] == 0
+    assert report["null_ratio"] == {"a": 0.2, "b": 0.2}
+    assert report["status"]
+    assert (valid.dtypes == np.float32).all()
+    pd.testing.assert_frame_equal(valid, dataframe.astype(np.float32))
+
+
+def test_dtype_domain_and_null_target_violations_are_routed(tmp_path):
+    dataframe = pd.DataFrame(
+        {
+            "a": ["1", "abc", "0", "2", "0.5", "1"],
+            "b": ["0", "1", "-1", "1", "1", None],
+            "Result": ["1", "1", None, "-1", "1", "-1"],
+        }
+    )
+
+    report, _, valid, invalid = validate(tmp_path, dataframe)
+
+    assert report["rows"] == 6
+    assert report["valid_rows"] == 2 and report["invalid_rows"] == 4
+    assert report["dtype_violations"] == {"a": 2}
+    assert report["domain_violations"] == {"a": 1}
+    assert report["invalid_file_path"] is not None
+    assert list(invalid[VALIDATION_ERRORS_COLUMN]) == ["dtype:a", "null:Result", "domain:a", "dtype:a"]
+
+    np.testing.assert_array_equal(valid.to_numpy(), [[1, 0, 1], [1, np.nan, -1]])
+
+
+def test_null_ratio_above_the_limit_fails_the_file(tmp_path):
+    dataframe = pd.DataFrame({"a": [None, None, 1, 0], "b": [0, 1, 1, 0], "Result": [1, 1, -1, -1]})
+
+    report, _, valid, _ = validate(tmp_path, dataframe)
+
+    assert report["null_ratio"] == {"a": 0.5}
+    assert not report["status"]
+    assert report["valid_rows"] == 4 and np.isnan(valid["a"]).sum() == 2
+
+
+def test_missing_column_fails_and_extra_column_is_reported(tmp_path):
+    with pytest.raises(Exception, match="missing schema columns"):
+        validate(tmp_path, pd.DataFrame({"a": [1], "Result": [1]}))
+
+    report, _, valid, _ = validate(tmp_path, pd.DataFrame({"a": [1], "b": [0], "Result": [1], "c": [5]}))
+
+    assert report["extra_columns"] == ["c"]
+    assert not report["status"]
+    assert list(valid.columns) == ["a", "b", "Result"]
+
+
+def test_typed_parquet_input_and_histograms(tmp_path):
+    dataframe = pd.DataFrame({"a": [1, 0, 0, -1, 1], "b": [1, 1, 1, 1, -1], "Result": [1, -1, 1, -1, 1]}).astype(
+        np.int8
+    )
+    dataframe.loc[3, "b"] = 3
+
+    report, counts, valid, invalid = validate(tmp_path, dataframe, file_name="data.parquet")
+
+    assert report["valid_rows"] == 4 and report["domain_violations"] == {"b": 1}
+    assert list(invalid[VALIDATION_ERRORS_COLUMN]) == ["domain:b"]
+    # Histograms of the valid rows over the values -1, 0, 1 and the "other" bin
+    np.testing.assert_array_equal(counts, [[0, 2, 2, 0], [1, 0, 3, 0], [1, 0, 3, 0]])
+    np.testing.assert_array_equal(valid.to_numpy(), dataframe.drop(index=3).to_numpy())
@@ -0,0 +1,76 @@
+import ast
+import importlib
+
+import pytest
+
+from networksecurity.pipeline.training_pipeline import (
+    STAGE_CODE_MODULES,
+    STAGE_DATA_TRANSFORMATION,
+    STAGE_DATA_VALIDATION,
+    STAGE_MODEL_TRAINER,
+)
+
+PACKAGE = "networksecurity"
+
+# Modules that log or time a stage but cannot change what it writes
+UNFINGERPRINTED_MODULES = {
+    "networksecurity.exception.exception",
+    "networksecurity.logger.logging",
+    "networksecurity.utils.profiling",
+    "networksecurity.utils.tracking",
+}
+
+STAGE_COMPONENTS = {
+    STAGE_DATA_VALIDATION: "networksecurity.components.data_validation",
+    STAGE_DATA_TRANSFORMATION: "networksecurity.components.data_transformation",
+    STAGE_MODEL_TRAINER: "networksecurity.components.model_trainer",
+}
+
+
+def imported_modules(module_name: str) -> set:
+    """networksecurity modules named by the import statements of one module, at any depth in its source."""
+    module = importlib.import_module(module_name)
+    with open(module.__file__) as file_obj:
+        tree = ast.parse(file_obj.read())
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module)
+            # "from networksecurity.utils import drift" imports a submodule, not a name
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+
+    modules = set()
+    for name in names:
+        if not name.startswith(PACKAGE + "."):
+            continue
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        # Package __init__ files are empty and hold no stage logic
+        if not module.__file__.endswith("__init__.py"):
+            modules.add(name)
+    return modules
+
+
+def import_closure(module_name: str) -> set:
+    closure, pending = set(), [module_name]
+    while pending:
+        name = pending.pop()
+        if name in closure:
+            continue
+        closure.add(name)
+        pending.extend(imported_modules(name) - closure)
+    return closure
+
+
+@pytest.mark.parametrize("stage_name", STAGE_COMPONENTS)
+def test_stage_fingerprints_every_module_it_imports(stage_name):
+    fingerprinted = {module.__name__ for module in STAGE_CODE_MODULES[stage_name]}
+
+    missing = import_closure(STAGE_COMPONENTS[stage_name]) - UNFINGERPRINTED_MODULES - fingerprinted
+
+    assert not missing, f"{stage_name} imports modules its cache key does not cover: {sorted(missing)}"
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from networksecurity.utils.ternary import MAX_PACKED_FEATURES, pack_dataframe, pack_rows, unpack_dataframe, unpack_rows
+
+
+def ternary_rows(n_rows: int, n_features: int, missing_rate: float = 0.0, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    X = rng.integers(-1, 2, size=(n_rows, n_features)).astype(np.float64)
+    X[rng.random(X.shape) < missing_rate] = np.nan
+    return X
+
+
+@pytest.mark.parametrize("n_features", [1, 5, 30, MAX_PACKED_FEATURES])
+def test_round_trip_with_missing_values(n_features):
+    X = ternary_rows(1000, n_features, missing_rate=0.1)
+    # The all-missing row sets every bit of a 32 feature key
+    X[0] = np.nan
+
+    keys, packable = pack_rows(X)
+
+    assert keys.dtype == np.uint64
+    assert packable.all()
+    np.testing.assert_array_equal(unpack_rows(keys, n_features), X)
+
+
+def test_32_features_use_the_top_bits():
+    X = np.zeros((3, MAX_PACKED_FEATURES))
+    X[1, -1] = 1
+    X[2, -1] = np.nan
+
+    keys, _ = pack_rows(X)
+
+    assert keys[1] - keys[0] == np.uint64(1) << np.uint64(62)
+    assert keys[2] >> np.uint64(62) == 3
+    np.testing.assert_array_equal(unpack_rows(keys, MAX_PACKED_FEATURES), X)
+
+
+def test_integer_rows_round_trip_to_integers():
+    X = ternary_rows(200, 30).astype(np.int8)
+
+    keys, packable = pack_rows(X)
+
+    assert packable.all()
+    np.testing.assert_array_equal(unpack_rows(keys, 30, np.int8), X)
+
+
+def test_distinct_rows_get_distinct_keys():
+    # drop_duplicates, unlike np.unique, treats NaN as equal to NaN
+    X = pd.DataFrame(ternary_rows(5000, 8, missing_rate=0.2)).drop_duplicates().to_numpy()
+
+    keys, _ = pack_rows(X)
+
+    assert len(np.unique(keys)) == len(X)
+
+
+def test_values_outside_ternary_do_not_pack():
+    X = ternary_rows(4, 30)
+    X[1, 2] = 0.5
+    X[3, 0] = 2
+
+    keys, packable = pack_rows(X)
+
+    np.testing.assert_array_equal(packable, [True, False, True, False])
+    assert keys[1] == 0 and keys[3] == 0
+
+
+def test_missing_values_need_a_float_dtype():
+    keys, _ = pack_rows(np.array([[np.nan, 1.0]]))
+
+    with pytest.raises(ValueError):
+        unpack_rows(keys, 2, np.int8)
+
+
+def test_no_rows_unpack_to_an_empty_matrix():
+    assert unpack_rows(np.empty(0, dtype=np.uint64), 30).shape == (0, 30)
+
+
+def test_too_many_features_are_rejected():
+    with pytest.raises(ValueError):
+        pack_rows(np.zeros((2, MAX_PACKED_FEATURES + 1)))
+
+
+def test_dataframe_round_trip_keeps_dtypes():
+    dataframe = pd.DataFrame(ternary_rows(100, 31).astype(np.int64), columns=[f"f{j}" for j in range(31)])
+    dataframe["f3"] = dataframe["f3"].astype(np.float64)
+    dataframe.loc[::5, "f3"] = np.nan
+
+    restored = unpack_dataframe(**pack_dataframe(dataframe))
+
+    pd.testing.assert_frame_equal(restored, dataframe)